@@ -0,0 +1,64 @@
+"""Operations/sec of Coins on large multi-denom balances, such as those of exchange or
+IBC-heavy accounts.
+
+Every case checks its result once before timing, so that the numbers of two revisions
+are only compared when they compute the same thing.
+
+    $ python benchmarks/coins.py [seconds per case]
+"""
+
+import sys
+import timeit
+
+from cosmos_sdk.core import Coin, Coins
+from cosmos_sdk.core.bank import MsgSend
+
+SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+
+BALANCE = Coins({f"ibc/{i:064X}": 1000000 + i for i in range(200)})
+INCOME = Coins({f"ibc/{i:064X}": i for i in range(0, 200, 4)})
+FEE = Coins(uluna=2000)
+GAS_PRICES = Coins({f"ibc/{i:064X}": "0.15" for i in range(200)})
+SENDER = "terra1x46rqay4d3cssq8gxxvqz8xt6nwlz4td20k38v"
+
+CASES = [
+    ("copy", lambda: Coins(BALANCE), BALANCE),
+    (
+        "add",
+        lambda: BALANCE + INCOME,
+        Coins({f"ibc/{i:064X}": 1000000 + i + (i % 4 == 0) * i for i in range(200)}),
+    ),
+    ("sub fee", lambda: BALANCE - FEE, Coins([*BALANCE, Coin("uluna", -2000)])),
+    (
+        "add coin",
+        lambda: BALANCE + Coin("uluna", 1),
+        Coins([*BALANCE, Coin("uluna", 1)]),
+    ),
+    (
+        "mul gas",
+        lambda: GAS_PRICES.mul(200000).to_int_ceil_coins(),
+        Coins({f"ibc/{i:064X}": 30000 for i in range(200)}),
+    ),
+    ("equal", lambda: BALANCE == Coins(BALANCE), True),
+    ("iterate", lambda: sum(coin.amount for coin in BALANCE), 200019900),
+    (
+        "MsgSend",
+        lambda: MsgSend(SENDER, SENDER, BALANCE).amount,
+        BALANCE,
+    ),
+]
+
+
+def run(name, case, expected):
+    result = case()
+    assert result == expected, name
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+    number = max(1, int(number * SECONDS / 0.2))
+    best = min(timer.repeat(repeat=3, number=number)) / number
+    print(f"{name:<24} {1 / best:>12,.0f} ops/sec")
+
+
+if __name__ == "__main__":
+    for case in CASES:
+        run(*case)
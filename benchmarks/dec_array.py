@@ -0,0 +1,61 @@
+"""Seconds per operation on 100,000 values, as DecArray and as a list of Dec.
+
+    $ python benchmarks/dec_array.py [count]
+"""
+
+import random
+import sys
+import time
+
+from cosmos_sdk.core import Dec, DecArray
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+rng = random.Random(0)
+X = [
+    Dec(f"{rng.randrange(10 ** 6)}.{rng.randrange(10 ** 18):018d}")
+    for _ in range(COUNT)
+]
+Y = [Dec(f"0.{rng.randrange(10 ** 18):018d}") for _ in range(COUNT)]
+A, B = DecArray(X), DecArray(Y)
+STRINGS = [str(dec) for dec in X]
+
+CASES = [
+    ("parse strings", lambda: DecArray(STRINGS), lambda: [Dec(s) for s in STRINGS]),
+    ("add", lambda: A + B, lambda: [x + y for x, y in zip(X, Y)]),
+    ("sub", lambda: A - B, lambda: [x - y for x, y in zip(X, Y)]),
+    ("mul", lambda: A * B, lambda: [x * y for x, y in zip(X, Y)]),
+    ("mul scalar", lambda: A * Y[0], lambda: [x * Y[0] for x in X]),
+    ("div", lambda: A / B, lambda: [x / y for x, y in zip(X, Y)]),
+    ("sum", lambda: A.sum(), lambda: sum(X, Dec(0))),
+    ("compare", lambda: A < B, lambda: [x < y for x, y in zip(X, Y)]),
+    ("to strings", lambda: A.to_strings(), lambda: [str(x) for x in X]),
+]
+
+
+def best(case):
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        result = case()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def run(name, array_case, list_case):
+    array_time, array_result = best(array_case)
+    list_time, list_result = best(list_case)
+    if isinstance(array_result, DecArray):
+        array_result = array_result.to_decs()
+    assert array_result == list_result, name
+    print(
+        f"{name:<16} {array_time:>9.4f}s {list_time:>9.4f}s "
+        f"{list_time / array_time:>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    print(f"{COUNT} values, vectorized: {A.vectorized}")
+    print(f"{'':<16} {'DecArray':>10} {'list':>10} {'speedup':>8}")
+    for case in CASES:
+        run(*case)
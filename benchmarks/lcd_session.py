@@ -0,0 +1,70 @@
+"""Requests/sec of the synchronous LCDClient against a local stand-in LCD server.
+
+Compares the previous behaviour (a new ClientSession, and therefore a new TCP
+connection, for every request) with the pooled keep-alive session.
+
+    $ python benchmarks/lcd_session.py [requests]
+"""
+
+import asyncio
+import sys
+import threading
+import time
+
+from aiohttp import web
+
+from cosmos_sdk.client.lcd import LCDClient
+
+HOST = "127.0.0.1"
+PORT = 18317
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+
+async def node_info(request):
+    return web.json_response(
+        {"default_node_info": {"network": "localterra"}, "application_version": {}}
+    )
+
+
+def serve():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    app = web.Application()
+    app.router.add_get("/cosmos/base/tendermint/v1beta1/node_info", node_info)
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, HOST, PORT).start())
+    loop.run_forever()
+
+
+class PerRequestSessionLCDClient(LCDClient):
+    """Tears the session down after every request, like LCDClient used to."""
+
+    async def _get(self, *args, **kwargs):
+        try:
+            return await super()._get(*args, **kwargs)
+        finally:
+            await self.session.close()
+
+
+def bench(name, terra):
+    terra.tendermint.node_info()  # warm up
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        terra.tendermint.node_info()
+    elapsed = time.perf_counter() - start
+    terra.close()
+    print(f"{name:<24} {REQUESTS / elapsed:>10.1f} req/s")
+
+
+def main():
+    threading.Thread(target=serve, daemon=True).start()
+    time.sleep(0.5)
+
+    url = f"http://{HOST}:{PORT}"
+    bench("session per request", PerRequestSessionLCDClient(url, "localterra"))
+    bench("pooled session", LCDClient(url, "localterra"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Operations/sec of Dec on the paths used by coins, fees and prices.
+
+Every case checks its result once before timing, so that the numbers of two revisions
+are only compared when they compute the same thing.
+
+    $ python benchmarks/numeric.py [seconds per case]
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from cosmos_sdk.core import Coins, Dec
+
+SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+
+PRICE = Dec("138875042105.980753034749566779")
+RATE = Dec("0.006250000000000000")
+COINS_DATA = [
+    {"denom": f"u{i:03d}", "amount": str(1000000 + i)} for i in range(20)
+]
+
+CASES = [
+    (
+        "parse canonical string",
+        lambda: Dec("8447.423744387144096286"),
+        "8447.423744387144096286",
+    ),
+    ("parse short string", lambda: Dec("0.15"), "0.150000000000000000"),
+    ("from int", lambda: Dec(1000000), "1000000.000000000000000000"),
+    ("copy", lambda: Dec(PRICE), str(PRICE)),
+    ("add Dec", lambda: PRICE + RATE, "138875042105.987003034749566779"),
+    ("add int", lambda: PRICE + 7, "138875042112.980753034749566779"),
+    ("mul Dec", lambda: PRICE * RATE, "867969013.162379706467184792"),
+    ("mul int", lambda: RATE * 200000, "1250.000000000000000000"),
+    ("div Dec", lambda: PRICE / RATE, "22220006736956.920485559930684640"),
+    ("compare Dec", lambda: PRICE > RATE, True),
+    ("compare int", lambda: RATE < 1, True),
+    ("equal", lambda: RATE == Dec("0.00625"), True),
+    ("to string", lambda: str(PRICE), "138875042105.980753034749566779"),
+    ("gas fee", lambda: Dec("0.15").mul(200000).to_short_str(), "30000"),
+    (
+        "coins from data (20)",
+        lambda: Coins.from_data(COINS_DATA),
+        Coins.from_data(COINS_DATA),
+    ),
+]
+
+
+def run(name, case, expected):
+    result = case()
+    if not isinstance(expected, Coins):
+        result = str(result) if isinstance(result, Dec) else result
+    assert result == expected, f"{name}: {result!r} != {expected!r}"
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+    number = max(1, int(number * SECONDS / 0.2))
+    best = min(timer.repeat(repeat=3, number=number)) / number
+    print(f"{name:<24} {1 / best:>12,.0f} ops/sec")
+
+
+def memory():
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    decs = [Dec(i) for i in range(100000)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"{'memory per Dec':<24} {size / len(decs):>12,.0f} bytes")
+
+
+if __name__ == "__main__":
+    for case in CASES:
+        run(*case)
+    memory()
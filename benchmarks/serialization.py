@@ -0,0 +1,72 @@
+"""Operations/sec of JSON serialization on large transactions.
+
+Prints a digest of every result, to check that two revisions produce the same bytes.
+Install orjson to measure its backend.
+
+    $ python benchmarks/serialization.py [seconds per case]
+"""
+
+import hashlib
+import sys
+import timeit
+
+from cosmos_sdk.core import Coins, SignDoc
+from cosmos_sdk.core.bank import MsgMultiSend
+from cosmos_sdk.core.bank.msgs import MultiSendInput, MultiSendOutput
+from cosmos_sdk.core.fee import Fee
+from cosmos_sdk.core.tx import AuthInfo, Tx, TxBody
+from cosmos_sdk.core.wasm import MsgExecuteContract
+from cosmos_sdk.util.json import dict_to_data
+
+SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+
+SENDER = "terra1x46rqay4d3cssq8gxxvqz8xt6nwlz4td20k38v"
+CONTRACT = "terra1dcegyrekltswvyy0xy69ydgxn9x8x32zdtapd8"
+OUTPUTS = [
+    MultiSendOutput(SENDER, Coins(uluna=1000 + i, uusd=5 + i)) for i in range(200)
+]
+MULTI_SEND = MsgMultiSend(
+    [MultiSendInput(SENDER, sum((o.coins for o in OUTPUTS), Coins()))], OUTPUTS
+)
+EXECUTE = MsgExecuteContract(
+    SENDER,
+    CONTRACT,
+    {
+        "batch": {
+            "transfers": [
+                {"recipient": SENDER, "amount": str(i), "memo": f"payout {i}"}
+                for i in range(200)
+            ]
+        }
+    },
+    Coins(uluna=5),
+)
+FEE = Fee(2000000, Coins(uluna=300000))
+TX = Tx(TxBody([MULTI_SEND, EXECUTE], "payout"), AuthInfo([], FEE), [])
+SIGN_DOC = SignDoc("columbus-5", 1, 2, TX.auth_info, TX.body)
+
+CASES = [
+    ("MsgMultiSend.to_json", MULTI_SEND.to_json),
+    ("MsgExecuteContract.to_data", EXECUTE.to_data),
+    ("Tx.to_json", TX.to_json),
+    ("dict_to_data(Tx data)", lambda: dict_to_data(TX.to_data())),
+    ("SignDoc.to_amino_json", SIGN_DOC.to_amino_json),
+]
+
+
+def digest(result) -> str:
+    return hashlib.sha256(repr(result).encode()).hexdigest()[:12]
+
+
+def run(name, case):
+    result = case()
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+    number = max(1, int(number * SECONDS / 0.2))
+    best = min(timer.repeat(repeat=3, number=number)) / number
+    print(f"{name:<28} {1 / best:>10,.0f} ops/sec  {digest(result)}")
+
+
+if __name__ == "__main__":
+    for case in CASES:
+        run(*case)
@@ -0,0 +1,48 @@
+"""Signatures/sec of RawKey.
+
+Compares the previous behaviour (the private key parsed by ``ecdsa`` for every
+signature) with the cached signing key of each secp256k1 backend.
+
+    $ python benchmarks/signing.py [signatures]
+"""
+
+import hashlib
+import sys
+import time
+
+from ecdsa import SECP256k1, SigningKey
+from ecdsa.util import sigencode_string_canonize
+
+from cosmos_sdk.key.secp256k1 import CoincurveBackend, EcdsaBackend, coincurve
+from cosmos_sdk.key.terra.raw import RawKey
+
+SIGNATURES = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+PRIVATE_KEY = hashlib.sha256(b"benchmark").digest()
+PAYLOADS = [hashlib.sha256(i.to_bytes(4, "big")).digest() * 8 for i in range(SIGNATURES)]
+
+
+def sign_uncached(payload: bytes) -> bytes:
+    sk = SigningKey.from_string(PRIVATE_KEY, curve=SECP256k1)
+    return sk.sign_deterministic(
+        payload, hashfunc=hashlib.sha256, sigencode=sigencode_string_canonize
+    )
+
+
+def run(name, sign):
+    start = time.perf_counter()
+    signatures = [sign(payload) for payload in PAYLOADS]
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {SIGNATURES / elapsed:>10.0f} signatures/sec")
+    return signatures
+
+
+if __name__ == "__main__":
+    expected = run("ecdsa, key parsed per call", sign_uncached)
+    assert run("ecdsa, cached key", RawKey(PRIVATE_KEY, EcdsaBackend).sign) == expected
+    if coincurve is None:
+        print("coincurve is not installed, skipping CoincurveBackend")
+    else:
+        assert (
+            run("coincurve, cached key", RawKey(PRIVATE_KEY, CoincurveBackend).sign)
+            == expected
+        )
@@ -0,0 +1,165 @@
+"""Blocks/sec and memory of eager and lazy transaction decoding, for an indexer reading
+the hash, fee and message type URLs of every transaction of a large block.
+
+Checks once that lazy and eager decoding read the same values before timing.
+
+    $ python benchmarks/tx_decoding.py [seconds per case]
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+from betterproto.lib.google.protobuf import Any
+from cosmos_proto.ibc.core.client.v1 import MsgUpdateClient as MsgUpdateClient_pb
+
+from cosmos_sdk.core import Coins
+from cosmos_sdk.core.fee import Fee
+from cosmos_sdk.core.msg import Msg
+from cosmos_sdk.core.tx import AuthInfo, Tx, TxBody, TxInfo
+from cosmos_sdk.core.wasm import MsgExecuteContract
+
+SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+
+SENDER = "terra1x46rqay4d3cssq8gxxvqz8xt6nwlz4td20k38v"
+CONTRACT = "terra1dcegyrekltswvyy0xy69ydgxn9x8x32zdtapd8"
+UPDATE_CLIENT_URL = "/ibc.core.client.v1.MsgUpdateClient"
+TXS_PER_BLOCK = 200
+
+
+def execute_contract(i):
+    return MsgExecuteContract(
+        SENDER,
+        CONTRACT,
+        {
+            "execute_swap_operations": {
+                "operations": [
+                    {
+                        "terra_swap": {
+                            "offer_asset_info": {"native_token": {"denom": "uluna"}},
+                            "ask_asset_info": {"token": {"contract_addr": CONTRACT}},
+                        }
+                    }
+                ]
+                * 4,
+                "minimum_receive": str(1000000 + i),
+            }
+        },
+        Coins(uluna=1000000 + i),
+    )
+
+
+def update_client(i):
+    # the header of a light client update, mostly validator set and commit signatures
+    proto = MsgUpdateClient_pb(
+        client_id=f"07-tendermint-{i}",
+        header=Any(
+            type_url="/ibc.lightclients.tendermint.v1.Header",
+            value=os.urandom(8000),
+        ),
+        signer=SENDER,
+    )
+    return Msg.unpack_any(Any(type_url=UPDATE_CLIENT_URL, value=bytes(proto)))
+
+
+def make_tx(i):
+    if i % 2:
+        messages = [update_client(i), update_client(i + 1)]
+    else:
+        messages = [execute_contract(i + j) for j in range(3)]
+    return Tx(
+        TxBody(messages, memo=f"memo {i}"),
+        AuthInfo([], Fee(400000, Coins(uluna=6000 + i))),
+        [os.urandom(64)],
+    )
+
+
+TXS = [make_tx(i) for i in range(TXS_PER_BLOCK)]
+BLOCK = [tx.to_bytes() for tx in TXS]
+TX_INFOS = [
+    {
+        "height": "7549440",
+        "txhash": tx.hash(),
+        "raw_log": "[]",
+        "logs": [
+            {
+                "msg_index": j,
+                "log": "",
+                "events": [
+                    {
+                        "type": "wasm",
+                        "attributes": [{"key": "action", "value": "swap"}] * 20,
+                    }
+                ],
+            }
+            for j in range(len(tx.body.messages))
+        ],
+        "gas_wanted": "400000",
+        "gas_used": "300000",
+        "tx": tx.to_data(),
+        "timestamp": "2022-05-01T00:00:00Z",
+    }
+    for tx in TXS
+]
+
+
+def index_txs(txs):
+    return [(tx.hash(), tx.auth_info.fee, tx.body.message_type_urls()) for tx in txs]
+
+
+def index_tx_infos(infos):
+    return [
+        (
+            info.height,
+            info.txhash,
+            info.tx.auth_info.fee,
+            info.tx.body.message_type_urls(),
+        )
+        for info in infos
+    ]
+
+
+def decode_block(lazy):
+    return [Tx.from_bytes(tx, lazy=lazy) for tx in BLOCK]
+
+
+def decode_tx_infos(lazy):
+    return [TxInfo.from_data(info, lazy=lazy) for info in TX_INFOS]
+
+
+CASES = [
+    ("block from bytes", lambda lazy: index_txs(decode_block(lazy))),
+    ("tx infos from data", lambda lazy: index_tx_infos(decode_tx_infos(lazy))),
+]
+
+
+def run(name, case):
+    assert case(True) == case(False), name
+    for lazy in (False, True):
+        timer = timeit.Timer(lambda: case(lazy))
+        number, _ = timer.autorange()
+        number = max(1, int(number * SECONDS / 0.2))
+        best = min(timer.repeat(repeat=3, number=number)) / number
+        label = f"{name} ({'lazy' if lazy else 'eager'})"
+        print(f"{label:<32} {1 / best:>10,.1f} blocks/sec")
+
+
+def memory(name, decode, index):
+    for lazy in (False, True):
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        decoded = decode(lazy)
+        index(decoded)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        label = f"{name} ({'lazy' if lazy else 'eager'})"
+        print(f"{label:<32} {size / len(decoded):>10,.0f} bytes/tx")
+
+
+if __name__ == "__main__":
+    for case in CASES:
+        run(*case)
+    memory("block from bytes", decode_block, index_txs)
+    memory("tx infos from data", decode_tx_infos, index_tx_infos)
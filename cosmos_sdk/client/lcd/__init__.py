@@ -1,5 +1,39 @@
 from .terra.lcdclient import AsyncLCDClient, LCDClient
+from .batch import BatchResult
+from .cache import CachePolicy, ResponseCache
+from .connection import ConnectionOptions
+from .endpoints import EndpointPool
+from .follower import BlockFollower
+from .gas import CachingGasEstimator, GasEstimator
+from .pagination import Paginator
+from .payout import PayoutBuilder, aggregate_payouts
+from .pipeline import BroadcastPipeline, PipelineStats
 from .params import PaginationOptions
+from .singleflight import SingleFlight
 from .terra.wallet import AsyncWallet, Wallet
+from .transport import RateLimiter, RetryBudget, TransportPolicy
 
-__all__ = ["AsyncLCDClient", "LCDClient", "AsyncWallet", "Wallet", "PaginationOptions"]
+__all__ = [
+    "AsyncLCDClient",
+    "LCDClient",
+    "AsyncWallet",
+    "Wallet",
+    "PaginationOptions",
+    "Paginator",
+    "ConnectionOptions",
+    "EndpointPool",
+    "ResponseCache",
+    "CachePolicy",
+    "BatchResult",
+    "BlockFollower",
+    "TransportPolicy",
+    "RateLimiter",
+    "RetryBudget",
+    "SingleFlight",
+    "GasEstimator",
+    "CachingGasEstimator",
+    "BroadcastPipeline",
+    "PipelineStats",
+    "PayoutBuilder",
+    "aggregate_payouts",
+]
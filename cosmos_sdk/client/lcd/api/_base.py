@@ -1,7 +1,10 @@
 import asyncio
+from typing import Optional
 
 import wrapt
 
+from ..pagination import Paginator
+
 
 class BaseAsyncAPI:
     # c = AsyncLCDClient
@@ -20,6 +23,13 @@ class BaseAsyncAPI:
         else:
             return aw
 
+    def _paginate(
+        self, fetch, page_size: Optional[int] = None, key: Optional[str] = None
+    ) -> Paginator:
+        """Creates a :class:`Paginator` over a paginated query. ``fetch`` must be the
+        asynchronous implementation, so pages can be prefetched on both client kinds."""
+        return Paginator(fetch, self._c.loop, page_size, key)
+
 
 def sync_bind(async_call):
     """A decorator that redirects the function to the synchronous version of async_call."""
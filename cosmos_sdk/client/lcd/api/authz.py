@@ -3,6 +3,7 @@ from typing import List, Optional
 from cosmos_sdk.core import AccAddress
 from cosmos_sdk.core.authz import AuthorizationGrant
 
+from ..pagination import Paginator
 from ..params import APIParams
 from ._base import BaseAsyncAPI, sync_bind
 
@@ -28,15 +29,56 @@ class AsyncAuthzAPI(BaseAsyncAPI):
         Returns:
             List[AuthorizationGrant]: message authorization grants matching criteria
         """
-        params = {
-            "granter": granter,
-            "grantee": grantee,
-        }
+        grants, _ = await AsyncAuthzAPI._grants_page(
+            self, granter, grantee, msg_type, params
+        )
+        return grants
+
+    async def _grants_page(
+        self,
+        granter: AccAddress,
+        grantee: AccAddress,
+        msg_type: Optional[str] = None,
+        params: Optional[APIParams] = None,
+    ) -> (List[AuthorizationGrant], dict):
+        _params = params.to_dict() if params is not None else {}
+        _params["granter"] = granter
+        _params["grantee"] = grantee
         if msg_type is not None:
-            params["msg_type_url"] = msg_type
+            _params["msg_type_url"] = msg_type
+
+        res = await self._c._get("/cosmos/authz/v1beta1/grants", _params)
+        return [AuthorizationGrant.from_data(x) for x in res["grants"]], res.get(
+            "pagination"
+        )
 
-        res = await self._c._get("/cosmos/authz/v1beta1/grants", params)
-        return [AuthorizationGrant.from_data(x) for x in res["grants"]]
+    def iter_grants(
+        self,
+        granter: AccAddress,
+        grantee: AccAddress,
+        msg_type: Optional[str] = None,
+        page_size: Optional[int] = None,
+        key: Optional[str] = None,
+    ) -> Paginator:
+        """Iterates over all active message authorization grants.
+
+        Args:
+            granter (AccAddress): granter account address
+            grantee (AccAddress): grantee account address
+            msg_type (str, optional): message type.
+            page_size (int, optional): number of items fetched per request
+            key (str, optional): pagination key to resume from
+
+        Returns:
+            Paginator: iterator of :class:`AuthorizationGrant`
+        """
+        return self._paginate(
+            lambda params: AsyncAuthzAPI._grants_page(
+                self, granter, grantee, msg_type, params
+            ),
+            page_size,
+            key,
+        )
 
 
 class AuthzAPI(AsyncAuthzAPI):
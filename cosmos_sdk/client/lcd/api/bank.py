@@ -2,6 +2,7 @@ from typing import Optional
 
 from cosmos_sdk.core import AccAddress, Coins
 
+from ..pagination import Paginator
 from ..params import APIParams
 from ._base import BaseAsyncAPI, sync_bind
 
@@ -25,6 +26,26 @@ class AsyncBankAPI(BaseAsyncAPI):
         res = await self._c._get(f"/cosmos/bank/v1beta1/balances/{address}", params)
         return Coins.from_data(res["balances"]), res.get("pagination")
 
+    def iter_balance(
+        self,
+        address: AccAddress,
+        page_size: Optional[int] = None,
+        key: Optional[str] = None,
+    ) -> Paginator:
+        """Iterates over an account's current balance, one :class:`Coin` at a time.
+
+        Args:
+            address (AccAddress): account address
+            page_size (int, optional): number of items fetched per request
+            key (str, optional): pagination key to resume from
+
+        Returns:
+            Paginator: iterator of :class:`Coin`
+        """
+        return self._paginate(
+            lambda params: AsyncBankAPI.balance(self, address, params), page_size, key
+        )
+
     async def total(self, params: Optional[APIParams] = None) -> (Coins, dict):
         """Fetches the current total supply of all tokens.
 
@@ -35,6 +56,22 @@ class AsyncBankAPI(BaseAsyncAPI):
         res = await self._c._get("/cosmos/bank/v1beta1/supply", params)
         return Coins.from_data(res.get("supply")), res.get("pagination")
 
+    def iter_total(
+        self, page_size: Optional[int] = None, key: Optional[str] = None
+    ) -> Paginator:
+        """Iterates over the current total supply, one :class:`Coin` at a time.
+
+        Args:
+            page_size (int, optional): number of items fetched per request
+            key (str, optional): pagination key to resume from
+
+        Returns:
+            Paginator: iterator of :class:`Coin`
+        """
+        return self._paginate(
+            lambda params: AsyncBankAPI.total(self, params), page_size, key
+        )
+
 
 class BankAPI(AsyncBankAPI):
     @sync_bind(AsyncBankAPI.balance)
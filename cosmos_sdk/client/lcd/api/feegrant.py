@@ -3,6 +3,7 @@ from typing import Optional
 from cosmos_sdk.core import AccAddress
 from cosmos_sdk.core.feegrant import Allowance
 
+from ..pagination import Paginator
 from ..params import APIParams
 from ._base import BaseAsyncAPI, sync_bind
 
@@ -36,6 +37,28 @@ class AsyncFeeGrantAPI(BaseAsyncAPI):
             allowances.append(allowance)
         return allowances, res.get("pagination")
 
+    def iter_allowances(
+        self,
+        address: AccAddress,
+        page_size: Optional[int] = None,
+        key: Optional[str] = None,
+    ) -> Paginator:
+        """Iterates over all fee allowances granted to an address.
+
+        Args:
+            address (AccAddress): grantee address
+            page_size (int, optional): number of items fetched per request
+            key (str, optional): pagination key to resume from
+
+        Returns:
+            Paginator: iterator of granted allowances
+        """
+        return self._paginate(
+            lambda params: AsyncFeeGrantAPI.allowances(self, address, params),
+            page_size,
+            key,
+        )
+
     async def allowance(
         self,
         granter: AccAddress,
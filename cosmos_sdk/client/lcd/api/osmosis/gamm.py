@@ -3,6 +3,7 @@ from cosmos_sdk.core import Coin, Dec
 from .._base import BaseAsyncAPI, sync_bind
 
 from cosmos_sdk.core.gamm import Pool
+from ...pagination import Paginator
 from ...params import APIParams
 
 from typing import List, Tuple, Dict, Optional
@@ -23,6 +24,22 @@ class AsyncGAMMAPI(BaseAsyncAPI):
         res = await self._c._get(f"/osmosis/gamm/v1beta1/pools", params)
         return [Pool.from_data(x) for x in res["pools"]], res.get("pagination")
 
+    def iter_pools(
+        self, page_size: Optional[int] = None, key: Optional[str] = None
+    ) -> Paginator:
+        """Iterates over all pools.
+
+        Args:
+            page_size (int, optional): number of items fetched per request
+            key (str, optional): pagination key to resume from
+
+        Returns:
+            Paginator: iterator of :class:`Pool`
+        """
+        return self._paginate(
+            lambda params: AsyncGAMMAPI.pools(self, params), page_size, key
+        )
+
     async def pool(
         self,
         pool_id: int,
@@ -8,6 +8,7 @@ from ._base import BaseAsyncAPI, sync_bind
 
 __all__ = ["AsyncSlashingAPI", "SlashingAPI"]
 
+from ..pagination import Paginator
 from ..params import APIParams
 
 
@@ -62,6 +63,22 @@ class AsyncSlashingAPI(BaseAsyncAPI):
             for info in infos
         ], res.get("pagination")
 
+    def iter_signing_infos(
+        self, page_size: Optional[int] = None, key: Optional[str] = None
+    ) -> Paginator:
+        """Iterates over all signing infos.
+
+        Args:
+            page_size (int, optional): number of items fetched per request
+            key (str, optional): pagination key to resume from
+
+        Returns:
+            Paginator: iterator of signing infos
+        """
+        return self._paginate(
+            lambda params: AsyncSlashingAPI.signing_infos(self, params), page_size, key
+        )
+
     async def parameters(self) -> dict:
         """Fetches Slashing module parameters.
 
@@ -10,6 +10,7 @@ from cosmos_sdk.core.staking import (
     Validator,
 )
 
+from ..pagination import Paginator
 from ._base import BaseAsyncAPI, sync_bind
 
 __all__ = ["AsyncStakingAPI", "StakingAPI", "StakingPool"]
@@ -93,6 +94,32 @@ class AsyncStakingAPI(BaseAsyncAPI):
         else:
             raise TypeError("arguments delegator and validator cannot both be None")
 
+    def iter_delegations(
+        self,
+        delegator: Optional[AccAddress] = None,
+        validator: Optional[ValAddress] = None,
+        page_size: Optional[int] = None,
+        key: Optional[str] = None,
+    ) -> Paginator:
+        """Iterates over all delegations, filtering by delegator, validator, or both.
+
+        Args:
+            delegator (Optional[AccAddress], optional): delegator account address.
+            validator (Optional[ValAddress], optional): validator operator address.
+            page_size (int, optional): number of items fetched per request
+            key (str, optional): pagination key to resume from
+
+        Returns:
+            Paginator: iterator of :class:`Delegation`
+        """
+        return self._paginate(
+            lambda params: AsyncStakingAPI.delegations(
+                self, delegator, validator, params
+            ),
+            page_size,
+            key,
+        )
+
     async def delegation(
         self, delegator: AccAddress, validator: ValAddress
     ) -> Delegation:
@@ -249,6 +276,22 @@ class AsyncStakingAPI(BaseAsyncAPI):
             "pagination"
         )
 
+    def iter_validators(
+        self, page_size: Optional[int] = None, key: Optional[str] = None
+    ) -> Paginator:
+        """Iterates over all validators.
+
+        Args:
+            page_size (int, optional): number of items fetched per request
+            key (str, optional): pagination key to resume from
+
+        Returns:
+            Paginator: iterator of :class:`Validator`
+        """
+        return self._paginate(
+            lambda params: AsyncStakingAPI.validators(self, params), page_size, key
+        )
+
     async def validator(self, validator: ValAddress) -> Validator:
         """Fetch information about a single validator.
 
@@ -1,5 +1,7 @@
+from concurrent.futures import Executor
 from typing import Optional
 
+from ..follower import BlockFollower
 from ._base import BaseAsyncAPI, sync_bind
 
 __all__ = ["AsyncTendermintAPI", "TendermintAPI"]
@@ -52,6 +54,40 @@ class AsyncTendermintAPI(BaseAsyncAPI):
         x = "latest" if height is None else height
         return await self._c._get(f"/cosmos/base/tendermint/v1beta1/blocks/{x}")
 
+    def follow_blocks(
+        self,
+        start_height: Optional[int] = None,
+        stop_height: Optional[int] = None,
+        prefetch: int = 8,
+        executor: Optional[Executor] = None,
+        lazy: bool = False,
+    ) -> BlockFollower:
+        """Follows the chain block by block, from ``start_height`` or the latest block.
+        Blocks up to the tip are fetched ``prefetch`` at a time, then the latest block
+        is polled for new ones.
+
+        Args:
+            start_height (int, optional): first block to yield. latest if None.
+            stop_height (int, optional): last block to yield. follows the chain forever
+                if None.
+            prefetch (int, optional): maximum number of blocks fetched ahead.
+            executor (Executor, optional): executor decoding block transactions.
+            lazy (bool, optional): decode block transactions lazily.
+
+        Returns:
+            BlockFollower: iterator of ``(height, block, txs)``, with ``txs`` the
+            decoded :class:`Tx` of the block
+        """
+        return BlockFollower(
+            lambda height: AsyncTendermintAPI.block_info(self, height),
+            self._c.loop,
+            start_height,
+            stop_height,
+            prefetch,
+            executor=executor,
+            lazy=lazy,
+        )
+
 
 class TendermintAPI(AsyncTendermintAPI):
     @sync_bind(AsyncTendermintAPI.node_info)
@@ -1,5 +1,7 @@
+import asyncio
 import base64
 import copy
+from functools import partial
 from typing import List, Optional
 
 import attr
@@ -14,11 +16,14 @@ from cosmos_sdk.core.broadcast import (
 from cosmos_sdk.core.fee import Fee
 from cosmos_sdk.core.msg import Msg
 from cosmos_sdk.core.tx import AuthInfo, SignerData, SignMode, Tx, TxBody, TxInfo
-from cosmos_sdk.util.hash import hash_amino
+from cosmos_sdk.util.hash import hash_txs
 from cosmos_sdk.util.json import JSONSerializable
 
+from ..batch import run_batch
 from ..params import APIParams
+from ..pipeline import BroadcastPipeline
 from ._base import BaseAsyncAPI, sync_bind
+from .auth import AsyncAuthAPI
 
 __all__ = [
     "AsyncTxAPI",
@@ -128,17 +133,19 @@ class SimulateResponse(JSONSerializable):
 
 
 class AsyncTxAPI(BaseAsyncAPI):
-    async def tx_info(self, tx_hash: str) -> TxInfo:
+    async def tx_info(self, tx_hash: str, lazy: bool = False) -> TxInfo:
         """Fetches information for an included transaction given a tx hash.
 
         Args:
             tx_hash (str): hash of transaction to lookup
+            lazy (bool, optional): parse the logs and the transaction on first access,
+                and each message only when it is accessed. Defaults to False.
 
         Returns:
             TxInfo: transaction info
         """
         res = await self._c._get(f"/cosmos/tx/v1beta1/txs/{tx_hash}")
-        return TxInfo.from_data(res["tx_response"])
+        return TxInfo.from_data(res["tx_response"], lazy=lazy)
 
     async def create(
         self, signers: List[SignerOptions], options: CreateTxOptions
@@ -146,6 +153,9 @@ class AsyncTxAPI(BaseAsyncAPI):
         """Create a new unsigned transaction, with helpful utilities such as lookup of
         chain ID, account number, sequence and fee estimation.
 
+        The accounts of the signers missing a sequence or public key are looked up
+        concurrently, once per address.
+
         Args:
             signers (List[SignerOptions]): options about signers
             options (CreateTxOptions): options about creating a tx
@@ -156,24 +166,11 @@ class AsyncTxAPI(BaseAsyncAPI):
 
         opt = copy.deepcopy(options)
 
-        signer_data: List[SignerData] = []
-        for signer in signers:
-            seq = signer.sequence
-            pubkey = signer.public_key
-
-            if seq is None or pubkey is None:
-                acc = await BaseAsyncAPI._try_await(
-                    self._c.auth.account_info(signer.address)
-                )
-                if seq is None:
-                    seq = acc.get_sequence()
-                if pubkey is None:
-                    pubkey = acc.get_public_key()
-            signer_data.append(SignerData(seq, pubkey))
+        signer_data = await AsyncTxAPI._signer_data(self, signers)
 
         # create the fake fee
         if opt.fee is None:
-            opt.fee = await BaseAsyncAPI._try_await(self.estimate_fee(signer_data, opt))
+            opt.fee = await AsyncTxAPI.estimate_fee(self, signer_data, opt)
 
         return Tx(
             TxBody(opt.msgs, opt.memo or "", opt.timeout_height or 0),
@@ -181,6 +178,71 @@ class AsyncTxAPI(BaseAsyncAPI):
             [],
         )
 
+    async def _signer_data(self, signers: List[SignerOptions]) -> List[SignerData]:
+        # lookups go through the client's GET cache and single-flight like any query
+        addresses = list(
+            dict.fromkeys(
+                signer.address
+                for signer in signers
+                if signer.sequence is None or signer.public_key is None
+            )
+        )
+        accounts = dict(
+            zip(
+                addresses,
+                await asyncio.gather(
+                    *[
+                        AsyncAuthAPI.account_info(self._c.auth, address)
+                        for address in addresses
+                    ]
+                ),
+            )
+        )
+
+        signer_data: List[SignerData] = []
+        for signer in signers:
+            seq = signer.sequence
+            pubkey = signer.public_key
+            acc = accounts.get(signer.address)
+            if seq is None:
+                seq = acc.get_sequence()
+            if pubkey is None:
+                pubkey = acc.get_public_key()
+            signer_data.append(SignerData(seq, pubkey))
+        return signer_data
+
+    async def estimate_fees(
+        self,
+        signers: List[SignerOptions],
+        options_list: List[CreateTxOptions],
+        max_concurrency: int = 8,
+    ) -> List[Fee]:
+        """Estimates the fees of many transactions from the same signers in one pass.
+        The accounts of the signers are looked up once, then the transactions are
+        simulated concurrently.
+
+        Args:
+            signers (List[SignerOptions]): signers of every transaction
+            options_list (List[CreateTxOptions]): transactions to estimate fees for
+            max_concurrency (int, optional): maximum number of simulations in flight.
+                Defaults to 8.
+
+        Returns:
+            List[Fee]: estimated fees, in the order of ``options_list``
+        """
+        signer_data = await AsyncTxAPI._signer_data(self, signers)
+        results = await run_batch(
+            [
+                partial(AsyncTxAPI.estimate_fee, self, signer_data, options)
+                for options in options_list
+            ],
+            max_concurrency,
+        )
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return [result.result for result in results]
+
     async def estimate_fee(
         self, signers: List[SignerOptions], options: CreateTxOptions
     ) -> Fee:
@@ -217,7 +279,7 @@ class AsyncTxAPI(BaseAsyncAPI):
         if gas is None or gas == "auto" or int(gas) == 0:
             opt = copy.deepcopy(options)
             opt.gas_adjustment = gas_adjustment
-            gas = str(await super()._try_await(self.estimate_gas(tx, opt)))
+            gas = str(await AsyncTxAPI.estimate_gas(self, tx, opt))
 
         fee_amount = (
             gas_prices_coins.mul(gas).to_int_ceil_coins()
@@ -230,40 +292,65 @@ class AsyncTxAPI(BaseAsyncAPI):
     async def estimate_gas(self, tx: Tx, options: Optional[CreateTxOptions]) -> int:
         gas_adjustment = options.gas_adjustment if options else self._c.gas_adjustment
 
+        estimator = self._c.gas_estimator
+        if estimator is None:
+            gas_used = await self._simulate(tx)
+        else:
+            gas_used = await estimator.estimate(tx, lambda: self._simulate(tx))
+
+        return int(Dec(gas_adjustment).mul(gas_used))
+
+    async def _simulate(self, tx: Tx) -> int:
         res = await self._c._post(
             "/cosmos/tx/v1beta1/simulate",
-            {"tx_bytes": await super()._try_await(self.encode(tx))},
+            {"tx_bytes": await AsyncTxAPI.encode(self, tx)},
         )
         simulated = SimulateResponse.from_data(res)
-
-        return int(Dec(gas_adjustment).mul(simulated.gas_info["gas_used"]))
+        return int(simulated.gas_info["gas_used"])
 
     async def encode(self, tx: Tx) -> str:
         """Encode a Tx to base64 encoded proto string"""
-        return base64.b64encode(bytes(tx.to_proto())).decode()
+        return base64.b64encode(tx.to_bytes()).decode()
 
     async def decode(self, tx: str) -> Tx:
         """Decode base64 encoded proto string to a Tx"""
         return Tx.from_bytes(base64.b64decode(tx))
 
     async def hash(self, tx: Tx) -> str:
-        """Compute hash for a transaction.
+        """Compute hash for a transaction, locally. See :meth:`Tx.hash`.
 
         Args:
             tx (Tx): transaction to hash
 
         Returns:
-            str: transaction hash
+            str: uppercase hex transaction hash
         """
-        amino = self.encode(tx)
-        return hash_amino(amino)
+        return tx.hash()
 
     async def _broadcast(
         self, tx: Tx, mode: str, options: BroadcastOptions = None
     ) -> dict:
-        data = {"tx_bytes": await super()._try_await(self.encode(tx)), "mode": mode}
+        tx_bytes = await super()._try_await(self.encode(tx))
+        return await self._broadcast_bytes(tx_bytes, mode)
+
+    async def _broadcast_bytes(self, tx_bytes: str, mode: str) -> dict:
+        data = {"tx_bytes": tx_bytes, "mode": mode}
         return await self._c._post("/cosmos/tx/v1beta1/txs", data)  # , raw=True)
 
+    @staticmethod
+    def _sync_result(res: dict) -> SyncTxBroadcastResult:
+        res = res.get("tx_response")
+        return SyncTxBroadcastResult(
+            txhash=res.get("txhash"),
+            raw_log=res.get("raw_log"),
+            code=res.get("code"),
+            codespace=res.get("codespace"),
+        )
+
+    async def _broadcast_sync_bytes(self, tx_bytes: str) -> SyncTxBroadcastResult:
+        res = await AsyncTxAPI._broadcast_bytes(self, tx_bytes, "BROADCAST_MODE_SYNC")
+        return self._sync_result(res)
+
     async def broadcast_sync(
         self, tx: Tx, options: BroadcastOptions = None
     ) -> SyncTxBroadcastResult:
@@ -277,13 +364,7 @@ class AsyncTxAPI(BaseAsyncAPI):
             SyncTxBroadcastResult: result
         """
         res = await self._broadcast(tx, "BROADCAST_MODE_SYNC", options)
-        res = res.get("tx_response")
-        return SyncTxBroadcastResult(
-            txhash=res.get("txhash"),
-            raw_log=res.get("raw_log"),
-            code=res.get("code"),
-            codespace=res.get("codespace"),
-        )
+        return self._sync_result(res)
 
     async def broadcast_async(
         self, tx: Tx, options: BroadcastOptions = None
@@ -328,6 +409,40 @@ class AsyncTxAPI(BaseAsyncAPI):
             codespace=res.get("codespace"),
         )
 
+    def pipeline(
+        self,
+        max_in_flight: int = 64,
+        poll_interval: float = 1.0,
+        timeout: float = 60.0,
+        max_concurrency: int = 16,
+    ) -> BroadcastPipeline:
+        """Creates a pipeline broadcasting signed transactions with the ``sync`` mode
+        and tracking their inclusion in blocks. Each submitted transaction gets a
+        future resolving to its :class:`TxInfo`.
+
+        Args:
+            max_in_flight (int, optional): maximum number of transactions broadcast
+                and not yet included. Defaults to 64.
+            poll_interval (float, optional): wait, in seconds, between polls of the
+                latest block. Defaults to 1.
+            timeout (float, optional): seconds after broadcast before a transaction
+                not seen in a block fails. Defaults to 60.
+            max_concurrency (int, optional): maximum number of block and ``tx_info``
+                requests in flight. Defaults to 16.
+
+        Returns:
+            BroadcastPipeline: pipeline, to use with ``async with``
+        """
+        return BroadcastPipeline(
+            partial(AsyncTxAPI._broadcast_sync_bytes, self),
+            partial(AsyncTxAPI._block, self),
+            partial(AsyncTxAPI.tx_info, self),
+            max_in_flight,
+            poll_interval,
+            timeout,
+            max_concurrency,
+        )
+
     async def search(
         self, events: List[list], params: Optional[APIParams] = None
     ) -> dict:
@@ -358,30 +473,68 @@ class AsyncTxAPI(BaseAsyncAPI):
             "pagination": res.get("pagination"),
         }
 
-    async def tx_infos_by_height(self, height: Optional[int] = None) -> List[TxInfo]:
-        """Fetches information for an included transaction given block height or latest
+    async def _block(self, height: Optional[int]) -> dict:
+        x = "latest" if height is None else height
+        return await self._c._get(f"/cosmos/base/tendermint/v1beta1/blocks/{x}")
+
+    async def _block_txs(self, height: Optional[int]) -> List[str]:
+        res = await AsyncTxAPI._block(self, height)
+        return res.get("block").get("data").get("txs") or []
+
+    async def tx_infos_by_height(
+        self,
+        height: Optional[int] = None,
+        max_concurrency: int = 16,
+        lazy: bool = False,
+    ) -> List[TxInfo]:
+        """Fetches information for the transactions included in a block given its
+        height, or the latest block. Transactions are looked up concurrently.
 
         Args:
             height (int, optional): height to lookup. latest if height is None.
+            max_concurrency (int, optional): maximum number of lookups in flight.
+                Defaults to 16.
+            lazy (bool, optional): parse the logs and the transactions on first access,
+                and each message only when it is accessed. Defaults to False.
 
         Returns:
-            List[TxInfo]: transaction info
+            List[TxInfo]: transaction info, in block order
         """
-        if height is None:
-            x = "latest"
-        else:
-            x = height
+        txs = await self._block_txs(height)
+        results = await run_batch(
+            [partial(AsyncTxAPI.tx_info, self, h, lazy) for h in hash_txs(txs)],
+            max_concurrency,
+        )
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return [result.result for result in results]
+
+    async def txs_by_height(
+        self, height: Optional[int] = None, lazy: bool = False
+    ) -> List[Tx]:
+        """Fetches the transactions included in a block given its height, or the latest
+        block. Transactions are decoded from the block itself, so no further request is
+        made, but execution results (logs, gas used, events) are not available.
 
-        res = await self._c._get(f"/cosmos/base/tendermint/v1beta1/blocks/{x}")
+        Args:
+            height (int, optional): height to lookup. latest if height is None.
+            lazy (bool, optional): decode the body and the auth info of transactions on
+                first access, and each message only when it is accessed. Hashes are
+                computed from the block bytes without decoding. Defaults to False.
 
-        txs = res.get("block").get("data").get("txs")
-        hashes = [hash_amino(tx) for tx in txs]
-        return [await BaseAsyncAPI._try_await(self.tx_info(tx_hash)) for tx_hash in hashes]
+        Returns:
+            List[Tx]: transactions, in block order
+        """
+        return [
+            Tx.from_bytes(base64.b64decode(tx), lazy=lazy)
+            for tx in await self._block_txs(height)
+        ]
 
 
 class TxAPI(AsyncTxAPI):
     @sync_bind(AsyncTxAPI.tx_info)
-    def tx_info(self, tx_hash: str) -> TxInfo:
+    def tx_info(self, tx_hash: str, lazy: bool = False) -> TxInfo:
         pass
 
     tx_info.__doc__ = AsyncTxAPI.tx_info.__doc__
@@ -400,6 +553,17 @@ class TxAPI(AsyncTxAPI):
 
     estimate_fee.__doc__ = AsyncTxAPI.estimate_fee.__doc__
 
+    @sync_bind(AsyncTxAPI.estimate_fees)
+    def estimate_fees(
+        self,
+        signers: List[SignerOptions],
+        options_list: List[CreateTxOptions],
+        max_concurrency: int = 8,
+    ) -> List[Fee]:
+        pass
+
+    estimate_fees.__doc__ = AsyncTxAPI.estimate_fees.__doc__
+
     @sync_bind(AsyncTxAPI.estimate_gas)
     def estimate_gas(
         self, tx: Tx, options: Optional[CreateTxOptions]
@@ -457,7 +621,20 @@ class TxAPI(AsyncTxAPI):
     search.__doc__ = AsyncTxAPI.search.__doc__
 
     @sync_bind(AsyncTxAPI.tx_infos_by_height)
-    def tx_infos_by_height(self, height: Optional[int] = None) -> List[TxInfo]:
+    def tx_infos_by_height(
+        self,
+        height: Optional[int] = None,
+        max_concurrency: int = 16,
+        lazy: bool = False,
+    ) -> List[TxInfo]:
         pass
 
     tx_infos_by_height.__doc__ = AsyncTxAPI.tx_infos_by_height.__doc__
+
+    @sync_bind(AsyncTxAPI.txs_by_height)
+    def txs_by_height(
+        self, height: Optional[int] = None, lazy: bool = False
+    ) -> List[Tx]:
+        pass
+
+    txs_by_height.__doc__ = AsyncTxAPI.txs_by_height.__doc__
@@ -0,0 +1,260 @@
+"""HTTP transport shared by the chain-specific LCD clients."""
+
+import asyncio
+import copy
+import time
+from asyncio import AbstractEventLoop, get_event_loop
+from json import JSONDecodeError
+from typing import Any, Iterable, List, Optional, Union
+
+from aiohttp import ClientConnectorError, ClientError
+from multidict import CIMultiDict
+
+from cosmos_sdk.exceptions import LCDResponseError
+from cosmos_sdk.util.json import dict_to_data
+from cosmos_sdk.util.url import urljoin
+
+from .batch import BatchResult, Query, run_batch
+from .cache import ResponseCache, freeze_params
+from .connection import ConnectionOptions, create_session
+from .endpoints import EndpointPool
+from .params import APIParams
+from .singleflight import SingleFlight
+from .transport import TransportPolicy
+
+__all__ = ["BaseAsyncLCDClient", "BLOCK_HEIGHT_HEADER", "QUERY_HEIGHT_HEADER"]
+
+BLOCK_HEIGHT_HEADER = "Grpc-Metadata-X-Cosmos-Block-Height"
+"""Response header carrying the block height a query was served at."""
+
+QUERY_HEIGHT_HEADER = "x-cosmos-block-height"
+"""Request header asking the node to serve a query at a given block height."""
+
+
+class BaseAsyncLCDClient:
+    """Owns the HTTP session of an LCD client and sends its requests to the healthiest
+    of the configured endpoints, failing over to the others when one is unreachable or
+    answers with a server error. Requests that failed on every endpoint are retried as
+    allowed by the client's :class:`TransportPolicy`. Identical GET requests made while
+    one is already in flight share its response (see :class:`SingleFlight`).
+
+    Args:
+        url (Union[str, List[str]]): URL of the LCD server, or a list of URLs of LCD
+            servers for the same chain
+        loop (AbstractEventLoop, optional): event loop
+        connection_options (ConnectionOptions, optional): connection pool options
+        cache (ResponseCache, optional): cache for GET responses, disabled by default
+        transport (TransportPolicy, optional): timeouts, retries and rate limiting.
+            Uses :class:`TransportPolicy` defaults if not provided.
+    """
+
+    def __init__(
+        self,
+        url: Union[str, List[str]],
+        loop: Optional[AbstractEventLoop] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        cache: Optional[ResponseCache] = None,
+        transport: Optional[TransportPolicy] = None,
+        _create_session: bool = True,  # don't create a session (used for sync LCDClient)
+    ):
+        if loop is None:
+            loop = get_event_loop()
+        self.loop = loop
+        self.connection_options = connection_options
+        if _create_session:
+            self.session = create_session(self.loop, self.connection_options)
+
+        self.endpoints = EndpointPool([url] if isinstance(url, str) else list(url))
+        self.url = self.endpoints.urls[0]
+        self.last_request_height = None
+        self.cache = cache
+        self.transport = transport or TransportPolicy()
+        self.retries = 0
+        self.pinned_height: Optional[int] = None
+        self.single_flight: Optional[SingleFlight] = SingleFlight()
+
+    async def _send(self, method: str, endpoint: str, kwargs: dict):
+        # only requests without side effects are sent to another node after the node
+        # answered with a server error, or may have received them
+        idempotent = method == "GET"
+        limiter = self.transport.rate_limiter
+        error: Optional[Exception] = None
+        for node in self.endpoints.candidates():
+            if limiter is not None:
+                await limiter.acquire()
+            start = time.monotonic()
+            try:
+                async with self.session.request(
+                    method,
+                    urljoin(node.url, endpoint),
+                    timeout=self.transport.client_timeout(),
+                    **kwargs,
+                ) as response:
+                    try:
+                        result = await response.json(content_type=None)
+                    except JSONDecodeError:
+                        result = None
+            except ClientConnectorError as e:
+                # the connection failed, the request was never sent
+                self.endpoints.record_failure(node)
+                error = e
+                continue
+            except (ClientError, asyncio.TimeoutError) as e:
+                # the node may have received the request, e.g. a broadcast transaction
+                self.endpoints.record_failure(node)
+                if not idempotent:
+                    raise
+                error = e
+                continue
+
+            if 200 <= response.status < 299:
+                self.endpoints.record_success(node, time.monotonic() - start)
+                self.last_request_height = (
+                    (result.get("height") or response.headers.get(BLOCK_HEIGHT_HEADER))
+                    if result
+                    else self.last_request_height
+                )
+                if self.cache is not None:
+                    self.cache.observe_height(self.last_request_height)
+                return result
+
+            if result is None:
+                error = LCDResponseError(
+                    message=str(response.reason), response=response
+                )
+            else:
+                if method == "POST" and isinstance(result, dict):
+                    message = result.get("message")
+                else:
+                    message = str(result)
+                error = LCDResponseError(message=message, response=response)
+
+            if response.status == 429:
+                # the node is rate limiting, not unhealthy: try another one
+                continue
+            if response.status < 500:
+                self.endpoints.record_success(node, time.monotonic() - start)
+                raise error
+            self.endpoints.record_failure(node)
+            if not idempotent:
+                raise error
+        raise error
+
+    def at_height(self, height: int):
+        """Creates a view of the client whose queries are all served at block ``height``,
+        so that results of several modules reflect the same state. The view shares the
+        client's session, endpoints, cache and transport; closing it closes the client.
+
+        >>> snapshot = terra.at_height(5000000)
+        >>> balance, delegations = await asyncio.gather(
+        ...     snapshot.bank.balance(address),
+        ...     snapshot.staking.delegations(delegator=address),
+        ... )
+
+        Args:
+            height (int): block height to query at
+
+        Returns:
+            a client of the same type, pinned to ``height``
+        """
+        height = int(height)
+        if height < 1:
+            raise ValueError("height must be positive")
+        view = copy.copy(self)
+        view.pinned_height = height
+        # module APIs hold a reference to their client, they must point to the view
+        for name, value in vars(self).items():
+            if getattr(value, "_c", None) is self:
+                api = copy.copy(value)
+                api._c = view
+                setattr(view, name, api)
+        return view
+
+    async def _request(self, method: str, endpoint: str, **kwargs):
+        if method == "GET" and self.pinned_height is not None:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                QUERY_HEIGHT_HEADER: str(self.pinned_height),
+            }
+        transport = self.transport
+        transport.retry_budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return await self._send(method, endpoint, kwargs)
+            except (ClientError, asyncio.TimeoutError, LCDResponseError) as e:
+                delay = transport.retry_delay(method, e, attempt)
+                if delay is None or not transport.retry_budget.withdraw():
+                    raise
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[Union[APIParams, CIMultiDict, list, dict]] = None,
+        # raw: bool = False
+    ):
+        if (
+            params
+            and hasattr(params, "to_dict")
+            and callable(getattr(params, "to_dict"))
+        ):
+            params = params.to_dict()
+        if self.cache is not None:
+            result = self.cache.get(endpoint, params, self.pinned_height)
+            if result is not None:
+                return result
+        if self.single_flight is None:
+            return await self._fetch(endpoint, params)
+        return await self.single_flight.do(
+            (endpoint, freeze_params(params), self.pinned_height),
+            lambda: self._fetch(endpoint, params),
+        )
+
+    async def _fetch(self, endpoint: str, params: Any):
+        result = await self._request("GET", endpoint, params=params)
+        if self.cache is not None:
+            self.cache.put(
+                endpoint, params, result, self.last_request_height, self.pinned_height
+            )
+        return result
+
+    async def _post(
+        self, endpoint: str, data: Optional[dict] = None  # , raw: bool = False
+    ):
+        return await self._request("POST", endpoint, json=data and dict_to_data(data))
+
+    async def batch(
+        self, queries: Iterable[Query], max_concurrency: int = 8
+    ) -> List[BatchResult]:
+        """Runs many queries concurrently, with at most ``max_concurrency`` of them in
+        flight. A failing query does not cancel the others; its exception is returned
+        in its :class:`BatchResult` instead.
+
+        >>> results = await terra.batch(
+        ...     [partial(terra.bank.balance, address) for address in addresses],
+        ...     max_concurrency=16,
+        ... )
+
+        Args:
+            queries (Iterable[Query]): awaitables, or callables taking no argument such as
+                ``functools.partial(terra.bank.balance, address)``
+            max_concurrency (int, optional): maximum number of queries in flight.
+                Defaults to 8.
+
+        Returns:
+            List[BatchResult]: outcome of every query, in the order they were given
+        """
+        return await run_batch(queries, max_concurrency)
+
+    async def close(self):
+        """Closes the client's HTTP session and its pooled connections."""
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,77 @@
+"""Concurrent execution of many LCD queries."""
+
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Union
+
+import attr
+import wrapt
+
+from .api._base import BaseAsyncAPI
+
+__all__ = ["BatchResult", "run_batch"]
+
+Query = Union[Awaitable[Any], Callable[[], Any]]
+
+
+@attr.s
+class BatchResult:
+    """Outcome of a single query of a batch."""
+
+    result: Any = attr.ib(default=None)
+    """Value returned by the query, ``None`` if it failed."""
+
+    error: Optional[Exception] = attr.ib(default=None)
+    """Exception raised by the query, ``None`` if it succeeded."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _start(query: Query) -> Awaitable[Any]:
+    if inspect.isawaitable(query):
+        return query
+
+    func, args, kwargs = query, (), {}
+    if isinstance(query, functools.partial):
+        func, args, kwargs = query.func, query.args, query.keywords
+
+    api = getattr(func, "__self__", None)
+    if isinstance(api, BaseAsyncAPI):
+        # call the asynchronous implementation, so that queries made through the
+        # synchronous APIs of LCDClient still run concurrently. Methods wrapped by
+        # sync_bind look like coroutine functions, so they are skipped explicitly.
+        for klass in type(api).__mro__:
+            method = klass.__dict__.get(func.__name__)
+            if asyncio.iscoroutinefunction(method) and not issubclass(
+                type(method), wrapt.FunctionWrapper
+            ):
+                return method(api, *args, **kwargs)
+    return BaseAsyncAPI._try_await(func(*args, **kwargs))
+
+
+async def run_batch(queries: Iterable[Query], max_concurrency: int) -> List[BatchResult]:
+    """Runs queries with at most ``max_concurrency`` of them in flight.
+
+    Args:
+        queries (Iterable[Query]): awaitables, or callables such as
+            ``functools.partial(terra.oracle.misses, address)``
+        max_concurrency (int): maximum number of queries running at the same time
+
+    Returns:
+        List[BatchResult]: outcome of every query, in the order they were given
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(query: Query) -> BatchResult:
+        async with semaphore:
+            try:
+                return BatchResult(result=await _start(query))
+            except Exception as e:
+                return BatchResult(error=e)
+
+    return await asyncio.gather(*[run(query) for query in queries])
@@ -0,0 +1,201 @@
+"""Opt-in cache for LCD GET responses."""
+
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import attr
+
+__all__ = ["CachePolicy", "ResponseCache", "DEFAULT_CACHE_POLICIES", "freeze_params"]
+
+
+@attr.s(frozen=True)
+class CachePolicy:
+    """How long a cached response stays valid.
+
+    Args:
+        ttl (float, optional): seconds the response stays valid. ``None`` means the
+            response does not expire with time.
+        until_next_block (bool, optional): the response is only valid until a response
+            for a later block height is seen. Defaults to False.
+    """
+
+    ttl: Optional[float] = attr.ib(default=None)
+    until_next_block: bool = attr.ib(default=False)
+
+
+DEFAULT_CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "/cosmos/*/v1beta1/params": CachePolicy(ttl=600),
+    "/cosmos/gov/v1beta1/params/*": CachePolicy(ttl=600),
+    "/terra/*/v1beta1/params": CachePolicy(ttl=600),
+    "/terra/treasury/v1beta1/tax_rate": CachePolicy(ttl=60, until_next_block=True),
+    "/terra/oracle/v1beta1/denoms/actives": CachePolicy(
+        ttl=60, until_next_block=True
+    ),
+    "/cosmos/staking/v1beta1/pool": CachePolicy(ttl=60, until_next_block=True),
+}
+"""Policies for responses that only change through governance or at most once a block."""
+
+
+@attr.s
+class _Entry:
+    result: Any = attr.ib()
+    expires_at: Optional[float] = attr.ib()
+    height: Optional[int] = attr.ib()
+
+
+def freeze_params(params: Any) -> Hashable:
+    """Converts query parameters into a hashable key."""
+    if not params:
+        return ()
+    if isinstance(params, dict):
+        items = sorted(params.items(), key=lambda item: item[0])
+    elif hasattr(params, "items"):
+        items = params.items()
+    else:
+        items = params
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in items
+    )
+
+
+def _to_height(height: Any) -> Optional[int]:
+    try:
+        return int(height)
+    except (TypeError, ValueError):
+        return None
+
+
+class ResponseCache:
+    """LRU cache of LCD GET responses, keyed by endpoint, query parameters and pinned
+    block height.
+
+    Only endpoints matching one of the ``policies`` patterns (``fnmatch`` syntax) are
+    cached. Responses with ``until_next_block`` policies are dropped as soon as the
+    client sees a response for a later block height. Cached results are shared between
+    callers and must not be mutated.
+
+    >>> terra = AsyncLCDClient(url, chain_id, cache=ResponseCache(max_size=512))
+    >>> await terra.mint.parameters()
+    >>> terra.cache.hits, terra.cache.misses
+    (0, 1)
+
+    Args:
+        policies (Dict[str, CachePolicy], optional): endpoint patterns and their
+            policies. Defaults to :data:`DEFAULT_CACHE_POLICIES`.
+        max_size (int, optional): maximum number of cached responses. Defaults to 1024.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, CachePolicy]] = None,
+        max_size: int = 1024,
+    ):
+        self.policies = DEFAULT_CACHE_POLICIES if policies is None else policies
+        self.max_size = max_size
+        self.height: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple, _Entry]" = OrderedDict()
+
+    def policy(self, endpoint: str) -> Optional[CachePolicy]:
+        """Finds the policy for an endpoint, ``None`` if it is not cached."""
+        for pattern, policy in self.policies.items():
+            if fnmatchcase(endpoint, pattern):
+                return policy
+        return None
+
+    def observe_height(self, height: Any):
+        """Records the block height of a response. Entries valid only until the next
+        block become stale once a later height is observed."""
+        height = _to_height(height)
+        if height is not None and (self.height is None or height > self.height):
+            self.height = height
+
+    def _is_valid(self, entry: _Entry) -> bool:
+        if entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+            return False
+        if entry.height is not None and self.height is not None:
+            return self.height <= entry.height
+        return True
+
+    def get(
+        self, endpoint: str, params: Any = None, pinned_height: Optional[int] = None
+    ) -> Any:
+        """Looks up a cached response.
+
+        Args:
+            endpoint (str): requested endpoint
+            params (Any, optional): query parameters of the request
+            pinned_height (int, optional): block height the request was pinned to
+
+        Returns:
+            Any: the cached result, or ``None`` on a miss
+        """
+        if self.policy(endpoint) is None:
+            return None
+        key = (endpoint, freeze_params(params), pinned_height)
+        entry = self._entries.get(key)
+        if entry is not None and self._is_valid(entry):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.result
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        endpoint: str,
+        params: Any,
+        result: Any,
+        height: Any = None,
+        pinned_height: Optional[int] = None,
+    ):
+        """Stores a response if the endpoint has a cache policy.
+
+        Args:
+            endpoint (str): requested endpoint
+            params (Any): query parameters of the request
+            result (Any): response to cache
+            height (Any, optional): block height of the response. Defaults to the
+                latest observed height.
+            pinned_height (int, optional): block height the request was pinned to.
+                Responses for a pinned height do not go stale with new blocks.
+        """
+        policy = self.policy(endpoint)
+        if policy is None:
+            return
+        if pinned_height is not None:
+            height = None
+        elif policy.until_next_block:
+            height = _to_height(height)
+            if height is None:
+                height = self.height
+            if height is None and policy.ttl is None:
+                return  # no way to tell when the response becomes stale
+        else:
+            height = None
+        expires_at = None if policy.ttl is None else time.monotonic() + policy.ttl
+        key = (endpoint, freeze_params(params), pinned_height)
+        self._entries[key] = _Entry(result, expires_at, height)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drops every cached response. Counters are kept."""
+        self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,63 @@
+"""Connection pool configuration shared by the LCD clients."""
+
+from asyncio import AbstractEventLoop
+from typing import Optional
+
+import attr
+from aiohttp import ClientSession, TCPConnector
+
+__all__ = ["ConnectionOptions", "create_session"]
+
+
+@attr.s
+class ConnectionOptions:
+    """Options for the keep-alive connection pool owned by an LCD client.
+
+    Args:
+        limit (int, optional): total number of simultaneous connections. ``0`` means
+            no limit. Defaults to 100.
+        limit_per_host (int, optional): number of simultaneous connections to a single
+            endpoint. ``0`` means no limit. Defaults to 0.
+        use_dns_cache (bool, optional): cache resolved host names. Defaults to True.
+        ttl_dns_cache (int, optional): seconds a DNS lookup stays cached, ``None`` caches
+            forever. Defaults to 300.
+        keepalive_timeout (float, optional): seconds an idle connection is kept open
+            for reuse. Defaults to 30.
+    """
+
+    limit: int = attr.ib(default=100)
+    limit_per_host: int = attr.ib(default=0)
+    use_dns_cache: bool = attr.ib(default=True)
+    ttl_dns_cache: Optional[int] = attr.ib(default=300)
+    keepalive_timeout: float = attr.ib(default=30)
+
+    def create_connector(self, loop: AbstractEventLoop) -> TCPConnector:
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout,
+            loop=loop,
+        )
+
+
+def create_session(
+    loop: AbstractEventLoop, options: Optional[ConnectionOptions] = None
+) -> ClientSession:
+    """Creates the HTTP session used by an LCD client.
+
+    Args:
+        loop (AbstractEventLoop): event loop the session is bound to
+        options (ConnectionOptions, optional): connection pool options. Uses
+            :class:`ConnectionOptions` defaults if not provided.
+
+    Returns:
+        ClientSession: session with a pooled, keep-alive connector
+    """
+    options = options or ConnectionOptions()
+    return ClientSession(
+        headers={"Accept": "application/json"},
+        connector=options.create_connector(loop),
+        loop=loop,
+    )
@@ -0,0 +1,112 @@
+"""Health-scored selection of LCD endpoints."""
+
+import random
+import time
+from typing import List
+
+import attr
+
+__all__ = ["Endpoint", "EndpointPool"]
+
+
+@attr.s
+class Endpoint:
+    """Running health statistics of a single LCD endpoint."""
+
+    url: str = attr.ib()
+    """Base URL of the LCD server."""
+
+    latency: float = attr.ib(default=0.0)
+    """Moving average of the response time, in seconds."""
+
+    error_rate: float = attr.ib(default=0.0)
+    """Moving average of failed requests, between 0 and 1."""
+
+    failures: int = attr.ib(default=0)
+    """Number of consecutive failed requests."""
+
+    ejected_until: float = attr.ib(default=0.0)
+    """Monotonic time until which the endpoint is only used as a last resort."""
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+
+class EndpointPool:
+    """Spreads requests across several LCD endpoints that serve the same chain.
+
+    Each request goes to the better of two randomly picked healthy endpoints, scored by
+    latency and error rate, and the remaining endpoints are ordered for failover. An
+    endpoint that fails ``max_failures`` times in a row is ejected for ``cooldown``
+    seconds, after which a single successful request restores it.
+
+    Args:
+        urls (List[str]): base URLs of the LCD servers
+        max_failures (int, optional): consecutive failures before ejection. Defaults to 3.
+        cooldown (float, optional): seconds an ejected endpoint is avoided. Defaults to 30.
+        error_penalty (float, optional): seconds of latency an error rate of 1 is worth
+            when scoring endpoints. Defaults to 1.
+        smoothing (float, optional): weight of the newest sample in the moving averages.
+            Defaults to 0.2.
+
+    Raises:
+        ValueError: if ``urls`` is empty
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        max_failures: int = 3,
+        cooldown: float = 30.0,
+        error_penalty: float = 1.0,
+        smoothing: float = 0.2,
+    ):
+        if not urls:
+            raise ValueError("at least one LCD endpoint url is required")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.error_penalty = error_penalty
+        self.smoothing = smoothing
+
+    @property
+    def urls(self) -> List[str]:
+        return [e.url for e in self.endpoints]
+
+    def score(self, endpoint: Endpoint) -> float:
+        """Score of an endpoint, lower is better."""
+        return endpoint.latency + endpoint.error_rate * self.error_penalty
+
+    def candidates(self) -> List[Endpoint]:
+        """Endpoints in the order they should be tried for the next request. Ejected
+        endpoints come last, so a request is still attempted if every endpoint is down.
+        """
+        now = time.monotonic()
+        healthy = sorted(
+            (e for e in self.endpoints if e.is_healthy(now)), key=self.score
+        )
+        ejected = sorted(
+            (e for e in self.endpoints if not e.is_healthy(now)),
+            key=lambda e: e.ejected_until,
+        )
+        if len(healthy) > 1:
+            a, b = random.sample(healthy, 2)
+            first = a if self.score(a) <= self.score(b) else b
+            healthy.remove(first)
+            healthy.insert(0, first)
+        return healthy + ejected
+
+    def record_success(self, endpoint: Endpoint, latency: float):
+        if endpoint.latency == 0:
+            endpoint.latency = latency
+        else:
+            endpoint.latency += self.smoothing * (latency - endpoint.latency)
+        endpoint.error_rate *= 1 - self.smoothing
+        endpoint.failures = 0
+        endpoint.ejected_until = 0.0
+
+    def record_failure(self, endpoint: Endpoint):
+        endpoint.error_rate += self.smoothing * (1 - endpoint.error_rate)
+        endpoint.failures += 1
+        if endpoint.failures >= self.max_failures:
+            endpoint.ejected_until = time.monotonic() + self.cooldown
@@ -0,0 +1,170 @@
+"""Pipelined following of the chain, block by block."""
+
+import asyncio
+import base64
+from asyncio import AbstractEventLoop
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from cosmos_sdk.core.tx import Tx
+
+__all__ = ["BlockFollower", "decode_block_txs"]
+
+Block = Tuple[int, dict, List[Tx]]
+
+
+def decode_block_txs(txs: List[str], lazy: bool = False) -> List[Tx]:
+    """Decodes the base64 encoded transactions of a block, lazily if ``lazy``."""
+    return [Tx.from_bytes(base64.b64decode(tx), lazy=lazy) for tx in txs]
+
+
+def _height(block: dict) -> int:
+    return int(block["block"]["header"]["height"])
+
+
+class BlockFollower:
+    """Yields ``(height, block, txs)`` for every block from a start height, in order,
+    then keeps following the tip of the chain.
+
+    Up to ``prefetch`` blocks are requested concurrently while catching up. Once the tip
+    is reached, the latest block is polled: the polling interval grows while no new
+    block shows up and shrinks again when one does. Transactions are decoded in
+    ``executor`` so that decoding does not block the event loop.
+
+    Supports ``async for`` with :class:`AsyncLCDClient` and ``for`` with :class:`LCDClient`.
+
+    >>> async for height, block, txs in terra.tendermint.follow_blocks(start_height=100):
+    ...     print(height, len(txs))
+
+    Args:
+        fetch (Callable[[Optional[int]], Awaitable[dict]]): coroutine function fetching
+            the block at a height, or the latest block for ``None``
+        loop (AbstractEventLoop): event loop
+        start_height (int, optional): first block to yield. Starts from the latest block
+            if not provided.
+        stop_height (int, optional): last block to yield. Follows the chain forever if
+            not provided.
+        prefetch (int, optional): maximum number of blocks requested ahead. Defaults to 8.
+        min_poll_interval (float, optional): shortest wait, in seconds, between polls of
+            the latest block. Defaults to 0.5.
+        max_poll_interval (float, optional): longest wait, in seconds, between polls of
+            the latest block. Defaults to 6.
+        executor (Executor, optional): executor decoding transactions. Uses the loop's
+            default executor if not provided.
+        lazy (bool, optional): decode transactions lazily, see :meth:`Tx.from_bytes`.
+            Defaults to False.
+    """
+
+    height: Optional[int]
+    """Height of the last yielded block, ``None`` before the first one."""
+
+    poll_interval: float
+    """Current wait between polls of the latest block."""
+
+    def __init__(
+        self,
+        fetch: Callable[[Optional[int]], Awaitable[dict]],
+        loop: AbstractEventLoop,
+        start_height: Optional[int] = None,
+        stop_height: Optional[int] = None,
+        prefetch: int = 8,
+        min_poll_interval: float = 0.5,
+        max_poll_interval: float = 6.0,
+        executor: Optional[Executor] = None,
+        lazy: bool = False,
+    ):
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        self._fetch = fetch
+        self._loop = loop
+        self.start_height = start_height
+        self.stop_height = stop_height
+        self.prefetch = prefetch
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.executor = executor
+        self.lazy = lazy
+        self.height = None
+        self.poll_interval = min_poll_interval
+
+    async def _decode(self, block: dict) -> Block:
+        txs = block["block"]["data"].get("txs") or []
+        decoded = await self._loop.run_in_executor(
+            self.executor, partial(decode_block_txs, txs, self.lazy)
+        )
+        return _height(block), block, decoded
+
+    async def _load(self, height: int) -> Block:
+        return await self._decode(await self._fetch(height))
+
+    def _done(self, height: int) -> bool:
+        return self.stop_height is not None and height > self.stop_height
+
+    async def _poll(self, next_height: int) -> Tuple[int, dict]:
+        """Waits until a block at ``next_height`` or above exists. Returns the tip height
+        and the latest block."""
+        while True:
+            latest = await self._fetch(None)
+            tip = _height(latest)
+            if tip >= next_height:
+                self.poll_interval = max(self.min_poll_interval, self.poll_interval / 2)
+                return tip, latest
+            await asyncio.sleep(self.poll_interval)
+            self.poll_interval = min(self.max_poll_interval, self.poll_interval * 2)
+
+    async def _iterate(self) -> AsyncIterator[Block]:
+        latest = await self._fetch(None)
+        tip = _height(latest)
+        next_height = tip if self.start_height is None else self.start_height
+        pending: Deque[Tuple[int, asyncio.Future]] = deque()
+        try:
+            while not self._done(next_height):
+                if next_height > tip:
+                    tip, latest = await self._poll(next_height)
+
+                # the latest block was already fetched when polling, so it is reused
+                # instead of being requested again
+                last = tip if self.stop_height is None else min(tip, self.stop_height)
+                scheduled = pending[-1][0] if pending else next_height - 1
+                while scheduled < last and len(pending) < self.prefetch:
+                    scheduled += 1
+                    if scheduled == tip and latest is not None:
+                        task = self._decode(latest)
+                    else:
+                        task = self._load(scheduled)
+                    pending.append((scheduled, asyncio.ensure_future(task)))
+                latest = None
+
+                _, task = pending.popleft()
+                block = await task
+                self.height = next_height
+                next_height += 1
+                yield block
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    def __aiter__(self) -> AsyncIterator[Block]:
+        return self._iterate()
+
+    def __iter__(self) -> Iterator[Block]:
+        blocks = self._iterate()
+        try:
+            while True:
+                try:
+                    yield self._loop.run_until_complete(blocks.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._loop.run_until_complete(blocks.aclose())
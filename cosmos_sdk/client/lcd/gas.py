@@ -0,0 +1,187 @@
+"""Gas estimation strategies for transactions."""
+
+import json
+import math
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, List, Optional, Tuple
+
+import attr
+
+from cosmos_sdk.core.msg import Msg
+from cosmos_sdk.core.tx import Tx
+
+__all__ = ["GasEstimator", "CachingGasEstimator", "fingerprint"]
+
+Simulate = Callable[[], Awaitable[int]]
+
+
+def _execute_msg_key(execute_msg: Any) -> Optional[Tuple[str, ...]]:
+    if isinstance(execute_msg, str):
+        try:
+            execute_msg = json.loads(execute_msg)
+        except ValueError:
+            return None
+    if isinstance(execute_msg, dict):
+        return tuple(sorted(execute_msg))
+    return None
+
+
+def _shape(msg: Msg) -> Hashable:
+    shape: List[Hashable] = [getattr(msg, "type_url", type(msg).__name__)]
+    if attr.has(type(msg)):
+        for field in attr.fields(type(msg)):
+            value = getattr(msg, field.name)
+            if field.name == "contract":
+                shape.append((field.name, value))
+            elif field.name == "execute_msg":
+                shape.append((field.name, _execute_msg_key(value)))
+            elif isinstance(value, (list, tuple)):
+                # Coins, MsgMultiSend inputs and outputs, ...
+                shape.append((field.name, len(value)))
+    return tuple(shape)
+
+
+def fingerprint(msgs: List[Msg]) -> Hashable:
+    """Shape of a list of messages: their types, the number of coins and items they
+    carry, and for contract executions the contract and the executed function. Messages
+    of the same shape are expected to use about the same gas.
+
+    Args:
+        msgs (List[Msg]): messages of a transaction
+
+    Returns:
+        Hashable: fingerprint of the messages
+    """
+    return tuple(_shape(msg) for msg in msgs)
+
+
+class GasEstimator:
+    """Estimates the gas used by transactions. The base implementation simulates every
+    transaction; subclasses may answer without simulating.
+
+    Set on a client with ``gas_estimator=``, it is used by
+    :meth:`AsyncTxAPI.estimate_gas` when no gas limit is given.
+    """
+
+    async def estimate(self, tx: Tx, simulate: Simulate) -> int:
+        """Estimates the gas used by ``tx``, before gas adjustment.
+
+        Args:
+            tx (Tx): transaction with empty signatures
+            simulate (Callable[[], Awaitable[int]]): simulates ``tx`` on the node and
+                returns the gas used
+
+        Returns:
+            int: estimated gas used
+        """
+        return await simulate()
+
+
+@attr.s
+class _ShapeModel:
+    """Least-squares fit of gas used against the transaction size."""
+
+    n: int = attr.ib(default=0)
+    sum_x: float = attr.ib(default=0.0)
+    sum_y: float = attr.ib(default=0.0)
+    sum_xx: float = attr.ib(default=0.0)
+    sum_xy: float = attr.ib(default=0.0)
+    margin: float = attr.ib(default=0.0)
+    estimates: int = attr.ib(default=0)
+
+    def add(self, x: int, y: int):
+        if self.n:
+            # keep the largest underestimation seen, so predictions stay on the safe side
+            self.margin = max(self.margin, y - self.fit(x))
+        self.n += 1
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_xx += x * x
+        self.sum_xy += x * y
+
+    def fit(self, x: int) -> float:
+        variance = self.n * self.sum_xx - self.sum_x ** 2
+        if variance <= 0:
+            return self.sum_y / self.n
+        slope = (self.n * self.sum_xy - self.sum_x * self.sum_y) / variance
+        return (self.sum_y - slope * self.sum_x) / self.n + slope * x
+
+    def predict(self, x: int) -> int:
+        return math.ceil(self.fit(x) + self.margin)
+
+
+class CachingGasEstimator(GasEstimator):
+    """Learns the gas used by each message shape (see :func:`fingerprint`) from
+    simulations, and skips the simulation once enough samples were seen.
+
+    Each shape gets a linear model of gas used against the transaction size, plus a
+    margin covering the largest underestimation seen. Shapes are simulated until
+    ``min_samples`` are collected, then once every ``sample_every`` estimations to
+    check the model and keep it up to date.
+
+    >>> terra = AsyncLCDClient(url, chain_id, gas_estimator=CachingGasEstimator())
+    >>> ...
+    >>> terra.gas_estimator.hit_rate, terra.gas_estimator.mean_error
+    (0.94, 0.003)
+
+    Args:
+        min_samples (int, optional): simulations of a shape before its model is used.
+            Defaults to 2.
+        sample_every (int, optional): simulate one estimation out of this many for
+            shapes with a model, ``0`` to never resample. Defaults to 50.
+        max_shapes (int, optional): maximum number of shapes remembered.
+            Defaults to 1024.
+    """
+
+    def __init__(self, min_samples: int = 2, sample_every: int = 50, max_shapes: int = 1024):
+        self.min_samples = max(1, min_samples)
+        self.sample_every = sample_every
+        self.max_shapes = max_shapes
+        self.hits = 0
+        self.misses = 0
+        self.checks = 0
+        self.total_error = 0.0
+        self.max_error = 0.0
+        self._models: "OrderedDict[Hashable, _ShapeModel]" = OrderedDict()
+
+    async def estimate(self, tx: Tx, simulate: Simulate) -> int:
+        key = fingerprint(tx.body.messages)
+        size = len(tx.to_bytes())
+        model = self._models.get(key)
+        if model is None:
+            model = self._models[key] = _ShapeModel()
+            while len(self._models) > self.max_shapes:
+                self._models.popitem(last=False)
+        self._models.move_to_end(key)
+
+        if model.n >= self.min_samples:
+            model.estimates += 1
+            if not self.sample_every or model.estimates % self.sample_every:
+                self.hits += 1
+                return model.predict(size)
+            # scheduled check of the model against the node
+            predicted = model.predict(size)
+            gas_used = await simulate()
+            error = abs(predicted - gas_used) / gas_used if gas_used else 0.0
+            self.checks += 1
+            self.total_error += error
+            self.max_error = max(self.max_error, error)
+        else:
+            gas_used = await simulate()
+        self.misses += 1
+        model.add(size, gas_used)
+        return gas_used
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of estimations answered without simulating."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def mean_error(self) -> float:
+        """Mean relative error of the models, measured by the scheduled checks."""
+        return self.total_error / self.checks if self.checks else 0.0
+
+    def __len__(self) -> int:
+        return len(self._models)
@@ -36,19 +36,10 @@ class AsyncLCDUtils(BaseAsyncAPI):
         validator_set_response = await BaseAsyncAPI._try_await(
             self._c.tendermint.validator_set()
         )
-        next_key = ""
-        while True:
-            from cosmos_sdk.client.lcd import PaginationOptions
-
-            validators, pag = await BaseAsyncAPI._try_await(
-                self._c.staking.validators(PaginationOptions(key=next_key))
-            )
-            validator_set: Dict[str, Any] = reduce(
-                index_by_pub_key, validator_set_response["validators"], {}
-            )
-            if pag is None or pag["next_key"] is None:
-                break
-            next_key = pag["next_key"]
+        validator_set: Dict[str, Any] = reduce(
+            index_by_pub_key, validator_set_response["validators"], {}
+        )
+        validators = [v async for v in self._c.staking.iter_validators()]
         res = {}
         for v in validators:
             delegate_info = validator_set.get(v.consensus_pubkey["key"])
@@ -73,4 +64,6 @@ class LCDUtils(AsyncLCDUtils):
     async def validators_with_voting_power(self) -> Dict[str, dict]:
         pass
 
-    validators_with_voting_power.__doc__ = AsyncLCDUtils.calculate_tax.__doc__
+    validators_with_voting_power.__doc__ = (
+        AsyncLCDUtils.validators_with_voting_power.__doc__
+    )
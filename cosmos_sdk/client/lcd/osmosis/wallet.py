@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from typing import Optional, Tuple
+
+import attr
+
+from cosmos_sdk.core.broadcast import BlockTxBroadcastResult, SyncTxBroadcastResult
 from cosmos_sdk.key.osmosis.key import Key, SignOptions
 
-from ..api.tx import CreateTxOptions, SignerOptions
+from ..api.auth import AsyncAuthAPI
+from ..api.tx import BroadcastOptions, CreateTxOptions, SignerOptions
+from ..sequence import SequenceManager
 
 __all__ = ["Wallet", "AsyncWallet"]
 
@@ -13,6 +20,11 @@ class AsyncWallet:
     def __init__(self, lcd, key: Key):
         self.lcd = lcd
         self.key = key
+        self.sequences = SequenceManager(self._fetch_account)
+
+    async def _fetch_account(self) -> Tuple[int, int]:
+        res = await self.lcd.auth.account_info(self.key.acc_address)
+        return res.get_account_number(), res.get_sequence()
 
     async def account_number(self) -> int:
         res = await self.lcd.auth.account_info(self.key.acc_address)
@@ -39,35 +51,70 @@ class AsyncWallet:
     async def create_and_sign_tx(self, options: CreateTxOptions) -> Tx:
         account_number = options.account_number
         sequence = options.sequence
-        if account_number is None or sequence is None:
-            res = await self.account_number_and_sequence()
+        managed: Optional[int] = None
+        if sequence is None:
+            managed_account_number, sequence = await self.sequences.acquire()
+            managed = sequence
             if account_number is None:
-                account_number = res.get("account_number")
-            if sequence is None:
-                sequence = res.get("sequence")
-        options.sequence = sequence
-        options.account_number = account_number
-        return self.key.sign_tx(
-            tx=(await self.create_tx(options)),
-            options=SignOptions(
-                account_number=account_number,
-                sequence=sequence,
-                chain_id=self.lcd.chain_id,
-                sign_mode=options.sign_mode
-                if options.sign_mode
-                else SignMode.SIGN_MODE_DIRECT,
-            ),
+                account_number = managed_account_number
+        elif account_number is None:
+            account_number = await self.sequences.get_account_number()
+        options = attr.evolve(
+            options, account_number=account_number, sequence=sequence
         )
+        try:
+            return self.key.sign_tx(
+                tx=(await self.create_tx(options)),
+                options=SignOptions(
+                    account_number=account_number,
+                    sequence=sequence,
+                    chain_id=self.lcd.chain_id,
+                    sign_mode=options.sign_mode
+                    if options.sign_mode
+                    else SignMode.SIGN_MODE_DIRECT,
+                ),
+            )
+        except BaseException:
+            if managed is not None:
+                self.sequences.release(managed)
+            raise
+
+    async def broadcast_sync(
+        self, tx: Tx, options: BroadcastOptions = None
+    ) -> SyncTxBroadcastResult:
+        result = await self.lcd.tx.broadcast_sync(tx, options)
+        self.sequences.observe(result)
+        return result
+
+    async def broadcast(
+        self, tx: Tx, options: BroadcastOptions = None
+    ) -> BlockTxBroadcastResult:
+        result = await self.lcd.tx.broadcast(tx, options)
+        self.sequences.observe(result)
+        return result
 
 
 class Wallet:
     """Wraps around a :class:`Key` implementation and provides transaction building and
     signing functionality. It is recommended to create this object through
-    :meth:`LCDClient.wallet()<terra_sdk.client.lcd.LCDClient.wallet>`."""
+    :meth:`LCDClient.wallet()<terra_sdk.client.lcd.LCDClient.wallet>`.
+
+    The account number and sequence are fetched once and then tracked locally by
+    :attr:`sequences`, so transactions signed back-to-back get consecutive sequences.
+    Broadcasting through the wallet resyncs the sequence when the chain rejects a
+    transaction for a sequence mismatch."""
+
+    sequences: SequenceManager
+    """Account number and sequence tracker of the wallet's account."""
 
     def __init__(self, lcd, key: Key):
         self.lcd = lcd
         self.key = key
+        self.sequences = SequenceManager(self._fetch_account)
+
+    async def _fetch_account(self) -> Tuple[int, int]:
+        res = await AsyncAuthAPI.account_info(self.lcd.auth, self.key.acc_address)
+        return res.get_account_number(), res.get_sequence()
 
     def account_number(self) -> int:
         """Fetches account number for the account associated with the Key."""
@@ -108,7 +155,8 @@ class Wallet:
     def create_and_sign_tx(self, options: CreateTxOptions) -> Tx:
         """Creates and signs a :class:`Tx` object in a single step. This is the recommended
         method for preparing transaction for immediate signing and broadcastring. The transaction
-        is generated exactly as :meth:`create_tx`.
+        is generated exactly as :meth:`create_tx`. Unless provided in ``options``, the
+        account number and sequence come from :attr:`sequences`.
 
         Args:
             options (CreateTxOptions): Options to create a tx
@@ -119,22 +167,68 @@ class Wallet:
 
         account_number = options.account_number
         sequence = options.sequence
-        if account_number is None or sequence is None:
-            res = self.account_number_and_sequence()
+        managed: Optional[int] = None
+        if sequence is None:
+            managed_account_number, sequence = self.lcd.loop.run_until_complete(
+                self.sequences.acquire()
+            )
+            managed = sequence
             if account_number is None:
-                account_number = res.get("account_number")
-            if sequence is None:
-                sequence = res.get("sequence")
-        options.sequence = sequence
-        options.account_number = account_number
-        return self.key.sign_tx(
-            tx=self.create_tx(options),
-            options=SignOptions(
-                account_number=account_number,
-                sequence=sequence,
-                chain_id=self.lcd.chain_id,
-                sign_mode=options.sign_mode
-                if options.sign_mode
-                else SignMode.SIGN_MODE_DIRECT,
-            ),
+                account_number = managed_account_number
+        elif account_number is None:
+            account_number = self.lcd.loop.run_until_complete(
+                self.sequences.get_account_number()
+            )
+        options = attr.evolve(
+            options, account_number=account_number, sequence=sequence
         )
+        try:
+            return self.key.sign_tx(
+                tx=self.create_tx(options),
+                options=SignOptions(
+                    account_number=account_number,
+                    sequence=sequence,
+                    chain_id=self.lcd.chain_id,
+                    sign_mode=options.sign_mode
+                    if options.sign_mode
+                    else SignMode.SIGN_MODE_DIRECT,
+                ),
+            )
+        except BaseException:
+            if managed is not None:
+                self.sequences.release(managed)
+            raise
+
+    def broadcast_sync(
+        self, tx: Tx, options: BroadcastOptions = None
+    ) -> SyncTxBroadcastResult:
+        """Broadcasts a transaction signed by the wallet using the ``sync`` broadcast
+        mode, resyncing the sequence if it was rejected for a sequence mismatch.
+
+        Args:
+            tx (Tx): transaction to broadcast
+            options (BroadcastOptions): broacast options, optional
+
+        Returns:
+            SyncTxBroadcastResult: result
+        """
+        result = self.lcd.tx.broadcast_sync(tx, options)
+        self.sequences.observe(result)
+        return result
+
+    def broadcast(
+        self, tx: Tx, options: BroadcastOptions = None
+    ) -> BlockTxBroadcastResult:
+        """Broadcasts a transaction signed by the wallet using the ``block`` broadcast
+        mode, resyncing the sequence if it was rejected for a sequence mismatch.
+
+        Args:
+            tx (Tx): transaction to broadcast
+            options (BroadcastOptions): broacast options, optional
+
+        Returns:
+            BlockTxBroadcastResult: result
+        """
+        result = self.lcd.tx.broadcast(tx, options)
+        self.sequences.observe(result)
+        return result
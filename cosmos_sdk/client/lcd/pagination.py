@@ -0,0 +1,96 @@
+"""Iteration over paginated LCD queries."""
+
+import asyncio
+from asyncio import AbstractEventLoop
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple
+
+from .params import PaginationOptions
+
+__all__ = ["Paginator"]
+
+
+class Paginator:
+    """Iterates over every item of a paginated query. The next page is requested as soon
+    as the current one arrives, so it is usually ready by the time the current page has
+    been consumed.
+
+    Supports ``async for`` with :class:`AsyncLCDClient` and ``for`` with :class:`LCDClient`.
+
+    >>> async for validator in terra.staking.iter_validators(page_size=50):
+    ...     print(validator.operator_address)
+
+    Iteration can be resumed from :attr:`cursor`, the key of the page being consumed.
+    Items of that page already seen are returned again after resuming.
+
+    >>> terra.staking.iter_validators(key=saved_cursor)
+
+    Args:
+        fetch (Callable[[PaginationOptions], Awaitable[Tuple[List, dict]]]): coroutine
+            function fetching a page, returning its items and pagination info
+        loop (AbstractEventLoop): event loop driving synchronous iteration
+        page_size (int, optional): number of items per page. Uses the node's default if
+            not provided.
+        key (str, optional): key of the page to start from
+        prefetch (bool, optional): request the next page while the current one is being
+            consumed. Defaults to True.
+    """
+
+    cursor: Optional[str]
+    """Key of the page currently being consumed, ``None`` before the first page and after
+    the last one."""
+
+    exhausted: bool
+    """Whether every page has been consumed."""
+
+    def __init__(
+        self,
+        fetch: Callable[[PaginationOptions], Awaitable[Tuple[List[Any], dict]]],
+        loop: AbstractEventLoop,
+        page_size: Optional[int] = None,
+        key: Optional[str] = None,
+        prefetch: bool = True,
+    ):
+        self._fetch = fetch
+        self._loop = loop
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.cursor = key
+        self.exhausted = False
+
+    def _request(self, key: Optional[str]) -> asyncio.Future:
+        return asyncio.ensure_future(
+            self._fetch(PaginationOptions(key=key, limit=self.page_size))
+        )
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        pending: Optional[asyncio.Future] = self._request(self.cursor)
+        try:
+            while pending is not None:
+                items, pagination = await pending
+                pending = None
+                next_key = pagination.get("next_key") if pagination else None
+                if next_key and self.prefetch:
+                    pending = self._request(next_key)
+                for item in items:
+                    yield item
+                self.cursor = next_key
+                if next_key and pending is None:
+                    pending = self._request(next_key)
+            self.exhausted = True
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    def __iter__(self) -> Iterator[Any]:
+        items = self._iterate()
+        try:
+            while True:
+                try:
+                    yield self._loop.run_until_complete(items.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._loop.run_until_complete(items.aclose())
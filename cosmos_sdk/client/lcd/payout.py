@@ -0,0 +1,400 @@
+"""Packing of bulk payouts into as few transactions as possible."""
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import attr
+
+from cosmos_sdk.core import (
+    AccAddress,
+    Coin,
+    Coins,
+    ModeInfo,
+    ModeInfoSingle,
+    PublicKey,
+    SimplePublicKey,
+)
+from cosmos_sdk.core.bank import MsgMultiSend, MsgSend, MultiSendInput, MultiSendOutput
+from cosmos_sdk.core.fee import Fee
+from cosmos_sdk.core.msg import Msg
+from cosmos_sdk.core.tx import AuthInfo, SignerInfo, SignMode, Tx, TxBody, TxInfo
+from cosmos_sdk.key.batch import sign_txs_async
+from cosmos_sdk.key.terra.key import SignOptions
+
+__all__ = ["PayoutBuilder", "aggregate_payouts"]
+
+Payout = Tuple[AccAddress, Coins.Input]
+
+SIGNATURE_SIZE = 64
+"""Size of a secp256k1 signature."""
+
+
+def aggregate_payouts(payouts: Iterable[Payout]) -> "OrderedDict[str, Coins]":
+    """Sums the payouts to the same address, keeping the order of first appearance.
+    Empty and zero amounts are dropped.
+
+    Args:
+        payouts (Iterable[Tuple[AccAddress, Coins.Input]]): recipients and amounts
+
+    Returns:
+        OrderedDict[str, Coins]: total amount per recipient
+    """
+    totals: "OrderedDict[str, Dict[str, Coin]]" = OrderedDict()
+    for address, amount in payouts:
+        coins = totals.setdefault(address, {})
+        for coin in Coins(amount):
+            total = coins.get(coin.denom)
+            coins[coin.denom] = coin if total is None else total + coin
+    aggregated: "OrderedDict[str, Coins]" = OrderedDict()
+    for address, coins in totals.items():
+        nonzero = [coin for coin in coins.values() if coin.amount != 0]
+        if nonzero:
+            aggregated[address] = Coins(nonzero)
+    return aggregated
+
+
+# sizes of the protobuf encoding, computed without encoding. Every field involved is
+# length-delimited with a field number below 16, so its tag takes one byte.
+
+
+def _varint_size(n: int) -> int:
+    size = 1
+    while n >= 0x80:
+        n >>= 7
+        size += 1
+    return size
+
+
+def _field_size(length: int) -> int:
+    return 1 + _varint_size(length) + length
+
+
+def _coins_size(coins: Iterable[Coin]) -> int:
+    return sum(
+        _field_size(
+            _field_size(len(coin.denom.encode())) + _field_size(len(str(coin.amount)))
+        )
+        for coin in coins
+    )
+
+
+def _address_coins_size(address: str, coins: Iterable[Coin]) -> int:
+    # MultiSendInput / MultiSendOutput
+    return _field_size(len(address.encode())) + _coins_size(coins)
+
+
+def _send_size(from_address: str, to_address: str, coins: Iterable[Coin]) -> int:
+    return (
+        _field_size(len(from_address.encode()))
+        + _field_size(len(to_address.encode()))
+        + _coins_size(coins)
+    )
+
+
+def _any_size(type_url: str, value_size: int) -> int:
+    return _field_size(len(type_url)) + _field_size(value_size)
+
+
+@attr.s
+class PayoutBuilder:
+    """Packs payouts from ``sender`` into the fewest transactions staying under a gas
+    limit and a size limit, then signs and broadcasts them.
+
+    Payouts to the same address are summed first. Transactions hold one
+    :class:`MsgMultiSend` (or a :class:`MsgSend` for a single recipient), or several
+    :class:`MsgSend` if ``multi_send`` is disabled. Their size is computed locally
+    from the protobuf encoding, and their gas from a linear model::
+
+        gas = base_gas + gas_per_transfer * recipients + gas_per_byte * tx_size
+
+    The estimate is also used as the gas limit of each transaction, so the model must
+    stay on the safe side for the chain being used.
+
+    >>> builder = PayoutBuilder(key.acc_address, public_key=key.public_key)
+    >>> results = await builder.send(wallet, [(address, "1000uluna"), ...])
+
+    Args:
+        sender (AccAddress): address paying out
+        max_gas (int, optional): gas limit of a transaction. Defaults to 2,000,000.
+        max_tx_bytes (int, optional): size limit of a signed transaction, in bytes.
+            Defaults to 64 KiB.
+        base_gas (int, optional): gas of a transaction besides its transfers and size.
+            Defaults to 60,000.
+        gas_per_transfer (int, optional): gas of each recipient. Defaults to 30,000.
+        gas_per_byte (int, optional): gas of each byte of the transaction, the
+            ``TxSizeCostPerByte`` auth parameter. Defaults to 10.
+        multi_send (bool, optional): use :class:`MsgMultiSend`. Defaults to True.
+        memo (str, optional): memo of the transactions.
+        public_key (PublicKey, optional): public key of the sender, used to size the
+            signer info. A secp256k1 key is assumed if not given.
+        gas_prices (Coins.Input, optional): gas prices of the fees. Uses the gas prices
+            of the client if not given.
+    """
+
+    sender: AccAddress = attr.ib()
+    max_gas: int = attr.ib(default=2_000_000)
+    max_tx_bytes: int = attr.ib(default=64 * 1024)
+    base_gas: int = attr.ib(default=60_000)
+    gas_per_transfer: int = attr.ib(default=30_000)
+    gas_per_byte: int = attr.ib(default=10)
+    multi_send: bool = attr.ib(default=True)
+    memo: str = attr.ib(default="")
+    public_key: Optional[PublicKey] = attr.ib(default=None)
+    gas_prices: Optional[Coins.Input] = attr.ib(default=None)
+
+    def estimate_gas(self, transfers: int, tx_size: int) -> int:
+        """Gas of a transaction of ``tx_size`` bytes paying ``transfers`` recipients."""
+        return (
+            self.base_gas
+            + self.gas_per_transfer * transfers
+            + self.gas_per_byte * tx_size
+        )
+
+    def _fee(self, gas: int, gas_prices: Optional[Coins.Input]) -> Fee:
+        if not gas_prices:
+            return Fee(gas, Coins.from_str("0uusd"), "", "")
+        return Fee(gas, Coins(gas_prices).mul(gas).to_int_ceil_coins(), "", "")
+
+    def _auth_info_size(self, gas_prices: Optional[Coins.Input]) -> int:
+        # upper bound: largest gas limit and fee, and a 5 byte sequence
+        auth_info = AuthInfo(
+            [
+                SignerInfo(
+                    public_key=self.public_key or SimplePublicKey(bytes(33)),
+                    mode_info=ModeInfo(
+                        single=ModeInfoSingle(SignMode.SIGN_MODE_DIRECT)
+                    ),
+                    sequence=2 ** 32,
+                )
+            ],
+            self._fee(self.max_gas, gas_prices),
+        )
+        return len(bytes(auth_info.to_proto()))
+
+    def _tx_size(self, body_size: int, auth_info_size: int) -> int:
+        return (
+            _field_size(body_size)
+            + _field_size(auth_info_size)
+            + _field_size(SIGNATURE_SIZE)
+        )
+
+    def _body_size(self, msgs_size: int) -> int:
+        memo = len(self.memo.encode())
+        return msgs_size + (_field_size(memo) if memo else 0)
+
+    def _pack_multi_send(
+        self, payouts: "OrderedDict[str, Coins]", auth_info_size: int
+    ) -> List[Tuple[List[Tuple[str, Coins]], int]]:
+        packed = []
+        batch: List[Tuple[str, Coins]] = []
+        outputs_size = 0
+        totals: Dict[str, Coin] = {}
+        size = 0
+        for address, coins in payouts.items():
+            output_size = _field_size(_address_coins_size(address, coins))
+            new_totals = dict(totals)
+            for coin in coins:
+                total = new_totals.get(coin.denom)
+                new_totals[coin.denom] = coin if total is None else total + coin
+            input_size = _field_size(
+                _address_coins_size(self.sender, new_totals.values())
+            )
+            msg_size = _any_size(
+                MsgMultiSend.type_url, input_size + outputs_size + output_size
+            )
+            new_size = self._tx_size(
+                self._body_size(_field_size(msg_size)), auth_info_size
+            )
+            if batch and (
+                new_size > self.max_tx_bytes
+                or self.estimate_gas(len(batch) + 1, new_size) > self.max_gas
+            ):
+                packed.append((batch, size))
+                batch, outputs_size, totals = [], 0, {}
+                new_totals = {coin.denom: coin for coin in coins}
+                input_size = _field_size(_address_coins_size(self.sender, coins))
+                msg_size = _any_size(MsgMultiSend.type_url, input_size + output_size)
+                new_size = self._tx_size(
+                    self._body_size(_field_size(msg_size)), auth_info_size
+                )
+            self._check_single(address, new_size)
+            batch.append((address, coins))
+            outputs_size += output_size
+            totals = new_totals
+            size = new_size
+        if batch:
+            packed.append((batch, size))
+        return packed
+
+    def _pack_sends(
+        self, payouts: "OrderedDict[str, Coins]", auth_info_size: int
+    ) -> List[Tuple[List[Tuple[str, Coins]], int]]:
+        packed = []
+        batch: List[Tuple[str, Coins]] = []
+        msgs_size = 0
+        size = 0
+        for address, coins in payouts.items():
+            msg_size = _field_size(
+                _any_size(MsgSend.type_url, _send_size(self.sender, address, coins))
+            )
+            new_size = self._tx_size(
+                self._body_size(msgs_size + msg_size), auth_info_size
+            )
+            if batch and (
+                new_size > self.max_tx_bytes
+                or self.estimate_gas(len(batch) + 1, new_size) > self.max_gas
+            ):
+                packed.append((batch, size))
+                batch, msgs_size = [], 0
+                new_size = self._tx_size(self._body_size(msg_size), auth_info_size)
+            self._check_single(address, new_size)
+            batch.append((address, coins))
+            msgs_size += msg_size
+            size = new_size
+        if batch:
+            packed.append((batch, size))
+        return packed
+
+    def _check_single(self, address: str, size: int):
+        if size > self.max_tx_bytes or self.estimate_gas(1, size) > self.max_gas:
+            raise ValueError(
+                f"payout to {address} alone exceeds the transaction limits"
+            )
+
+    def _msgs(self, batch: List[Tuple[str, Coins]]) -> List[Msg]:
+        if not self.multi_send or len(batch) == 1:
+            return [MsgSend(self.sender, address, coins) for address, coins in batch]
+        total: Dict[str, Coin] = {}
+        for _, coins in batch:
+            for coin in coins:
+                sum_ = total.get(coin.denom)
+                total[coin.denom] = coin if sum_ is None else sum_ + coin
+        return [
+            MsgMultiSend(
+                [MultiSendInput(self.sender, Coins(total.values()))],
+                [MultiSendOutput(address, coins) for address, coins in batch],
+            )
+        ]
+
+    def plan(
+        self, payouts: Iterable[Payout], gas_prices: Optional[Coins.Input] = None
+    ) -> List[Tuple[List[Msg], int]]:
+        """Aggregates the payouts and packs them into transactions.
+
+        Args:
+            payouts (Iterable[Tuple[AccAddress, Coins.Input]]): recipients and amounts
+            gas_prices (Coins.Input, optional): gas prices, to size the fee
+
+        Raises:
+            ValueError: if a single payout exceeds the limits
+
+        Returns:
+            List[Tuple[List[Msg], int]]: messages and estimated gas of each transaction
+        """
+        gas_prices = gas_prices or self.gas_prices
+        aggregated = aggregate_payouts(payouts)
+        auth_info_size = self._auth_info_size(gas_prices)
+        if self.multi_send:
+            packed = self._pack_multi_send(aggregated, auth_info_size)
+        else:
+            packed = self._pack_sends(aggregated, auth_info_size)
+        return [
+            (self._msgs(batch), self.estimate_gas(len(batch), size))
+            for batch, size in packed
+        ]
+
+    def build(
+        self, payouts: Iterable[Payout], gas_prices: Optional[Coins.Input] = None
+    ) -> List[Tx]:
+        """Builds the unsigned transactions paying out ``payouts``, with their fee.
+
+        Args:
+            payouts (Iterable[Tuple[AccAddress, Coins.Input]]): recipients and amounts
+            gas_prices (Coins.Input, optional): gas prices of the fees
+
+        Returns:
+            List[Tx]: unsigned transactions
+        """
+        gas_prices = gas_prices or self.gas_prices
+        return [
+            Tx(
+                TxBody(msgs, self.memo),
+                AuthInfo([], self._fee(gas, gas_prices)),
+                [],
+            )
+            for msgs, gas in self.plan(payouts, gas_prices)
+        ]
+
+    async def send(
+        self,
+        wallet,
+        payouts: Iterable[Payout],
+        executor: Optional[Executor] = None,
+        sign_batch: int = 64,
+        max_in_flight: int = 64,
+        timeout: float = 60.0,
+    ) -> List[Union[TxInfo, Exception]]:
+        """Builds, signs and broadcasts the payouts of ``wallet``. Transactions are
+        signed ``sign_batch`` at a time across a pool of processes, and each batch is
+        broadcast through a :class:`BroadcastPipeline` while the next one is signed.
+
+        Args:
+            wallet (AsyncWallet): wallet of the sender
+            payouts (Iterable[Tuple[AccAddress, Coins.Input]]): recipients and amounts
+            executor (Executor, optional): pool signing the transactions. A process pool
+                is created for the call if the key is a :class:`RawKey`.
+            sign_batch (int, optional): transactions signed at a time. Defaults to 64.
+            max_in_flight (int, optional): maximum number of transactions broadcast and
+                not yet included. Defaults to 64.
+            timeout (float, optional): seconds after broadcast before a transaction not
+                included fails. Defaults to 60.
+
+        Returns:
+            List[Union[TxInfo, Exception]]: for each transaction, its info once
+            included, or the error that prevented it
+        """
+        lcd = wallet.lcd
+        txs = self.build(payouts, self.gas_prices or lcd.gas_prices)
+        raw = hasattr(wallet.key, "private_key")
+        pool = executor or (ProcessPoolExecutor() if raw else None)
+        futures = []
+        pipeline = lcd.tx.pipeline(max_in_flight=max_in_flight, timeout=timeout)
+        try:
+            async with pipeline:
+                for start in range(0, len(txs), sign_batch):
+                    batch = txs[start : start + sign_batch]
+                    options = []
+                    for _ in batch:
+                        account_number, sequence = await wallet.sequences.acquire()
+                        options.append(
+                            SignOptions(
+                                account_number=account_number,
+                                sequence=sequence,
+                                sign_mode=SignMode.SIGN_MODE_DIRECT,
+                                chain_id=lcd.chain_id,
+                            )
+                        )
+                    try:
+                        if raw:
+                            signed = await sign_txs_async(
+                                wallet.key, batch, options, pool
+                            )
+                        else:
+                            signed = [
+                                wallet.key.sign_tx(tx, opt)
+                                for tx, opt in zip(batch, options)
+                            ]
+                    except BaseException:
+                        wallet.sequences.invalidate()
+                        raise
+                    futures.extend(pipeline.submit(tx) for tx in signed)
+                results = await asyncio.gather(*futures, return_exceptions=True)
+        finally:
+            if executor is None and pool is not None:
+                pool.shutdown(wait=False)
+        if any(isinstance(result, Exception) for result in results):
+            # a transaction which did not make it leaves a gap in the sequences
+            wallet.sequences.invalidate()
+        return list(results)
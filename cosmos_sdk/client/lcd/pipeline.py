@@ -0,0 +1,351 @@
+"""Pipelined broadcasting of signed transactions, with tracking of their inclusion."""
+
+import asyncio
+import base64
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Awaitable, Callable, List, Optional, Set
+
+import attr
+
+from cosmos_sdk.core.broadcast import SyncTxBroadcastResult
+from cosmos_sdk.core.tx import Tx, TxInfo
+from cosmos_sdk.exceptions import TxRejectedError
+from cosmos_sdk.util.hash import hash_txs
+
+from .batch import run_batch
+
+__all__ = ["BroadcastPipeline", "PipelineStats"]
+
+
+def _height(block: dict) -> int:
+    return int(block["block"]["header"]["height"])
+
+
+@attr.s
+class PipelineStats:
+    """Counters of a :class:`BroadcastPipeline`."""
+
+    submitted: int = attr.ib(default=0)
+    """Transactions submitted to the pipeline."""
+
+    broadcast: int = attr.ib(default=0)
+    """Transactions accepted into the mempool of the node."""
+
+    rejected: int = attr.ib(default=0)
+    """Transactions rejected by the node when broadcast (``CheckTx`` failure)."""
+
+    included: int = attr.ib(default=0)
+    """Transactions included in a block, whether their execution succeeded or not."""
+
+    failed: int = attr.ib(default=0)
+    """Transactions which could not be broadcast, or were not seen in a block in time."""
+
+    block_polls: int = attr.ib(default=0)
+    """Requests of the latest block."""
+
+    total_inclusion_time: float = attr.ib(default=0.0)
+    """Sum of the times from broadcast to inclusion, in seconds."""
+
+    max_inclusion_time: float = attr.ib(default=0.0)
+    """Longest time from broadcast to inclusion, in seconds."""
+
+    started: Optional[float] = attr.ib(default=None)
+    """Monotonic time of the first submission."""
+
+    last_included: Optional[float] = attr.ib(default=None)
+    """Monotonic time of the last inclusion."""
+
+    @property
+    def mean_inclusion_time(self) -> float:
+        """Mean time from broadcast to inclusion, in seconds."""
+        return self.total_inclusion_time / self.included if self.included else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Transactions included per second, since the first submission."""
+        if not self.included or self.last_included == self.started:
+            return 0.0
+        return self.included / (self.last_included - self.started)
+
+
+@attr.s
+class _Pending:
+    future: asyncio.Future = attr.ib()
+    broadcast_at: float = attr.ib()
+
+
+class BroadcastPipeline:
+    """Broadcasts signed transactions with the ``sync`` mode and resolves a future per
+    transaction with its :class:`TxInfo` once it is included in a block.
+
+    Transactions are broadcast one after the other in submission order, so that
+    transactions of the same account reach the mempool in sequence order. At most
+    ``max_in_flight`` transactions are broadcast and waiting for inclusion at a time.
+
+    Inclusion is tracked by following new blocks and hashing their transactions; only
+    the transactions of the pipeline found in a block are looked up with ``tx_info``,
+    concurrently. A transaction not seen within ``timeout`` seconds is looked up one
+    last time, then its future fails with :class:`asyncio.TimeoutError`. A transaction
+    rejected by the node fails with :class:`TxRejectedError`.
+
+    >>> async with terra.tx.pipeline(max_in_flight=32) as pipeline:
+    ...     futures = [pipeline.submit(tx) for tx in signed_txs]
+    ...     infos = await asyncio.gather(*futures)
+    >>> pipeline.stats.throughput, pipeline.stats.mean_inclusion_time
+    (41.7, 5.8)
+
+    Args:
+        broadcast (Callable[[str], Awaitable[SyncTxBroadcastResult]]): coroutine
+            function broadcasting base64 encoded transaction bytes in ``sync`` mode
+        fetch_block (Callable[[Optional[int]], Awaitable[dict]]): coroutine function
+            fetching the block at a height, or the latest block for ``None``
+        tx_info (Callable[[str], Awaitable[TxInfo]]): coroutine function fetching an
+            included transaction by hash
+        max_in_flight (int, optional): maximum number of transactions broadcast and not
+            yet included. Defaults to 64.
+        poll_interval (float, optional): wait, in seconds, between polls of the latest
+            block. Defaults to 1.
+        timeout (float, optional): seconds after broadcast before a transaction not
+            seen in a block fails. Defaults to 60.
+        max_concurrency (int, optional): maximum number of block and ``tx_info``
+            requests in flight. Defaults to 16.
+    """
+
+    stats: PipelineStats
+    """Counters of the pipeline."""
+
+    def __init__(
+        self,
+        broadcast: Callable[[str], Awaitable[SyncTxBroadcastResult]],
+        fetch_block: Callable[[Optional[int]], Awaitable[dict]],
+        tx_info: Callable[[str], Awaitable[TxInfo]],
+        max_in_flight: int = 64,
+        poll_interval: float = 1.0,
+        timeout: float = 60.0,
+        max_concurrency: int = 16,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._broadcast = broadcast
+        self._fetch_block = fetch_block
+        self._tx_info = tx_info
+        self.max_in_flight = max_in_flight
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.stats = PipelineStats()
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._pending: "OrderedDict[str, _Pending]" = OrderedDict()
+        self._seen: Set[str] = set()
+        self._height: Optional[int] = None
+        self._tasks: List[asyncio.Task] = []
+        self._closed = False
+
+    @property
+    def in_flight(self) -> int:
+        """Transactions broadcast and waiting for inclusion."""
+        return len(self._pending)
+
+    def _start(self):
+        # created lazily so that they belong to the loop running the pipeline
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._wake = asyncio.Event()
+        self._tasks = [
+            asyncio.ensure_future(self._send_loop()),
+            asyncio.ensure_future(self._track_loop()),
+        ]
+
+    def submit(self, tx: Tx) -> asyncio.Future:
+        """Queues a signed transaction for broadcasting.
+
+        Args:
+            tx (Tx): signed transaction
+
+        Returns:
+            asyncio.Future: future resolving to the :class:`TxInfo` of the included
+            transaction
+        """
+        if self._closed:
+            raise RuntimeError("cannot submit to a closed BroadcastPipeline")
+        self._start()
+        future = asyncio.get_running_loop().create_future()
+        if self.stats.started is None:
+            self.stats.started = time.monotonic()
+        self.stats.submitted += 1
+        self._queue.put_nowait((tx, future))
+        return future
+
+    def _resolve(self, tx_hash: str, result=None, error: Exception = None):
+        pending = self._pending.pop(tx_hash, None)
+        self._seen.discard(tx_hash)
+        if pending is None:
+            return
+        self._slots.release()
+        if error is not None:
+            self.stats.failed += 1
+            if not pending.future.done():
+                pending.future.set_exception(error)
+            return
+        now = time.monotonic()
+        elapsed = now - pending.broadcast_at
+        self.stats.included += 1
+        self.stats.total_inclusion_time += elapsed
+        self.stats.max_inclusion_time = max(self.stats.max_inclusion_time, elapsed)
+        self.stats.last_included = now
+        if not pending.future.done():
+            pending.future.set_result(result)
+
+    async def _send_loop(self):
+        while True:
+            tx, future = await self._queue.get()
+            try:
+                await self._slots.acquire()
+                await self._send(tx, future)
+            finally:
+                self._queue.task_done()
+
+    def _fail(self, future: asyncio.Future, error: Exception):
+        """Fails a transaction which was not registered as pending."""
+        self.stats.failed += 1
+        self._slots.release()
+        if not future.done():
+            future.set_exception(error)
+
+    async def _send(self, tx: Tx, future: asyncio.Future):
+        try:
+            tx_bytes = tx.to_bytes()
+            tx_hash = tx.hash()
+        except Exception as e:
+            self._fail(future, e)
+            return
+        if tx_hash in self._pending:
+            self._fail(future, ValueError(f"transaction {tx_hash} is already pending"))
+            return
+        # registered before broadcasting, the block including it may come first
+        self._pending[tx_hash] = _Pending(future, time.monotonic())
+        try:
+            if self._height is None:
+                # blocks are scanned from the tip at the time of the broadcast
+                self._height = _height(await self._fetch_block(None))
+            result = await self._broadcast(base64.b64encode(tx_bytes).decode())
+        except Exception as e:
+            self._resolve(tx_hash, error=e)
+            return
+        if result.code:
+            self.stats.rejected += 1
+            self._pending.pop(tx_hash, None)
+            self._slots.release()
+            if not future.done():
+                future.set_exception(TxRejectedError(result))
+            return
+        self.stats.broadcast += 1
+        self._wake.set()
+
+    async def _scan(self) -> List[str]:
+        """Fetches the blocks produced since the last scan and returns the hashes of
+        the pending transactions found in them."""
+        if self._height is None:
+            return []
+        latest = await self._fetch_block(None)
+        self.stats.block_polls += 1
+        tip = _height(latest)
+        if tip < self._height:
+            return []
+        heights = range(self._height, tip)
+        results = await run_batch(
+            [partial(self._fetch_block, height) for height in heights],
+            self.max_concurrency,
+        )
+        next_height = tip + 1
+        blocks = []
+        for height, result in zip(heights, results):
+            if not result.ok:
+                next_height = height  # scanned again at the next poll
+                break
+            blocks.append(result.result)
+        else:
+            blocks.append(latest)
+        self._height = next_height
+
+        found = []
+        for block in blocks:
+            for tx_hash in hash_txs(block["block"]["data"].get("txs") or []):
+                if tx_hash in self._pending:
+                    found.append(tx_hash)
+        return found
+
+    def _expired(self) -> List[str]:
+        deadline = time.monotonic() - self.timeout
+        expired = []
+        for tx_hash, pending in self._pending.items():
+            if pending.broadcast_at > deadline:
+                break  # ordered by broadcast time
+            expired.append(tx_hash)
+        return expired
+
+    async def _look_up(self, hashes: List[str], expired: Set[str]):
+        results = await run_batch(
+            [partial(self._tx_info, tx_hash) for tx_hash in hashes],
+            self.max_concurrency,
+        )
+        for tx_hash, result in zip(hashes, results):
+            if result.ok:
+                self._resolve(tx_hash, result.result)
+            elif tx_hash in expired:
+                self._resolve(
+                    tx_hash,
+                    error=asyncio.TimeoutError(
+                        f"transaction {tx_hash} not included after {self.timeout}s"
+                    ),
+                )
+            # otherwise found in a block but not indexed yet, looked up again later
+
+    async def _track_loop(self):
+        while True:
+            if not self._pending:
+                # after an idle period, the next broadcast starts from the new tip
+                self._height = None
+                self._wake.clear()
+                await self._wake.wait()
+            try:
+                self._seen.update(await self._scan())
+            except Exception:
+                pass  # the transport already retried, try again at the next poll
+            expired = set(self._expired())
+            hashes = [h for h in self._pending if h in self._seen or h in expired]
+            if hashes:
+                await self._look_up(hashes, expired)
+            if self._pending:
+                await asyncio.sleep(self.poll_interval)
+
+    async def join(self):
+        """Waits until every submitted transaction is resolved."""
+        if not self._tasks:
+            return
+        await self._queue.join()
+        while self._pending:
+            await asyncio.sleep(self.poll_interval / 4)
+
+    async def close(self):
+        """Waits for the submitted transactions, then stops the pipeline."""
+        self._closed = True
+        try:
+            await self.join()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> "BroadcastPipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
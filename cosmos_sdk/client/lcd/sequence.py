@@ -0,0 +1,112 @@
+"""Local tracking of the account number and sequence of a signing account."""
+
+import asyncio
+import re
+from typing import Awaitable, Callable, Optional, Tuple
+
+__all__ = ["SequenceManager", "SEQUENCE_MISMATCH_CODE"]
+
+SEQUENCE_MISMATCH_CODE = 32
+"""``ErrWrongSequence`` code of the ``sdk`` codespace."""
+
+_MISMATCH = re.compile(r"account sequence mismatch, expected (\d+), got (\d+)")
+
+
+class SequenceManager:
+    """Hands out the sequences of an account to concurrent transactions, so that a
+    wallet can sign many transactions without querying the account for each one.
+
+    The account is fetched once; the account number never changes and sequences are
+    then counted locally. After a broadcast is rejected for a sequence mismatch, the
+    next sequence is taken from the error, or fetched again from the chain.
+
+    Args:
+        fetch (Callable[[], Awaitable[Tuple[int, int]]]): coroutine function fetching
+            the account number and sequence of the account
+    """
+
+    account_number: Optional[int]
+    """Account number, ``None`` until the account is fetched."""
+
+    resyncs: int
+    """Number of times the sequence was found out of sync."""
+
+    def __init__(self, fetch: Callable[[], Awaitable[Tuple[int, int]]]):
+        self._fetch = fetch
+        self._lock: Optional[asyncio.Lock] = None
+        self._next: Optional[int] = None
+        self.account_number = None
+        self.resyncs = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        # created lazily so that it belongs to the loop running the wallet
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _sync(self):
+        self.account_number, self._next = await self._fetch()
+
+    async def get_account_number(self) -> int:
+        """Returns the account number, fetching the account the first time."""
+        async with self._get_lock():
+            if self.account_number is None:
+                await self._sync()
+        return self.account_number
+
+    async def acquire(self) -> Tuple[int, int]:
+        """Reserves the next sequence of the account.
+
+        Returns:
+            Tuple[int, int]: account number and sequence to sign with
+        """
+        async with self._get_lock():
+            if self._next is None:
+                await self._sync()
+            sequence = self._next
+            self._next += 1
+        return self.account_number, sequence
+
+    def release(self, sequence: int):
+        """Gives back a sequence that will not be broadcast, e.g. because creating or
+        signing the transaction failed."""
+        if self._next is not None and sequence == self._next - 1:
+            self._next = sequence
+        else:
+            # a later sequence was already handed out, the gap can only be fixed by
+            # asking the chain
+            self.invalidate()
+
+    def invalidate(self):
+        """Fetches the sequence from the chain again before the next transaction."""
+        self._next = None
+
+    def observe(self, result) -> bool:
+        """Checks a broadcast result for a sequence mismatch, and resyncs if found. The
+        sequence is also fetched again after any other rejection at the ``CheckTx``
+        stage. A transaction that failed in a block did use its sequence, so the local
+        count is kept.
+
+        Args:
+            result: result of ``broadcast_sync`` or ``broadcast``
+
+        Returns:
+            bool: whether the transaction was rejected for a sequence mismatch
+        """
+        code = getattr(result, "code", None)
+        match = _MISMATCH.search(getattr(result, "raw_log", None) or "")
+        if match is None and (
+            code != SEQUENCE_MISMATCH_CODE
+            or getattr(result, "codespace", None) not in (None, "", "sdk")
+        ):
+            if code and not getattr(result, "height", None):
+                # a transaction rejected before execution did not use its sequence,
+                # while one included in a block (height set) did even if it failed
+                self.invalidate()
+            return False
+        self.resyncs += 1
+        if match is not None:
+            self._next = int(match.group(1))
+        else:
+            self.invalidate()
+        return True
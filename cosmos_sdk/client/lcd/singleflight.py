@@ -0,0 +1,51 @@
+"""Coalescing of identical concurrent LCD requests."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+__all__ = ["SingleFlight"]
+
+
+class SingleFlight:
+    """Shares one in-flight request between every caller asking for the same key, so
+    that identical concurrent GETs reach the LCD server only once.
+
+    The request runs in its own task: a caller being cancelled does not cancel it for
+    the others. Results are shared between callers and must not be mutated.
+
+    >>> await asyncio.gather(*[terra.oracle.exchange_rates() for _ in range(10)])
+    >>> terra.single_flight.requests, terra.single_flight.coalesced
+    (1, 9)
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Awaits the request in flight for ``key``, or starts one with ``fetch``."""
+        task = self._in_flight.get(key)
+        if task is None:
+            self.requests += 1
+            task = asyncio.ensure_future(fetch())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._done(key, task))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Future):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved, even if every caller was cancelled
+
+    @property
+    def coalesce_rate(self) -> float:
+        """Share of calls served by a request already in flight."""
+        total = self.requests + self.coalesced
+        return self.coalesced / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
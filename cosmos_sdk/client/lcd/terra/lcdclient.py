@@ -1,18 +1,13 @@
 from __future__ import annotations
 
 from asyncio import AbstractEventLoop, get_event_loop
-from json import JSONDecodeError
-from typing import List, Optional, Union
+from typing import Iterable, List, Optional, Union
 
 import nest_asyncio
-from aiohttp import ClientSession
 from multidict import CIMultiDict
 
 from cosmos_sdk.core import Coins, Dec, Numeric
-from cosmos_sdk.exceptions import LCDResponseError
 from cosmos_sdk.key.terra.key import Key
-from cosmos_sdk.util.json import dict_to_data
-from cosmos_sdk.util.url import urljoin
 
 from ..api.auth import AsyncAuthAPI, AuthAPI
 from ..api.authz import AsyncAuthzAPI, AuthzAPI
@@ -31,8 +26,16 @@ from ..api.tendermint import AsyncTendermintAPI, TendermintAPI
 from ..api.terra.treasury import AsyncTreasuryAPI, TreasuryAPI
 from ..api.tx import AsyncTxAPI, TxAPI
 from ..api.terra.wasm import AsyncWasmAPI, WasmAPI
+from ..base import BaseAsyncLCDClient
+from ..batch import BatchResult, Query
+from ..cache import ResponseCache
+from ..connection import ConnectionOptions, create_session
+from ..endpoints import EndpointPool
+from ..gas import GasEstimator
 from ..lcdutils import AsyncLCDUtils, LCDUtils
 from ..params import APIParams
+from ..singleflight import SingleFlight
+from ..transport import TransportPolicy
 from .wallet import AsyncWallet, Wallet
 
 
@@ -47,27 +50,26 @@ def get_default(chain_id: str) -> [Coins, Numeric]:
     raise ValueError("chain_id is invalid")
 
 
-class AsyncLCDClient:
+class AsyncLCDClient(BaseAsyncLCDClient):
     def __init__(
         self,
-        url: str,
+        url: Union[str, List[str]],
         chain_id: Optional[str] = None,
         gas_prices: Optional[Coins.Input] = None,
         gas_adjustment: Optional[Numeric.Input] = None,
         loop: Optional[AbstractEventLoop] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        cache: Optional[ResponseCache] = None,
+        transport: Optional[TransportPolicy] = None,
+        gas_estimator: Optional[GasEstimator] = None,
         _create_session: bool = True,  # don't create a session (used for sync LCDClient)
     ):
-        if loop is None:
-            loop = get_event_loop()
-        self.loop = loop
-        if _create_session:
-            self.session = ClientSession(
-                headers={"Accept": "application/json"}, loop=self.loop
-            )
+        super().__init__(
+            url, loop, connection_options, cache, transport, _create_session
+        )
+        self.gas_estimator = gas_estimator
 
         self.chain_id = chain_id
-        self.url = url
-        self.last_request_height = None
 
         default_price, default_adjustment = get_default(chain_id)
         self.gas_prices = Coins(gas_prices) if gas_prices else default_price
@@ -100,50 +102,6 @@ class AsyncLCDClient:
         """
         return AsyncWallet(self, key)
 
-    async def _get(
-        self,
-        endpoint: str,
-        params: Optional[Union[APIParams, CIMultiDict, list, dict]] = None,
-        # raw: bool = False
-    ):
-        if (
-            params
-            and hasattr(params, "to_dict")
-            and callable(getattr(params, "to_dict"))
-        ):
-            params = params.to_dict()
-
-        async with self.session.get(
-            urljoin(self.url, endpoint), params=params
-        ) as response:
-            try:
-                result = await response.json(content_type=None)
-            except JSONDecodeError:
-                raise LCDResponseError(message=str(response.reason), response=response)
-            if not 200 <= response.status < 299:
-                raise LCDResponseError(message=str(result), response=response)
-        self.last_request_height = (
-            result.get("height") if result else self.last_request_height
-        )
-        return result  # if raw else result["result"]
-
-    async def _post(
-        self, endpoint: str, data: Optional[dict] = None  # , raw: bool = False
-    ):
-        async with self.session.post(
-            urljoin(self.url, endpoint), json=data and dict_to_data(data)
-        ) as response:
-            try:
-                result = await response.json(content_type=None)
-            except JSONDecodeError:
-                raise LCDResponseError(message=str(response.reason), response=response)
-            if not 200 <= response.status < 299:
-                raise LCDResponseError(message=result.get("message"), response=response)
-        self.last_request_height = (
-            result.get("height") if result else self.last_request_height
-        )
-        return result  # if raw else result["result"]
-
     async def _search(
         self,
         events: List[list],
@@ -162,32 +120,19 @@ class AsyncLCDClient:
             for p in params:
                 actual_params.add(p, params[p])
 
-        async with self.session.get(
-            urljoin(self.url, "/cosmos/tx/v1beta1/txs"), params=actual_params
-        ) as response:
-            try:
-                result = await response.json(content_type=None)
-            except JSONDecodeError:
-                raise LCDResponseError(message=str(response.reason), response=response)
-            if not 200 <= response.status < 299:
-                raise LCDResponseError(message=str(result), response=response)
-        self.last_request_height = (
-            result.get("height") if result else self.last_request_height
-        )
-        return result  # if raw else result["result"]
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        await self.session.close()
+        return await self._request(
+            "GET", "/cosmos/tx/v1beta1/txs", params=actual_params
+        )  # if raw else result["result"]
 
 
 class LCDClient(AsyncLCDClient):
     """An object representing a connection to a node running the Terra LCD server."""
 
     url: str
-    """URL endpoint of LCD server."""
+    """URL endpoint of LCD server (the first one if several were given)."""
+
+    endpoints: EndpointPool
+    """Health-scored pool of the LCD endpoints requests are spread across."""
 
     chain_id: str
     """Chain ID of blockchain network connecting to."""
@@ -198,9 +143,24 @@ class LCDClient(AsyncLCDClient):
     gas_adjustment: Union[str, float, int, Dec]
     """Gas adjustment factor for automatic fee estimation."""
 
+    gas_estimator: Optional[GasEstimator]
+    """Estimator of the gas used by transactions, ``None`` to always simulate them."""
+
     last_request_height: Optional[int]  # type: ignore
     """Height of response of last-made made LCD request."""
 
+    cache: Optional[ResponseCache]
+    """Cache of GET responses, if enabled."""
+
+    transport: TransportPolicy
+    """Timeouts, retries and rate limiting of requests."""
+
+    pinned_height: Optional[int]
+    """Block height queries are served at, for views created with :meth:`at_height`."""
+
+    single_flight: Optional[SingleFlight]
+    """Coalescing of identical concurrent GET requests, ``None`` to disable it."""
+
     auth: AuthAPI
     """:class:`AuthAPI<terra_sdk.client.lcd.api.auth.AuthAPI>`."""
 
@@ -254,19 +214,28 @@ class LCDClient(AsyncLCDClient):
 
     def __init__(
         self,
-        url: str,
+        url: Union[str, List[str]],
         chain_id: str = None,
         gas_prices: Optional[Coins.Input] = None,
         gas_adjustment: Optional[Numeric.Input] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        cache: Optional[ResponseCache] = None,
+        transport: Optional[TransportPolicy] = None,
+        gas_estimator: Optional[GasEstimator] = None,
     ):
         super().__init__(
             url,
             chain_id,
             gas_prices,
             gas_adjustment,
+            connection_options=connection_options,
+            cache=cache,
+            transport=transport,
+            gas_estimator=gas_estimator,
             _create_session=False,
             loop=nest_asyncio.apply(get_event_loop()),
         )
+        self.session = None
 
         self.auth = AuthAPI(self)
         self.bank = BankAPI(self)
@@ -306,38 +275,50 @@ class LCDClient(AsyncLCDClient):
         """
         return Wallet(self, key)
 
-    async def _get(self, *args, **kwargs):
-        # session has to be manually created and torn down for each HTTP request in a
-        # synchronous client
-        self.session = ClientSession(
-            headers={"Accept": "application/json"}, loop=self.loop
-        )
-        try:
-            result = await super()._get(*args, **kwargs)
-        finally:
-            await self.session.close()
-        return result
-
-    async def _post(self, *args, **kwargs):
-        # session has to be manually created and torn down for each HTTP request in a
-        # synchronous client
-        self.session = ClientSession(
-            headers={"Accept": "application/json"}, loop=self.loop
-        )
-        try:
-            result = await super()._post(*args, **kwargs)
-        finally:
-            await self.session.close()
-        return result
-
-    async def _search(self, *args, **kwargs):
-        # session has to be manually created and torn down for each HTTP request in a
-        # synchronous client
-        self.session = ClientSession(
-            headers={"Accept": "application/json"}, loop=self.loop
-        )
-        try:
-            result = await super()._search(*args, **kwargs)
-        finally:
-            await self.session.close()
-        return result
+    def batch(
+        self, queries: Iterable[Query], max_concurrency: int = 8
+    ) -> List[BatchResult]:
+        """Runs many queries concurrently, with at most ``max_concurrency`` of them in
+        flight, and waits for all of them. Queries made through the synchronous APIs
+        of this client, e.g. ``partial(terra.bank.balance, address)``, run
+        concurrently as well.
+
+        Args:
+            queries (Iterable[Query]): awaitables, or callables taking no argument
+            max_concurrency (int, optional): maximum number of queries in flight.
+                Defaults to 8.
+
+        Returns:
+            List[BatchResult]: outcome of every query, in the order they were given
+        """
+        return self.loop.run_until_complete(super().batch(queries, max_concurrency))
+
+    def at_height(self, height: int) -> LCDClient:
+        # the view shares the session, so it must exist before the view is created
+        self._ensure_session()
+        return super().at_height(height)
+
+    at_height.__doc__ = BaseAsyncLCDClient.at_height.__doc__
+
+    def close(self):
+        """Closes the client's HTTP session and its pooled connections. A new session
+        is opened on the next request."""
+        if self.session is not None and not self.session.closed:
+            self.loop.run_until_complete(self.session.close())
+        self.session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _ensure_session(self):
+        # the session is created lazily and then kept open, so every request made
+        # through the synchronous client reuses the same keep-alive connection pool
+        if self.session is None or self.session.closed:
+            self.session = create_session(self.loop, self.connection_options)
+
+    async def _request(self, *args, **kwargs):
+        self._ensure_session()
+        return await super()._request(*args, **kwargs)
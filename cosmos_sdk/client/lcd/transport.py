@@ -0,0 +1,181 @@
+"""Timeouts, retries and rate limiting of LCD requests."""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import attr
+from aiohttp import ClientError, ClientTimeout
+
+from cosmos_sdk.exceptions import LCDResponseError
+
+__all__ = ["TransportPolicy", "RateLimiter", "RetryBudget"]
+
+
+class RateLimiter:
+    """Client-side token bucket limiting the rate of requests sent to LCD servers.
+
+    Args:
+        rate (float): requests allowed per second
+        burst (int, optional): requests that can be sent at once after an idle period.
+            Defaults to ``rate``, and at least 1.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.waits = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Waits until a request may be sent."""
+        self._refill()
+        # the token is reserved right away, so concurrent callers queue up behind each
+        # other instead of competing for the next token
+        self._tokens -= 1
+        if self._tokens < 0:
+            self.waits += 1
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class RetryBudget:
+    """Caps retries to a fraction of requests, so that retrying during an outage does
+    not multiply the load on LCD servers.
+
+    Every request adds ``ratio`` to the budget, up to ``reserve``, and every retry takes
+    one from it.
+
+    Args:
+        ratio (float, optional): retries allowed per request in the long run.
+            Defaults to 0.2.
+        reserve (float, optional): retries available after a quiet period.
+            Defaults to 10.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10):
+        self.ratio = ratio
+        self.reserve = reserve
+        self.exhausted = 0
+        self._tokens = float(reserve)
+
+    def deposit(self):
+        self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Takes a retry from the budget. Returns whether one was available."""
+        if self._tokens < 1:
+            self.exhausted += 1
+            return False
+        self._tokens -= 1
+        return True
+
+
+def _retry_after(error: LCDResponseError) -> Optional[float]:
+    value = error.response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+@attr.s
+class TransportPolicy:
+    """How an LCD client times out, retries and paces its requests.
+
+    GET requests are retried after connection errors, timeouts and ``retry_statuses``
+    responses. Other requests are only retried after ``429 Too Many Requests``, which
+    guarantees the server did not process them. Retries wait for a jittered,
+    exponentially growing delay, or for the server's ``Retry-After``.
+
+    >>> terra = LCDClient(url, chain_id, transport=TransportPolicy(
+    ...     read_timeout=10, max_retries=5, rate_limiter=RateLimiter(rate=20)
+    ... ))
+
+    Args:
+        connect_timeout (float, optional): seconds to establish a connection.
+            Defaults to 10.
+        read_timeout (float, optional): seconds to wait for data from the server.
+            Defaults to 30.
+        total_timeout (float, optional): seconds a single attempt may take in total.
+            ``None`` means no limit. Defaults to None.
+        max_retries (int, optional): retries of a single request. Defaults to 3.
+        backoff_base (float, optional): seconds of the first backoff. Defaults to 0.25.
+        backoff_max (float, optional): longest backoff in seconds. Defaults to 10.
+        retry_statuses (FrozenSet[int], optional): statuses retried for GET requests.
+        max_retry_after (float, optional): longest ``Retry-After`` honored, in seconds.
+            Requests asked to wait longer fail instead. Defaults to 60.
+        retry_budget (RetryBudget, optional): budget shared by the retries of all
+            requests.
+        rate_limiter (RateLimiter, optional): limits the rate of requests sent,
+            retries included. Disabled by default.
+    """
+
+    connect_timeout: Optional[float] = attr.ib(default=10)
+    read_timeout: Optional[float] = attr.ib(default=30)
+    total_timeout: Optional[float] = attr.ib(default=None)
+    max_retries: int = attr.ib(default=3)
+    backoff_base: float = attr.ib(default=0.25)
+    backoff_max: float = attr.ib(default=10)
+    retry_statuses: FrozenSet[int] = attr.ib(
+        default=frozenset({429, 502, 503, 504}), converter=frozenset
+    )
+    max_retry_after: float = attr.ib(default=60)
+    retry_budget: RetryBudget = attr.ib(factory=RetryBudget)
+    rate_limiter: Optional[RateLimiter] = attr.ib(default=None)
+
+    def client_timeout(self) -> ClientTimeout:
+        return ClientTimeout(
+            total=self.total_timeout,
+            sock_connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered delay before retry number ``attempt`` (starting at 0)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def retry_delay(
+        self, method: str, error: Exception, attempt: int
+    ) -> Optional[float]:
+        """Seconds to wait before retrying a failed request, ``None`` if it must not be
+        retried.
+
+        Args:
+            method (str): HTTP method of the request
+            error (Exception): error the last attempt failed with
+            attempt (int): number of retries already made
+        """
+        if attempt >= self.max_retries:
+            return None
+        if isinstance(error, LCDResponseError):
+            status = error.response.status
+            if status != 429 and (method != "GET" or status not in self.retry_statuses):
+                return None
+            retry_after = _retry_after(error)
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                return max(retry_after, self.backoff(attempt))
+        elif not isinstance(error, (ClientError, asyncio.TimeoutError)) or method != "GET":
+            return None
+        return self.backoff(attempt)
@@ -2,6 +2,7 @@ __all__ = [
     "Coin",
     "Coins",
     "Dec",
+    "DecArray",
     "Numeric",
     "PublicKey",
     "AccAddress",
@@ -27,6 +28,7 @@ from .bech32 import AccAddress, AccPubKey, ValAddress, ValPubKey
 from .coin import Coin
 from .coins import Coins
 from .compact_bit_array import CompactBitArray
+from .dec_array import DecArray
 from .multisig import MultiSignature
 from .numeric import Dec, Numeric
 from .public_key import (
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 from cosmos_proto.cosmos.base.v1beta1 import Coin as Coin_pb
@@ -8,7 +7,7 @@ from cosmos_proto.cosmos.base.v1beta1 import Coin as Coin_pb
 from cosmos_sdk.util.json import JSONSerializable
 
 from .coin import Coin
-from .numeric import Numeric
+from .numeric import Numeric, _dec_int
 
 
 class Coins(JSONSerializable, List[Coin_pb]):
@@ -17,6 +16,9 @@ class Coins(JSONSerializable, List[Coin_pb]):
     input coins would be ``Dec``-amount type coin, the resultant Coins is converted to
     ``Dec``-amount coins.
 
+    Coins are immutable and hashable, and kept sorted by denom: arithmetic creates new
+    :class:`Coins`, and coins are shared rather than copied between them.
+
     Args:
         arg (Optional[Coins.Input], optional): argument to convert. Defaults to ``{}``.
 
@@ -27,7 +29,10 @@ class Coins(JSONSerializable, List[Coin_pb]):
     Input = Union[Iterable[Coin], str, Dict[str, Numeric.Input], Dict[str, Coin]]
     """Types which can be converted into a :class:`Coins` object."""
 
+    __slots__ = ("_coins", "_hash")
+
     _coins: Dict[str, Coin]
+    """Coins by denom, in denom order. Never modified after construction."""
 
     def __repr__(self) -> str:
         if len(self) == 0:
@@ -53,6 +58,7 @@ class Coins(JSONSerializable, List[Coin_pb]):
 
     def __init__(self, arg: Optional[Coins.Input] = {}, **denoms):
         """Converts the argument into a :class:`Coins` object."""
+        self._hash = None
 
         if arg is None:
             self._coins = {}
@@ -65,14 +71,16 @@ class Coins(JSONSerializable, List[Coin_pb]):
             raise TypeError(f"could not create Coins object with argument: {arg!s}")
 
         if isinstance(arg, Coins):
-            self._coins = copy.deepcopy(arg._coins)
+            # both are immutable, so they can share their coins
+            self._coins = arg._coins
+            self._hash = arg._hash
             return
 
         if isinstance(arg, str):
             self._coins = Coins.from_str(arg)._coins
             return
 
-        self._coins = Coins(denoms)._coins if denoms else {}
+        by_denom = dict(Coins(denoms)._coins) if denoms else {}
 
         coins: Iterable[Coin]
         if isinstance(arg, dict):
@@ -80,16 +88,37 @@ class Coins(JSONSerializable, List[Coin_pb]):
         else:
             coins = arg
         for coin in coins:
-            x = self._coins.get(coin.denom)
+            x = by_denom.get(coin.denom)
             if x is not None:
-                self._coins[coin.denom] = x + coin
+                by_denom[coin.denom] = x + coin
             else:
-                self._coins[coin.denom] = coin
+                by_denom[coin.denom] = coin
+
+        self._coins = Coins._index(by_denom[denom] for denom in sorted(by_denom))
 
+    @staticmethod
+    def _index(coins: Iterable[Coin]) -> Dict[str, Coin]:
+        """Indexes coins of distinct denoms, given in denom order."""
+        coins = list(coins)
         # make all coins DecCoin if one is DecCoin
-        if not all([c.is_int_coin() for c in self]):
-            for denom in self._coins:
-                self._coins[denom] = self._coins[denom].to_dec_coin()
+        if not all(c.is_int_coin() for c in coins):
+            coins = [c if c.is_dec_coin() else c.to_dec_coin() for c in coins]
+        return {c.denom: c for c in coins}
+
+    @classmethod
+    def _from_sorted(cls, coins: Iterable[Coin]) -> Coins:
+        """Creates :class:`Coins` from coins of distinct denoms and of the same amount
+        type, given in denom order, without sorting, merging or converting them."""
+        new = cls.__new__(cls)
+        new._coins = {c.denom: c for c in coins}
+        new._hash = None
+        return new
+
+    def _is_dec(self) -> bool:
+        # the coins are either all int coins or all Dec coins
+        for coin in self._coins.values():
+            return coin.is_dec_coin()
+        return False
 
     def __getitem__(self, denom: str) -> Coin:
         return self._coins[denom]
@@ -153,15 +182,15 @@ class Coins(JSONSerializable, List[Coin_pb]):
 
     def to_dec_coins(self) -> Coins:
         """Creates new set of :class:`Coins` that have :class`Dec` amounts."""
-        return Coins(c.to_dec_coin() for c in self)
+        return Coins._from_sorted(c.to_dec_coin() for c in self)
 
     def to_int_coins(self) -> Coins:
         """Creates new set of :class:`Coins` that have ``int`` amounts."""
-        return Coins(c.to_int_coin() for c in self)
+        return Coins._from_sorted(c.to_int_coin() for c in self)
 
     def to_int_ceil_coins(self) -> Coins:
         """Creates a new :class:`Coins` object with all ``int`` coins with ceiling the amount"""
-        return Coins(c.to_int_ceil_coin() for c in self)
+        return Coins._from_sorted(c.to_int_ceil_coin() for c in self)
 
     def add(self, addend: Union[Coin, Coins]) -> Coins:
         """Performs addition, which combines the sets of Coin objects. Coins of similar denoms
@@ -171,9 +200,28 @@ class Coins(JSONSerializable, List[Coin_pb]):
             addend (Union[Coin, Coins]): addend
         """
         if isinstance(addend, Coin):
-            return Coins([addend, *self.to_list()])
+            other, other_is_dec = [addend], addend.is_dec_coin()
         else:
-            return Coins([*addend.to_list(), *self.to_list()])
+            addend = Coins(addend)
+            other, other_is_dec = addend._coins.values(), addend._is_dec()
+
+        # merged in one pass over the addend, and only sorted again if it brings new
+        # denoms
+        merged = dict(self._coins)
+        new_denoms = False
+        for coin in other:
+            x = merged.get(coin.denom)
+            if x is None:
+                merged[coin.denom] = coin
+                new_denoms = True
+            else:
+                merged[coin.denom] = x + coin
+        coins = [merged[d] for d in sorted(merged)] if new_denoms else merged.values()
+
+        # make all coins DecCoin if one is DecCoin
+        if self._is_dec() != other_is_dec:
+            coins = [c if c.is_dec_coin() else c.to_dec_coin() for c in coins]
+        return Coins._from_sorted(coins)
 
     def __add__(self, addend: Union[Coin, Coins]) -> Coins:
         return self.add(addend)
@@ -197,7 +245,8 @@ class Coins(JSONSerializable, List[Coin_pb]):
         Args:
             multiplier (Numeric.Input): multiplier
         """
-        return Coins(coin.mul(multiplier) for coin in self)
+        multiplier = Numeric.parse(multiplier)
+        return Coins._from_sorted(coin.mul(multiplier) for coin in self)
 
     def __mul__(self, multiplier: Numeric.Input) -> Coins:
         return self.mul(multiplier)
@@ -208,13 +257,14 @@ class Coins(JSONSerializable, List[Coin_pb]):
         Args:
             divisor (Numeric.Input): divisor
         """
-        return Coins(coin.div(divisor) for coin in self)
+        divisor = Numeric.parse(divisor)
+        return Coins._from_sorted(coin.div(divisor) for coin in self)
 
     def __truediv__(self, divisor: Numeric.Input) -> Coins:
-        return Coins(coin / divisor for coin in self)
+        return Coins._from_sorted(coin / divisor for coin in self)
 
     def __floordiv__(self, divisor: Numeric.Input) -> Coins:
-        return Coins(coin // divisor for coin in self)
+        return Coins._from_sorted(coin // divisor for coin in self)
 
     def to_list(self) -> List[Coin]:
         """Converts the set of :class:`Coin` objects contained into a sorted list by denom.
@@ -222,7 +272,7 @@ class Coins(JSONSerializable, List[Coin_pb]):
         Returns:
             List[Coin]: list, sorted by denom
         """
-        return sorted(self._coins.values(), key=lambda c: c.denom)
+        return list(self._coins.values())
 
     def filter(self, predicate: Callable[[Coin], bool]) -> Coins:
         """Creates a new :class:`Coins` collection which filters out all Coin objects that
@@ -231,7 +281,7 @@ class Coins(JSONSerializable, List[Coin_pb]):
         Args:
             predicate (Callable[[Coin], bool]): predicate for filtering
         """
-        return Coins(c for c in self if predicate(c))
+        return Coins._from_sorted(c for c in self if predicate(c))
 
     def map(self, fn: Callable[[Coin], Any]) -> Iterator[Any]:
         """Creates an iterable which applies the function to all coins in the set,
@@ -254,11 +304,17 @@ class Coins(JSONSerializable, List[Coin_pb]):
         except AttributeError:
             return False
 
+    def __hash__(self) -> int:
+        if self._hash is None:
+            # int and Dec amounts of the same value are equal, and must hash the same
+            self._hash = hash(tuple((c.denom, _dec_int(c.amount)) for c in self))
+        return self._hash
+
     def __iter__(self):
-        return iter(self.to_list())
+        return iter(self._coins.values())
 
     def __len__(self):
-        return len(self.to_list())
+        return len(self._coins)
 
     def __contains__(self, denom: str) -> bool:
         return denom in self._coins
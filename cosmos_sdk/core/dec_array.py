@@ -0,0 +1,416 @@
+"""Arrays of Dec values, for bulk fixed-point math."""
+
+from __future__ import annotations
+
+import operator
+from decimal import Decimal
+from itertools import repeat
+from typing import Iterable, List, Optional, Sequence, Union
+
+from .coin import Coin
+from .coins import Coins
+from .numeric import (
+    DEC_NUM_DIGITS,
+    DEC_ONE,
+    Dec,
+    Numeric,
+    _dec_int,
+    _new_dec,
+    chop_precision_and_round,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = ["DecArray"]
+
+_LIMB = 10 ** 9
+_HALF = DEC_ONE // 2
+# whole parts stored in NumPy stay below this, so that sums of two never overflow
+_WHOLE_LIMIT = 2 ** 62
+
+Operand = Union["DecArray", Sequence[Numeric.Input], Numeric.Input]
+
+
+def _is_scalar(value) -> bool:
+    return isinstance(value, (Dec, int, float, str, Decimal))
+
+
+def _split(values: List[int]):
+    """Whole and fractional columns of raw Dec integers, ``None`` if out of range."""
+    if np is None or not values:
+        return None
+    if min(values) < -_WHOLE_LIMIT * DEC_ONE or max(values) >= _WHOLE_LIMIT * DEC_ONE:
+        return None
+    raw = np.array(values, dtype=object)
+    return (raw // DEC_ONE).astype(np.int64), (raw % DEC_ONE).astype(np.int64)
+
+
+def _magnitude(whole, frac):
+    negative = whole < 0
+    borrow = negative & (frac > 0)
+    return (
+        np.where(negative, -whole - borrow, whole),
+        np.where(borrow, DEC_ONE - frac, frac),
+        negative,
+    )
+
+
+def _negate(whole, frac):
+    borrow = frac > 0
+    return -whole - borrow, np.where(borrow, DEC_ONE - frac, 0)
+
+
+def _max_whole(whole) -> int:
+    if not whole.size:
+        return 0
+    return max(-int(whole.min()), int(whole.max()))
+
+
+class DecArray:
+    """Many :class:`Dec` values in one array, with elementwise arithmetic and
+    comparisons giving exactly the same results as :class:`Dec`, including its banker's
+    rounding.
+
+    When NumPy is installed and the values fit, they are kept as two ``int64`` columns,
+    the whole and fractional parts, and additions, subtractions, multiplications,
+    sums and comparisons run vectorized. Multiplications split the values into base
+    10\\ :sup:`9` limbs so that every partial product fits 64 bits. Values too large
+    for the columns, results that could overflow them and divisions use Python
+    integers instead.
+
+    >>> rates = DecArray.from_strings(["0.015000000000000000", "0.021200000000000000"])
+    >>> balances = DecArray.from_coins(accounts, "uluna")
+    >>> (balances * rates).to_strings()
+
+    Args:
+        values (Iterable[Numeric.Input]): values to coerce into Dec, such as Decs,
+            ints or Dec-formatted strings
+    """
+
+    __slots__ = ("_raw", "_whole", "_frac")
+
+    def __init__(self, values: Iterable[Numeric.Input] = ()):
+        self._set([_dec_int(value) for value in values])
+
+    def _set(self, raw: Optional[List[int]], columns=None):
+        if columns is None:
+            columns = _split(raw)
+        if columns is None:
+            self._raw, self._whole, self._frac = raw, None, None
+        else:
+            self._raw = None
+            self._whole, self._frac = columns
+
+    @classmethod
+    def _from(cls, raw: Optional[List[int]] = None, columns=None) -> DecArray:
+        array = cls.__new__(cls)
+        array._set(raw, columns)
+        return array
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether the values are kept in NumPy columns."""
+        return self._whole is not None
+
+    def _ints(self) -> List[int]:
+        if self._raw is None:
+            self._raw = [
+                whole * DEC_ONE + frac
+                for whole, frac in zip(self._whole.tolist(), self._frac.tolist())
+            ]
+        return self._raw
+
+    @classmethod
+    def from_strings(cls, column: Iterable[str]) -> DecArray:
+        """Parses a column of Dec-formatted strings, such as amounts or rates of an LCD
+        response."""
+        return cls(column)
+
+    @classmethod
+    def from_decs(cls, decs: Iterable[Dec]) -> DecArray:
+        """Converts a list of :class:`Dec`."""
+        return cls._from([dec._i for dec in decs])
+
+    @classmethod
+    def from_coins(cls, coins_list: Iterable[Coins], denom: str) -> DecArray:
+        """Takes the amounts of one denomination from a list of :class:`Coins`, zero
+        where it is missing.
+
+        Args:
+            coins_list (Iterable[Coins]): coins, such as balances
+            denom (str): denomination to take
+        """
+        raw = []
+        for coins in coins_list:
+            coin = coins.get(denom)
+            raw.append(0 if coin is None else _dec_int(coin.amount))
+        return cls._from(raw)
+
+    def to_decs(self) -> List[Dec]:
+        """Converts to a list of :class:`Dec`."""
+        return [_new_dec(i) for i in self._ints()]
+
+    def to_strings(self) -> List[str]:
+        """Converts to a column of Dec-formatted strings, with all 18 decimal digits."""
+        if self._whole is None:
+            return [str(_new_dec(i)) for i in self._raw]
+        whole, frac, negative = _magnitude(self._whole, self._frac)
+        return [
+            f"{'-' if n else ''}{w}.{str(f).rjust(DEC_NUM_DIGITS, '0')}"
+            for w, f, n in zip(whole.tolist(), frac.tolist(), negative.tolist())
+        ]
+
+    def to_coins(self, denom: str) -> List[Coins]:
+        """Converts to a list of :class:`Coins` holding one ``Dec``-amount coin of
+        ``denom`` each.
+
+        Args:
+            denom (str): denomination of the coins
+        """
+        return [Coins([Coin(denom, _new_dec(i))]) for i in self._ints()]
+
+    def __len__(self) -> int:
+        return len(self._raw) if self._raw is not None else len(self._whole)
+
+    def __iter__(self):
+        return iter(self.to_decs())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if self._raw is not None:
+                return DecArray._from(self._raw[index])
+            return DecArray._from(columns=(self._whole[index], self._frac[index]))
+        return _new_dec(self._ints()[index])
+
+    def __repr__(self) -> str:
+        return f"DecArray([{', '.join(dec.to_short_str() for dec in self)}])"
+
+    def _operand(self, other: Operand):
+        """Raw integers and NumPy columns (if in range) of an operand of ``self``'s
+        length. Scalars are broadcast."""
+        n = len(self)
+        if isinstance(other, DecArray):
+            if len(other) != n:
+                raise ValueError(f"operands have lengths {n} and {len(other)}")
+            if other._whole is not None:
+                return None, (other._whole, other._frac)
+            return other._ints(), None
+        if _is_scalar(other):
+            i = _dec_int(other)
+            columns = None
+            if np is not None and -_WHOLE_LIMIT * DEC_ONE <= i < _WHOLE_LIMIT * DEC_ONE:
+                whole, frac = divmod(i, DEC_ONE)
+                columns = (np.int64(whole), np.int64(frac))
+            return repeat(i, n), columns
+        return self._operand(DecArray(other))
+
+    def _binary(self, other: Operand, vectorized, python) -> DecArray:
+        raw, columns = self._operand(other)
+        if self._whole is not None and columns is not None:
+            result = vectorized(self._whole, self._frac, *columns)
+            if result is not None:
+                return DecArray._from(columns=result)
+        if raw is None:
+            raw = DecArray._from(columns=columns)._ints()
+        return DecArray._from(python(self._ints(), raw))
+
+    @staticmethod
+    def _add_columns(wx, fx, wy, fy):
+        if max(_max_whole(wx), _max_whole(wy)) >= _WHOLE_LIMIT:
+            return None
+        frac = fx + fy
+        carry = frac >= DEC_ONE
+        return wx + wy + carry, frac - carry * DEC_ONE
+
+    @staticmethod
+    def _sub_columns(wx, fx, wy, fy):
+        if max(_max_whole(wx), _max_whole(wy)) >= _WHOLE_LIMIT:
+            return None
+        frac = fx - fy
+        borrow = frac < 0
+        return wx - wy - borrow, frac + borrow * DEC_ONE
+
+    @staticmethod
+    def _mul_columns(wx, fx, wy, fy):
+        max_x, max_y = _max_whole(wx), _max_whole(wy)
+        if max_x >= DEC_ONE or max_y >= DEC_ONE or (max_x + 1) * (max_y + 1) >= 2 ** 62:
+            return None
+        wx, fx, nx = _magnitude(wx, fx)
+        wy, fy, ny = _magnitude(wy, fy)
+
+        # digits in base 1e9, lowest first: every partial product is below 1e18 and a
+        # column sums at most 4 of them, below 2^63
+        x = [fx % _LIMB, fx // _LIMB, wx % _LIMB, wx // _LIMB]
+        y = [fy % _LIMB, fy // _LIMB, wy % _LIMB, wy // _LIMB]
+        columns = []
+        carry = 0
+        for k in range(7):
+            column = carry
+            for i in range(max(0, k - 3), min(k, 3) + 1):
+                column = column + x[i] * y[k - i]
+            carry = column // _LIMB
+            columns.append(column % _LIMB)
+
+        # product / 1e18 is columns 2 and up, the remainder columns 0 and 1; the whole
+        # part is below 2^62 here, so there is no carry out of column 6
+        frac = columns[3] * _LIMB + columns[2]
+        whole = columns[4] + columns[5] * _LIMB + columns[6] * _LIMB ** 2
+        rem = columns[1] * _LIMB + columns[0]
+        # banker's rounding as chop_precision_and_round; 1e9 is even, so the parity of
+        # the quotient is the parity of its lowest digit
+        up = (rem > _HALF) | ((rem == _HALF) & (columns[2] % 2 == 1))
+        frac = frac + up
+        carry = frac == DEC_ONE
+        whole, frac = whole + carry, np.where(carry, 0, frac)
+
+        negative = nx != ny
+        neg_whole, neg_frac = _negate(whole, frac)
+        return np.where(negative, neg_whole, whole), np.where(negative, neg_frac, frac)
+
+    def add(self, addend: Operand) -> DecArray:
+        """Elementwise :meth:`Dec.add`. Scalars are added to every element."""
+        return self._binary(
+            addend, DecArray._add_columns, lambda x, y: list(map(operator.add, x, y))
+        )
+
+    def __add__(self, addend: Operand) -> DecArray:
+        return self.add(addend)
+
+    __radd__ = __add__
+
+    def sub(self, subtrahend: Operand) -> DecArray:
+        """Elementwise :meth:`Dec.sub`."""
+        return self._binary(
+            subtrahend,
+            DecArray._sub_columns,
+            lambda x, y: list(map(operator.sub, x, y)),
+        )
+
+    def __sub__(self, subtrahend: Operand) -> DecArray:
+        return self.sub(subtrahend)
+
+    def __rsub__(self, minuend: Operand) -> DecArray:
+        return (-self).add(minuend)
+
+    def mul(self, multiplier: Operand) -> DecArray:
+        """Elementwise :meth:`Dec.mul`, rounded like it."""
+        return self._binary(
+            multiplier,
+            DecArray._mul_columns,
+            lambda x, y: [chop_precision_and_round(a * b) for a, b in zip(x, y)],
+        )
+
+    def __mul__(self, multiplier: Operand) -> DecArray:
+        return self.mul(multiplier)
+
+    __rmul__ = __mul__
+
+    def div(self, divisor: Operand) -> DecArray:
+        """Elementwise :meth:`Dec.div`, rounded like it.
+
+        Raises:
+            ZeroDivisionError: if an element of ``divisor`` is 0
+        """
+
+        def divide(x, y):
+            result = []
+            for a, b in zip(x, y):
+                if b == 0:
+                    raise ZeroDivisionError(f"tried to divide by 0: {_new_dec(a)!r}")
+                result.append(chop_precision_and_round(a * DEC_ONE * DEC_ONE // b))
+            return result
+
+        return self._binary(divisor, lambda *columns: None, divide)
+
+    def __truediv__(self, divisor: Operand) -> DecArray:
+        return self.div(divisor)
+
+    def __rtruediv__(self, dividend: Operand) -> DecArray:
+        if _is_scalar(dividend):
+            return DecArray._from([_dec_int(dividend)] * len(self)).div(self)
+        return DecArray(dividend).div(self)
+
+    def __neg__(self) -> DecArray:
+        if self._whole is not None and _max_whole(self._whole) < _WHOLE_LIMIT:
+            return DecArray._from(columns=_negate(self._whole, self._frac))
+        return DecArray._from([-i for i in self._ints()])
+
+    def sum(self) -> Dec:
+        """Sums the elements.
+
+        Returns:
+            Dec: sum, zero for an empty array
+        """
+        if self._whole is None:
+            return _new_dec(sum(self._raw))
+        if len(self) * _max_whole(self._whole) < 2 ** 63:
+            whole = int(self._whole.sum())
+        else:
+            whole = sum(self._whole.tolist())
+        # fractional digits are summed in two halves, which cannot overflow
+        high, low = self._frac // _LIMB, self._frac % _LIMB
+        frac = int(high.sum()) * _LIMB + int(low.sum())
+        return _new_dec(whole * DEC_ONE + frac)
+
+    def _compare(self, other: Operand, op, vectorized) -> List[bool]:
+        raw, columns = self._operand(other)
+        if self._whole is not None and columns is not None:
+            return vectorized(self._whole, self._frac, *columns).tolist()
+        if raw is None:
+            raw = DecArray._from(columns=columns)._ints()
+        return list(map(op, self._ints(), raw))
+
+    def lt(self, other: Operand) -> List[bool]:
+        """Elementwise less than."""
+        return self._compare(
+            other,
+            operator.lt,
+            lambda wx, fx, wy, fy: (wx < wy) | ((wx == wy) & (fx < fy)),
+        )
+
+    def le(self, other: Operand) -> List[bool]:
+        """Elementwise less than or equal to."""
+        return self._compare(
+            other,
+            operator.le,
+            lambda wx, fx, wy, fy: (wx < wy) | ((wx == wy) & (fx <= fy)),
+        )
+
+    def gt(self, other: Operand) -> List[bool]:
+        """Elementwise greater than."""
+        return self._compare(
+            other,
+            operator.gt,
+            lambda wx, fx, wy, fy: (wx > wy) | ((wx == wy) & (fx > fy)),
+        )
+
+    def ge(self, other: Operand) -> List[bool]:
+        """Elementwise greater than or equal to."""
+        return self._compare(
+            other,
+            operator.ge,
+            lambda wx, fx, wy, fy: (wx > wy) | ((wx == wy) & (fx >= fy)),
+        )
+
+    def eq(self, other: Operand) -> List[bool]:
+        """Elementwise equality."""
+        return self._compare(
+            other,
+            operator.eq,
+            lambda wx, fx, wy, fy: (wx == wy) & (fx == fy),
+        )
+
+    def ne(self, other: Operand) -> List[bool]:
+        """Elementwise inequality."""
+        return [not equal for equal in self.eq(other)]
+
+    __lt__ = lt
+    __le__ = le
+    __gt__ = gt
+    __ge__ = ge
+    __eq__ = eq
+    __ne__ = ne
+    __hash__ = None
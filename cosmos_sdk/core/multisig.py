@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List
 
 import attr
 
@@ -26,6 +26,20 @@ class MultiSignature(JSONSerializable):
         n = len(self.multisig_pubkey.public_keys)
         self.bitarray = CompactBitArray.from_bits(n)
         self.signatures = []
+        self._indices: Dict[bytes, int] = {}
+        for i, public_key in enumerate(self.multisig_pubkey.public_keys):
+            self._indices.setdefault(bytes(public_key.key), i)
+
+    def index_of(self, public_key: SimplePublicKey) -> int:
+        """Finds the position of a member key in the multisig public key.
+
+        Raises:
+            ValueError: if the key is not a member of the multisig public key
+        """
+        index = self._indices.get(bytes(public_key.key))
+        if index is None:
+            raise ValueError("provided key doesn't exist in public_keys")
+        return index
 
     def append_signature(self, signature_data: Descriptor, index: int):
         new_idx = self.bitarray.num_true_bits_before(index)
@@ -46,14 +60,7 @@ class MultiSignature(JSONSerializable):
     def append_signature_from_pubkey(
         self, signature_data: Descriptor, public_key: SimplePublicKey
     ):
-        index = 0
-        for i, v in enumerate(self.multisig_pubkey.public_keys):
-            if v.key == public_key.key:
-                index = i
-                break
-        if index < 0:
-            raise ValueError("provided key doesn't exist in public_keys")
-        self.append_signature(signature_data, index)
+        self.append_signature(signature_data, self.index_of(public_key))
 
     def append_signature_v2s(self, signatures: List[SignatureV2]):
         for sig in signatures:
@@ -17,22 +17,43 @@ DEC_PATTERN = re.compile(r"^(\-)?(\d+)(\.(\d+))?\Z")
 __all__ = ["DEC_NUM_DIGITS", "Dec", "Numeric"]
 
 
+_HALF = DEC_ONE // 2
+
+
+def _parse_dec_string(arg: str) -> int:
+    # plain ASCII decimals, such as the 18-digit strings of the chain, skip the regex
+    whole, dot, fraction = arg.partition(".")
+    negative = whole[:1] == "-"
+    if negative:
+        whole = whole[1:]
+    digits = whole + fraction
+    if digits.isascii() and digits.isdigit() and whole and (fraction or not dot):
+        if len(fraction) == DEC_NUM_DIGITS:
+            result = int(digits)
+        else:
+            result = int(whole + fraction[0:DEC_NUM_DIGITS].ljust(DEC_NUM_DIGITS, "0"))
+        return -result if negative else result
+
+    # other digits matched by \d, or invalid strings
+    parts = DEC_PATTERN.match(arg)
+    if parts is None:
+        raise ValueError(f"Unable to parse Dec from string: {arg}")
+    result = int(parts.group(2)) * DEC_ONE  # whole part
+    if parts.group(3):
+        fraction = int(parts.group(4)[0:DEC_NUM_DIGITS].ljust(DEC_NUM_DIGITS, "0"))
+        result += fraction
+    if parts.group(1):
+        result *= -1
+    return result
+
+
 def convert_to_dec_bignum(arg: Union[str, int, float, Decimal]):
     if isinstance(arg, int) or isinstance(arg, Decimal):
         return int(arg * DEC_ONE)
     if isinstance(arg, float):
         arg = str("%f" % arg)
     if isinstance(arg, str):
-        parts = DEC_PATTERN.match(arg)
-        if parts is None:
-            raise ValueError(f"Unable to parse Dec from string: {arg}")
-        result = int(parts.group(2)) * DEC_ONE  # whole part
-        if parts.group(3):
-            fraction = int(parts.group(4)[0:DEC_NUM_DIGITS].ljust(DEC_NUM_DIGITS, "0"))
-            result += fraction
-        if parts.group(1):
-            result *= -1
-        return result
+        return _parse_dec_string(arg)
     else:
         raise TypeError(
             f"Unable to parse Dec integer representation from given argument {arg}"
@@ -46,19 +67,36 @@ def chop_precision_and_round(d: int) -> int:
     if d < 0:
         return -1 * chop_precision_and_round(d * -1)
 
-    quo, rem = d // DEC_ONE, d % DEC_ONE
-
-    if rem == 0:
-        return quo
+    if type(d) is int:
+        quo, rem = divmod(d, DEC_ONE)
+    else:
+        quo, rem = d // DEC_ONE, d % DEC_ONE
 
-    if rem < DEC_ONE / 2:
+    if rem < _HALF:
         return quo
-    elif rem > DEC_ONE / 2:
-        return quo + 1
-    else:
-        if quo % 2 == 0:
-            return quo
+    if rem > _HALF or quo % 2:
         return quo + 1
+    return quo
+
+
+def _new_dec(i: int) -> Dec:
+    nd = object.__new__(Dec)
+    nd._i = i
+    return nd
+
+
+def _dec_int(arg: Union[str, int, float, Decimal, Dec]) -> int:
+    """Integer representation of ``Dec(arg)``, without creating the Dec."""
+    t = type(arg)
+    if t is Dec:
+        return arg._i
+    if t is int:
+        return arg * DEC_ONE
+    if t is str:
+        return _parse_dec_string(arg)
+    if isinstance(arg, Dec):
+        return arg._i
+    return convert_to_dec_bignum(arg)
 
 
 class Dec(JSONSerializable):
@@ -78,14 +116,15 @@ class Dec(JSONSerializable):
         arg (Union[str, int, float, Decimal, Dec]): argument to coerce into Dec
     """
 
-    _i: int = 0
+    __slots__ = ("_i",)
+
+    _i: int
 
     def __init__(self, arg: Union[str, int, float, Decimal, Dec]):
         if isinstance(arg, Dec):
             self._i = arg._i
-            return
         else:
-            self._i = int(convert_to_dec_bignum(arg))
+            self._i = _dec_int(arg)
 
     @classmethod
     def zero(cls) -> Dec:
@@ -113,10 +152,12 @@ class Dec(JSONSerializable):
         Returns:
             str: string representation
         """
-        if self._i == 0:
+        i = self._i
+        if i == 0:
             return "0." + DEC_NUM_DIGITS * "0"
-        parity = "-" if self._i < 0 else ""
-        return f"{parity}{self.whole}.{self.frac}"
+        whole, frac = divmod(abs(i), DEC_ONE)
+        parity = "-" if i < 0 else ""
+        return f"{parity}{whole}.{str(frac).rjust(DEC_NUM_DIGITS, '0')}"
 
     def to_short_str(self) -> str:
         """Converts to a string, but truncates all unnecessary zeros.
@@ -124,10 +165,11 @@ class Dec(JSONSerializable):
         Returns:
             str: string representation
         """
+        whole, frac = divmod(abs(self._i), DEC_ONE)
         parity = "-" if self._i < 0 else ""
-        frac = self.frac.rstrip("0")
-        dot = "." if len(frac) > 0 else ""
-        return f"{parity}{self.whole}{dot}{frac}"
+        if frac == 0:
+            return f"{parity}{whole}"
+        return f"{parity}{whole}.{str(frac).rjust(DEC_NUM_DIGITS, '0').rstrip('0')}"
 
     def __repr__(self):
         return f"Dec('{self.to_short_str()}')"  # short representation
@@ -176,7 +218,7 @@ class Dec(JSONSerializable):
         if isinstance(other, str):
             return False
         else:
-            return self._i == Dec(other)._i
+            return self._i == _dec_int(other)
 
     def lt(self, other: Union[str, int, float, Decimal, Dec]) -> bool:
         """Check less than.
@@ -186,6 +228,8 @@ class Dec(JSONSerializable):
         """
         if isinstance(other, Dec):
             return self._i < other._i
+        if type(other) is int:
+            return self._i < other * DEC_ONE
         return (Decimal(self._i) / DEC_ONE) < other
 
     def __lt__(self, other: Union[str, int, float, Decimal, Dec]) -> bool:
@@ -210,6 +254,8 @@ class Dec(JSONSerializable):
         """
         if isinstance(other, Dec):
             return self._i > other._i
+        if type(other) is int:
+            return self._i > other * DEC_ONE
         return (Decimal(self._i) / DEC_ONE) > other
 
     def __gt__(self, other) -> bool:
@@ -235,15 +281,22 @@ class Dec(JSONSerializable):
         Returns:
             Dec: sum
         """
-        nd = Dec.zero()
-        nd._i = self._i + Dec(addend)._i
-        return nd
+        return _new_dec(self._i + _dec_int(addend))
+
+    # the operators return NotImplemented for operands they cannot convert, so that
+    # Python tries the reflected operation of the other operand, e.g. of a DecArray
 
     def __add__(self, addend: Union[str, int, float, Decimal, Dec]) -> Dec:
-        return self.add(addend)
+        try:
+            return _new_dec(self._i + _dec_int(addend))
+        except TypeError:
+            return NotImplemented
 
     def __radd__(self, addend: Union[str, int, float, Decimal, Dec]):
-        return Dec(addend).add(self)
+        try:
+            return _new_dec(_dec_int(addend) + self._i)
+        except TypeError:
+            return NotImplemented
 
     def sub(self, subtrahend: Union[str, int, float, Decimal, Dec]) -> Dec:
         """Performs subtraction. ``subtrahend`` is first converted into Dec.
@@ -254,15 +307,19 @@ class Dec(JSONSerializable):
         Returns:
             Dec: difference
         """
-        nd = Dec.zero()
-        nd._i = self._i - Dec(subtrahend)._i
-        return nd
+        return _new_dec(self._i - _dec_int(subtrahend))
 
     def __sub__(self, subtrahend: Union[str, int, float, Decimal, Dec]) -> Dec:
-        return self.sub(subtrahend)
+        try:
+            return _new_dec(self._i - _dec_int(subtrahend))
+        except TypeError:
+            return NotImplemented
 
     def __rsub__(self, minuend: Dec) -> Dec:
-        return Dec(minuend).sub(self)
+        try:
+            return _new_dec(_dec_int(minuend) - self._i)
+        except TypeError:
+            return NotImplemented
 
     def mul(self, multiplier: Union[str, int, float, Decimal, Dec]) -> Dec:
         """Performs multiplication. ``multiplier`` is first converted into Dec.
@@ -273,17 +330,22 @@ class Dec(JSONSerializable):
         Returns:
             Dec: product
         """
-        x = self._i
-        y = Dec(multiplier)._i
-        nd = Dec.zero()
-        nd._i = chop_precision_and_round(x * y)
-        return nd
+        if type(multiplier) is int:
+            # exact, there is nothing to round
+            return _new_dec(self._i * multiplier)
+        return _new_dec(chop_precision_and_round(self._i * _dec_int(multiplier)))
 
     def __mul__(self, multiplier: Union[str, int, float, Decimal, Dec]) -> Dec:
-        return self.mul(multiplier)
+        try:
+            return self.mul(multiplier)
+        except TypeError:
+            return NotImplemented
 
     def __rmul__(self, multiplicand: Union[str, int, float, Decimal, Dec]):
-        return Dec(multiplicand).mul(self)
+        try:
+            return Dec(multiplicand).mul(self)
+        except TypeError:
+            return NotImplemented
 
     def div(self, divisor: Union[str, int, float, Decimal, Dec]) -> Dec:
         """Performs division. ``divisor`` is first converted into Dec.
@@ -298,17 +360,22 @@ class Dec(JSONSerializable):
         Returns:
             Dec: quotient
         """
-        if Dec(divisor)._i == 0:
+        y = _dec_int(divisor)
+        if y == 0:
             raise ZeroDivisionError(f"tried to divide by 0: {self!r} / {divisor!r}")
-        nd = Dec.zero()
-        nd._i = chop_precision_and_round(self._i * DEC_ONE * DEC_ONE // Dec(divisor)._i)
-        return nd
+        return _new_dec(chop_precision_and_round(self._i * DEC_ONE * DEC_ONE // y))
 
     def __truediv__(self, divisor) -> Dec:
-        return self.div(divisor)
+        try:
+            return self.div(divisor)
+        except TypeError:
+            return NotImplemented
 
     def __rtruediv__(self, divisor) -> Dec:
-        return Dec(divisor).div(self)
+        try:
+            return Dec(divisor).div(self)
+        except TypeError:
+            return NotImplemented
 
     def __floordiv__(self, divisor):
         return Dec(chop_precision_and_round(self.div(divisor).sub(0.5)._i))
@@ -331,18 +398,14 @@ class Dec(JSONSerializable):
         return self.mod(modulo)
 
     def __neg__(self) -> Dec:
-        x = Dec(self)
-        x._i *= -1
-        return x
+        return _new_dec(-self._i)
 
     def __abs__(self) -> Dec:
-        x = Dec(self)
-        x._i = abs(x._i)
-        return x
+        return _new_dec(abs(self._i))
 
     def __pos__(self) -> Dec:
         # __pos__ implies a copy
-        return Dec(self)
+        return _new_dec(self._i)
 
     @classmethod
     def from_data(cls, data: str) -> Dec:
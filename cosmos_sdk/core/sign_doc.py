@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-import json
-
 import attr
 from cosmos_proto.cosmos.tx.v1beta1 import SignDoc as SignDoc_pb
 
 from cosmos_sdk.core.tx import AuthInfo, TxBody
-from cosmos_sdk.util.json import JSONSerializable
+from cosmos_sdk.util.json import JSONSerializable, canonical_json
 
 __all__ = ["SignDoc"]
 
@@ -68,8 +66,8 @@ class SignDoc(JSONSerializable):
 
     def to_proto(self) -> SignDoc_pb:
         return SignDoc_pb(
-            body_bytes=bytes(self.tx_body.to_proto()),
-            auth_info_bytes=bytes(self.auth_info.to_proto()),
+            body_bytes=self.tx_body.to_bytes(),
+            auth_info_bytes=self.auth_info.to_bytes(),
             chain_id=self.chain_id,
             account_number=self.account_number,
         )
@@ -78,8 +76,4 @@ class SignDoc(JSONSerializable):
         return bytes(self.to_proto())
 
     def to_amino_json(self) -> bytes:
-        amino = self.to_amino()
-        return bytes(
-            json.dumps(remove_none(amino), sort_keys=True, separators=(",", ":")),
-            "utf-8",
-        )
+        return canonical_json(remove_none(self.to_amino()))
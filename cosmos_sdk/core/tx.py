@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import base64
 import json
-from typing import Dict, List, Optional
+from collections.abc import MutableSequence
+from typing import Any as AnyType
+from typing import Callable, Dict, List, Optional
 
 import attr
+from betterproto import encode_varint, parse_fields
 from betterproto.lib.google.protobuf import Any
 from cosmos_proto.cosmos.base.abci.v1beta1 import AbciMessageLog as AbciMessageLog_pb
 from cosmos_proto.cosmos.base.abci.v1beta1 import Attribute as Attribute_pb
@@ -14,6 +17,7 @@ from cosmos_proto.cosmos.base.abci.v1beta1 import StringEvent as StringEvent_pb
 from cosmos_proto.cosmos.base.abci.v1beta1 import TxResponse as TxResponse_pb
 from cosmos_proto.cosmos.tx.signing.v1beta1 import SignMode as SignMode_pb
 from cosmos_proto.cosmos.tx.v1beta1 import AuthInfo as AuthInfo_pb
+from cosmos_proto.cosmos.tx.v1beta1 import Fee as Fee_pb
 from cosmos_proto.cosmos.tx.v1beta1 import SignerInfo as SignerInfo_pb
 from cosmos_proto.cosmos.tx.v1beta1 import Tx as Tx_pb
 from cosmos_proto.cosmos.tx.v1beta1 import TxBody as TxBody_pb
@@ -28,7 +32,8 @@ from cosmos_sdk.core.public_key import (
     SimplePublicKey,
 )
 from cosmos_sdk.core.signature_v2 import SignatureV2
-from cosmos_sdk.util.json import JSONSerializable
+from cosmos_sdk.util.hash import hash_tx_bytes
+from cosmos_sdk.util.json import JSONSerializable, to_data
 
 __all__ = [
     "SignMode",
@@ -48,6 +53,133 @@ from cosmos_sdk.util.parse_msg import parse_proto
 SignMode = SignMode_pb
 
 
+def _length_delimited(field_number: int, value: bytes) -> bytes:
+    return bytes([field_number << 3 | 2]) + encode_varint(len(value)) + value
+
+
+def _memoized_bytes(obj) -> bytes:
+    """Serializes ``obj`` to protobuf, reusing the bytes of the previous call while
+    its JSON data is unchanged. Comparing the data is much cheaper than encoding, and
+    catches in-place changes of nested messages."""
+    data = obj.to_data()
+    memo = obj.__dict__.get("_bytes_memo")
+    if memo is None or memo[0] != data:
+        memo = obj.__dict__["_bytes_memo"] = (data, bytes(obj.to_proto()))
+    return memo[1]
+
+
+class _LazyField:
+    """Attribute of an object decoded lazily, computed by ``decode`` from the raw data
+    kept in the object's ``_raw`` on first access. The result is stored in the
+    instance ``__dict__``, which takes precedence over this descriptor afterwards.
+
+    With ``snapshot``, the JSON data of the decoded value is kept as well, for
+    :func:`_is_unchanged` to tell whether the value was modified since."""
+
+    def __init__(
+        self, name: str, decode: Callable[[AnyType], AnyType], snapshot: bool = False
+    ):
+        self.name = name
+        self.decode = decode
+        self.snapshot = snapshot
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name] = self.decode(obj.__dict__["_raw"])
+        if self.snapshot:
+            obj.__dict__.setdefault("_snapshots", {})[self.name] = to_data(value)
+        return value
+
+
+def _new_lazy(cls, raw, **fields):
+    """Creates ``cls`` without running its ``__init__``, from the values of its eager
+    fields and the raw data of its lazy fields."""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(fields)
+    obj.__dict__["_raw"] = raw
+    return obj
+
+
+def _is_unchanged(obj, *names: str) -> bool:
+    """Whether the lazy fields ``names`` of ``obj`` still hold the values decoded from
+    its raw data, if decoded at all."""
+    snapshots = obj.__dict__.get("_snapshots", {})
+    return all(
+        name not in obj.__dict__
+        or (name in snapshots and to_data(obj.__dict__[name]) == snapshots[name])
+        for name in names
+    )
+
+
+class _Undecoded:
+    __slots__ = ("raw",)
+
+    def __init__(self, raw):
+        self.raw = raw
+
+
+class _LazyMessages(MutableSequence):
+    """List of the messages of a lazily decoded :class:`TxBody`. Messages are decoded
+    one by one when accessed, and then kept."""
+
+    __hash__ = None  # type: ignore
+
+    def __init__(
+        self,
+        raw: list,
+        decode: Callable[[AnyType], Msg],
+        type_url: Callable[[AnyType], str],
+    ):
+        self._items = [_Undecoded(m) for m in raw]
+        self._count = len(self._items)
+        self._decode = decode
+        self._type_url = type_url
+
+    def _get(self, index: int) -> Msg:
+        item = self._items[index]
+        if isinstance(item, _Undecoded):
+            item = self._items[index] = self._decode(item.raw)
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._items)))]
+        return self._get(index)
+
+    def __setitem__(self, index, value):
+        self._items[index] = value
+
+    def __delitem__(self, index):
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, index: int, value: Msg):
+        self._items.insert(index, value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, _LazyMessages)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def is_pristine(self) -> bool:
+        """Whether no message was accessed, added or removed."""
+        return len(self._items) == self._count and all(
+            isinstance(item, _Undecoded) for item in self._items
+        )
+
+    def type_urls(self) -> List[str]:
+        return [
+            self._type_url(item.raw) if isinstance(item, _Undecoded) else item.type_url
+            for item in self._items
+        ]
+
+
 @attr.s
 class SignerData:
     sequence: int = attr.ib(converter=int)
@@ -82,12 +214,81 @@ class Tx(JSONSerializable):
             signatures=self.signatures
         )
 
+    def to_bytes(self) -> bytes:
+        """Serializes the transaction to protobuf. The bytes of the body and auth info
+        are reused from previous serializations (e.g. when signing) while unchanged.
+
+        Returns:
+            bytes: same bytes as ``bytes(tx.to_proto())``
+        """
+        raw = self.__dict__.get("_raw")
+        if raw is not None and "bytes" in raw:
+            # decoded lazily from bytes: while unchanged, they are the encoding
+            body, auth_info = self.__dict__.get("body"), self.__dict__.get("auth_info")
+            if (
+                (body is None or body.to_bytes() is raw["body"])
+                and (auth_info is None or auth_info.to_bytes() is raw["auth_info"])
+                and raw["signatures"] == tuple(self.signatures)
+            ):
+                return raw["bytes"]
+        body = self.body.to_bytes()
+        auth_info = self.auth_info.to_bytes()
+        signatures = tuple(self.signatures)
+        memo = self.__dict__.get("_bytes_memo")
+        if (
+            memo is not None
+            and memo[0] is body
+            and memo[1] is auth_info
+            and memo[2] == signatures
+        ):
+            return memo[3]
+        if not body or not auth_info or not all(signatures):
+            # empty fields are encoded by betterproto's own rules
+            tx_bytes = bytes(self.to_proto())
+        else:
+            tx_bytes = b"".join(
+                [
+                    _length_delimited(1, body),
+                    _length_delimited(2, auth_info),
+                    *[_length_delimited(3, sig) for sig in signatures],
+                ]
+            )
+        self.__dict__["_bytes_memo"] = (body, auth_info, signatures, tx_bytes)
+        return tx_bytes
+
+    def hash(self) -> str:
+        """Computes the hash of the transaction from its protobuf encoding. The hash is
+        kept until the transaction changes.
+
+        Returns:
+            str: uppercase hex transaction hash, as reported by nodes
+        """
+        tx_bytes = self.to_bytes()
+        memo = self.__dict__.get("_hash_memo")
+        if memo is None or memo[0] is not tx_bytes:
+            memo = self.__dict__["_hash_memo"] = (tx_bytes, hash_tx_bytes(tx_bytes))
+        return memo[1]
+
     @classmethod
-    def from_data(cls, data: dict) -> Tx:
+    def from_data(cls, data: dict, lazy: bool = False) -> Tx:
+        """Converts JSON data to a transaction.
+
+        Args:
+            data (dict): JSON data
+            lazy (bool, optional): keep ``data`` and decode the body and the auth info
+                on first access, and each message only when it is accessed.
+                Defaults to False.
+
+        Returns:
+            Tx: transaction
+        """
+        signatures = [base64.b64decode(sig) for sig in data["signatures"]]
+        if lazy:
+            return _new_lazy(cls, data, signatures=signatures)
         return cls(
             TxBody.from_data(data["body"]),
             AuthInfo.from_data(data["auth_info"]),
-            [base64.b64decode(sig) for sig in data["signatures"]],
+            signatures,
         )
 
     @classmethod
@@ -99,10 +300,32 @@ class Tx(JSONSerializable):
         )
 
     @classmethod
-    def from_bytes(cls, txb: bytes) -> Tx:
-        proto = Tx_pb().parse(txb)
-        c = cls.from_proto(proto)
-        return c
+    def from_bytes(cls, txb: bytes, lazy: bool = False) -> Tx:
+        """Decodes a transaction from protobuf.
+
+        Args:
+            txb (bytes): protobuf encoded transaction
+            lazy (bool, optional): keep ``txb`` and decode the body and the auth info on
+                first access, and each message only when it is accessed. While the
+                messages are not accessed and nothing else is changed,
+                :meth:`to_bytes` and :meth:`hash` use ``txb`` as is. Defaults to False.
+
+        Returns:
+            Tx: transaction
+        """
+        if not lazy:
+            return cls.from_proto(Tx_pb().parse(txb))
+        raw = {"bytes": txb, "body": b"", "auth_info": b""}
+        signatures = []
+        for field in parse_fields(txb):
+            if field.number == 1:
+                raw["body"] = field.value
+            elif field.number == 2:
+                raw["auth_info"] = field.value
+            elif field.number == 3:
+                signatures.append(field.value)
+        raw["signatures"] = tuple(signatures)
+        return _new_lazy(cls, raw, signatures=signatures)
 
     def append_empty_signatures(self, signers: List[SignerData]):
         for signer in signers:
@@ -179,13 +402,48 @@ class TxBody(JSONSerializable):
             timeout_height=self.timeout_height,
         )
 
+    def to_bytes(self) -> bytes:
+        """Serializes the body to protobuf, reusing the bytes of the previous call while
+        the body is unchanged."""
+        raw = self.__dict__.get("_raw")
+        if (
+            raw is not None
+            and isinstance(self.messages, _LazyMessages)
+            and self.messages.is_pristine()
+            and self.memo == raw["memo"]
+            and self.timeout_height == raw["timeout_height"]
+        ):
+            return raw["bytes"]
+        return _memoized_bytes(self)
+
+    def message_type_urls(self) -> List[str]:
+        """Type URLs of the messages, without decoding the messages of a lazily
+        decoded body.
+
+        Returns:
+            List[str]: type URL of each message, in order
+        """
+        if isinstance(self.messages, _LazyMessages):
+            return self.messages.type_urls()
+        return [m.type_url for m in self.messages]
+
     @classmethod
-    def from_data(cls, data: dict) -> TxBody:
-        return cls(
-            [Msg.from_data(m) for m in data["messages"]],
-            data["memo"],
-            data["timeout_height"],
-        )
+    def from_data(cls, data: dict, lazy: bool = False) -> TxBody:
+        """Converts JSON data to a transaction body.
+
+        Args:
+            data (dict): JSON data
+            lazy (bool, optional): decode each message only when it is accessed.
+                Defaults to False.
+
+        Returns:
+            TxBody: transaction body
+        """
+        if lazy:
+            messages = _LazyMessages(data["messages"], Msg.from_data, _data_type_url)
+        else:
+            messages = [Msg.from_data(m) for m in data["messages"]]
+        return cls(messages, data["memo"], data["timeout_height"])
 
     @classmethod
     def from_proto(cls, proto: TxBody_pb) -> TxBody:
@@ -223,6 +481,14 @@ class AuthInfo(JSONSerializable):
             fee=self.fee.to_proto(),
         )
 
+    def to_bytes(self) -> bytes:
+        """Serializes the auth info to protobuf, reusing the bytes of the previous call
+        while the auth info is unchanged."""
+        raw = self.__dict__.get("_raw")
+        if raw is not None and _is_unchanged(self, "signer_infos", "fee"):
+            return raw["bytes"]
+        return _memoized_bytes(self)
+
     @classmethod
     def from_data(cls, data: dict) -> AuthInfo:
         return cls(
@@ -446,7 +712,31 @@ class TxInfo(JSONSerializable):
         return data
 
     @classmethod
-    def from_data(cls, data: dict) -> TxInfo:
+    def from_data(cls, data: dict, lazy: bool = False) -> TxInfo:
+        """Converts JSON data to transaction info.
+
+        Args:
+            data (dict): JSON data
+            lazy (bool, optional): keep ``data`` and parse the logs and the transaction
+                on first access, the transaction itself being decoded lazily.
+                Defaults to False.
+
+        Returns:
+            TxInfo: transaction info
+        """
+        if lazy:
+            return _new_lazy(
+                cls,
+                data,
+                height=int(data.get("height")),
+                txhash=data.get("txhash"),
+                rawlog=data.get("raw_log"),
+                gas_wanted=int(data.get("gas_wanted")),
+                gas_used=int(data.get("gas_used")),
+                timestamp=data.get("timestamp"),
+                code=data.get("code"),
+                codespace=data.get("codespace"),
+            )
         return cls(
             data.get("height"),
             data.get("txhash"),
@@ -488,3 +778,95 @@ class TxInfo(JSONSerializable):
             code=proto.code,
             codespace=proto.codespace,
         )
+
+
+def _data_type_url(data: dict) -> str:
+    return data["@type"]
+
+
+def _unpack_any_bytes(any_bytes: bytes) -> Msg:
+    return Msg.unpack_any(Any().parse(any_bytes))
+
+
+def _any_bytes_type_url(any_bytes: bytes) -> str:
+    # the type URL is the first field, so the message value is not read
+    for field in parse_fields(any_bytes):
+        if field.number == 1:
+            return field.value.decode("utf-8")
+    return ""
+
+
+def _body_from_bytes(body_bytes: bytes) -> TxBody:
+    """Decodes a body from protobuf, keeping its messages as encoded ``Any``."""
+    messages, memo, timeout_height = [], "", 0
+    for field in parse_fields(body_bytes):
+        if field.number == 1:
+            messages.append(field.value)
+        elif field.number == 2:
+            memo = field.value.decode("utf-8")
+        elif field.number == 3:
+            timeout_height = field.value
+    body = TxBody(
+        _LazyMessages(messages, _unpack_any_bytes, _any_bytes_type_url),
+        memo,
+        timeout_height,
+    )
+    body.__dict__["_raw"] = {
+        "bytes": body_bytes,
+        "memo": memo,
+        "timeout_height": timeout_height,
+    }
+    return body
+
+
+def _auth_info_from_bytes(auth_info_bytes: bytes) -> AuthInfo:
+    raw = {"bytes": auth_info_bytes, "signer_infos": [], "fee": b""}
+    for field in parse_fields(auth_info_bytes):
+        if field.number == 1:
+            raw["signer_infos"].append(field.value)
+        elif field.number == 2:
+            raw["fee"] = field.value
+    return _new_lazy(AuthInfo, raw)
+
+
+def _decode_signer_infos(raw: dict) -> List[SignerInfo]:
+    return [
+        SignerInfo.from_proto(SignerInfo_pb().parse(info))
+        for info in raw["signer_infos"]
+    ]
+
+
+def _decode_fee(raw: dict) -> Fee:
+    return Fee.from_proto(Fee_pb().parse(raw["fee"]))
+
+
+def _decode_body(raw: dict) -> TxBody:
+    body = raw["body"]
+    if isinstance(body, bytes):
+        return _body_from_bytes(body)
+    return TxBody.from_data(body, lazy=True)
+
+
+def _decode_auth_info(raw: dict) -> AuthInfo:
+    auth_info = raw["auth_info"]
+    if isinstance(auth_info, bytes):
+        return _auth_info_from_bytes(auth_info)
+    return AuthInfo.from_data(auth_info)
+
+
+def _decode_logs(raw: dict) -> Optional[List[TxLog]]:
+    return parse_tx_logs(raw.get("logs"))
+
+
+def _decode_tx(raw: dict) -> Tx:
+    return Tx.from_data(raw.get("tx"), lazy=True)
+
+
+# attrs removes the class attributes of fields, so that these descriptors only apply to
+# lazily decoded objects, whose fields are not in their __dict__ until accessed
+Tx.body = _LazyField("body", _decode_body)
+Tx.auth_info = _LazyField("auth_info", _decode_auth_info)
+AuthInfo.signer_infos = _LazyField("signer_infos", _decode_signer_infos, snapshot=True)
+AuthInfo.fee = _LazyField("fee", _decode_fee, snapshot=True)
+TxInfo.logs = _LazyField("logs", _decode_logs)
+TxInfo.tx = _LazyField("tx", _decode_tx)
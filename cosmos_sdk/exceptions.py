@@ -13,3 +13,13 @@ class LCDResponseError(IOError):
         if self.message:
             message = " - " + self.message
         return f"Status {self.response.status}{message}"
+
+
+class TxRejectedError(Exception):
+    """Triggered when a broadcast transaction is rejected by the node"""
+
+    def __init__(self, result):
+        self.result = result
+
+    def __str__(self):
+        return f"Code {self.result.code} ({self.result.codespace}) - {self.result.raw_log}"
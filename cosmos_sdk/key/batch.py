@@ -0,0 +1,212 @@
+"""Signing of large batches of transactions across a pool of processes."""
+
+import asyncio
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional, Sequence, Type
+
+from cosmos_sdk.core import ModeInfo, ModeInfoSingle, SignDoc
+from cosmos_sdk.core.public_key import PublicKey
+from cosmos_sdk.core.tx import AuthInfo, SignerInfo, SignMode, Tx
+
+from .secp256k1 import Secp256k1Backend
+
+__all__ = ["sign_txs", "sign_txs_async"]
+
+# signing key parsed by the worker process, reused while batches come from the same key
+_worker_signer: Optional[Secp256k1Backend] = None
+
+
+def _sign_chunk(
+    backend: Type[Secp256k1Backend], private_key: bytes, payloads: List[bytes]
+) -> List[bytes]:
+    global _worker_signer
+    signer = _worker_signer
+    if (
+        signer is None
+        or type(signer) is not backend
+        or signer.private_key != private_key
+    ):
+        signer = _worker_signer = backend(private_key)
+    return [signer.sign(payload) for payload in payloads]
+
+
+def _sign_mode(options) -> SignMode:
+    if options.sign_mode == SignMode.SIGN_MODE_LEGACY_AMINO_JSON:
+        return SignMode.SIGN_MODE_LEGACY_AMINO_JSON
+    return SignMode.SIGN_MODE_DIRECT
+
+
+def _payload(public_key: PublicKey, tx: Tx, options) -> bytes:
+    # same bytes as Key.create_signature and Key.create_signature_amino
+    sign_doc = SignDoc(
+        chain_id=options.chain_id,
+        account_number=options.account_number,
+        sequence=options.sequence,
+        auth_info=AuthInfo(signer_infos=[], fee=tx.auth_info.fee),
+        tx_body=tx.body,
+    )
+    if _sign_mode(options) == SignMode.SIGN_MODE_LEGACY_AMINO_JSON:
+        return sign_doc.to_amino_json()
+    sign_doc.auth_info.signer_infos = [
+        SignerInfo(
+            public_key=public_key,
+            sequence=sign_doc.sequence,
+            mode_info=ModeInfo(single=ModeInfoSingle(mode=SignMode.SIGN_MODE_DIRECT)),
+        )
+    ]
+    return sign_doc.to_bytes()
+
+
+def _signed(public_key: PublicKey, tx: Tx, options, signature: bytes) -> Tx:
+    # same transaction as Key.sign_tx
+    return Tx(
+        body=tx.body,
+        auth_info=AuthInfo(
+            signer_infos=[
+                *tx.auth_info.signer_infos,
+                SignerInfo(
+                    public_key=public_key,
+                    sequence=options.sequence,
+                    mode_info=ModeInfo(single=ModeInfoSingle(mode=_sign_mode(options))),
+                ),
+            ],
+            fee=tx.auth_info.fee,
+        ),
+        signatures=[*tx.signatures, signature],
+    )
+
+
+def _chunks(
+    key,
+    txs: Sequence[Tx],
+    options_list: Sequence,
+    chunk_size: Optional[int],
+    workers: int,
+) -> List[List[bytes]]:
+    if len(txs) != len(options_list):
+        raise ValueError(
+            f"got {len(txs)} transactions but {len(options_list)} sign options"
+        )
+    if key.public_key is None:
+        raise ValueError(
+            "signature could not be created: Key instance missing public_key"
+        )
+    payloads = [
+        _payload(key.public_key, tx, options)
+        for tx, options in zip(txs, options_list)
+    ]
+    if chunk_size is None:
+        # a few chunks per worker, to balance the load while keeping few round trips
+        chunk_size = max(1, math.ceil(len(payloads) / (workers * 4)))
+    return [payloads[i : i + chunk_size] for i in range(0, len(payloads), chunk_size)]
+
+
+def _assemble(key, txs, options_list, chunks: List[List[bytes]]) -> List[Tx]:
+    signatures = [signature for chunk in chunks for signature in chunk]
+    return [
+        _signed(key.public_key, tx, options, signature)
+        for tx, options, signature in zip(txs, options_list, signatures)
+    ]
+
+
+def _workers(executor: Optional[Executor], max_workers: Optional[int]) -> int:
+    return (
+        getattr(executor, "_max_workers", None) or max_workers or os.cpu_count() or 1
+    )
+
+
+def sign_txs(
+    key,
+    txs: Sequence[Tx],
+    options_list: Sequence,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> List[Tx]:
+    """Signs many transactions with a :class:`RawKey<cosmos_sdk.key.terra.raw.RawKey>`
+    across a pool of processes, and returns the signed transactions in order. Each
+    transaction is signed exactly as by :meth:`Key.sign_tx`.
+
+    The sign bytes are serialized in the calling process; only the private key and the
+    sign bytes are sent to the workers, and only the signatures come back.
+
+    Args:
+        key (RawKey): key to sign with
+        txs (Sequence[Tx]): unsigned transactions
+        options_list (Sequence[SignOptions]): sign options of each transaction
+        executor (Executor, optional): pool to sign in. A process pool is created for
+            the call if not given.
+        max_workers (int, optional): size of the created process pool. Defaults to
+            the number of CPUs.
+        chunk_size (int, optional): transactions signed per task
+
+    Raises:
+        ValueError: if ``txs`` and ``options_list`` differ in length
+
+    Returns:
+        List[Tx]: ready-to-broadcast transactions
+    """
+    chunks = _chunks(
+        key, txs, options_list, chunk_size, _workers(executor, max_workers)
+    )
+    if not chunks:
+        return []
+    pool = executor or ProcessPoolExecutor(max_workers)
+    try:
+        futures = [
+            pool.submit(_sign_chunk, key.backend, key.private_key, chunk)
+            for chunk in chunks
+        ]
+        results = [future.result() for future in futures]
+    finally:
+        if executor is None:
+            pool.shutdown()
+    return _assemble(key, txs, options_list, results)
+
+
+async def sign_txs_async(
+    key,
+    txs: Sequence[Tx],
+    options_list: Sequence,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> List[Tx]:
+    """Coroutine version of :func:`sign_txs`. The event loop keeps running while the
+    workers sign.
+
+    Args:
+        key (RawKey): key to sign with
+        txs (Sequence[Tx]): unsigned transactions
+        options_list (Sequence[SignOptions]): sign options of each transaction
+        executor (Executor, optional): pool to sign in. A process pool is created for
+            the call if not given.
+        max_workers (int, optional): size of the created process pool. Defaults to
+            the number of CPUs.
+        chunk_size (int, optional): transactions signed per task
+
+    Returns:
+        List[Tx]: ready-to-broadcast transactions
+    """
+    chunks = _chunks(
+        key, txs, options_list, chunk_size, _workers(executor, max_workers)
+    )
+    if not chunks:
+        return []
+    loop = asyncio.get_running_loop()
+    pool = executor or ProcessPoolExecutor(max_workers)
+    try:
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    pool, _sign_chunk, key.backend, key.private_key, chunk
+                )
+                for chunk in chunks
+            ]
+        )
+    finally:
+        if executor is None:
+            pool.shutdown(wait=False)
+    return _assemble(key, txs, options_list, list(results))
@@ -0,0 +1,266 @@
+"""Collection and verification of the signatures of multisig account members."""
+
+import asyncio
+import inspect
+from concurrent.futures import Executor
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from cosmos_sdk.core import MultiSignature, SignatureV2, SignDoc
+from cosmos_sdk.core.public_key import LegacyAminoMultisigPublicKey, SimplePublicKey
+from cosmos_sdk.core.signature_v2 import Descriptor
+from cosmos_sdk.core.signature_v2 import Single as SingleDescriptor
+from cosmos_sdk.core.tx import SignMode
+
+from .secp256k1 import Secp256k1Backend, default_backend
+
+__all__ = ["MultisigCoordinator", "Signer"]
+
+Signer = Callable[[bytes], Union[bytes, Awaitable[bytes]]]
+"""Function signing sign bytes and returning the 64-byte signature, such as
+:meth:`RawKey.sign<cosmos_sdk.key.terra.raw.RawKey.sign>` or a coroutine function
+requesting the signature of a remote member."""
+
+
+def _verify(
+    backend: Type[Secp256k1Backend], public_key: bytes, payload: bytes, signature: bytes
+) -> bool:
+    return backend.verify(public_key, payload, signature)
+
+
+class MultisigCoordinator:
+    """Collects the signatures of the members of a multisig account over a transaction
+    and assembles the multisig signature.
+
+    The sign bytes are built once, in ``SIGN_MODE_LEGACY_AMINO_JSON`` as required for
+    the members of a legacy amino multisig, and handed to every signer. Signatures are
+    requested from all signers concurrently and each one is verified against the
+    member's public key in ``executor`` as it arrives, so that an invalid signature is
+    set aside in :attr:`failures` instead of failing the transaction at broadcast.
+
+    >>> coordinator = MultisigCoordinator(multisig_pubkey, sign_doc)
+    >>> await coordinator.collect([(key.public_key, key.sign) for key in keys])
+    True
+    >>> tx.append_signatures([coordinator.signature()])
+
+    Args:
+        multisig_pubkey (LegacyAminoMultisigPublicKey): public key of the multisig
+            account
+        sign_doc (SignDoc): transaction to sign, with the account number and sequence
+            of the multisig account
+        executor (Executor, optional): pool verifying the signatures. Defaults to the
+            event loop's default executor.
+        backend (Type[Secp256k1Backend], optional): implementation verifying the
+            signatures. Defaults to :func:`default_backend()`.
+    """
+
+    sign_bytes: bytes
+    """Bytes signed by every member."""
+
+    signatures: Dict[int, bytes]
+    """Valid signatures, by position of the member in the multisig public key."""
+
+    failures: Dict[int, Exception]
+    """Errors of the signers which failed or returned an invalid signature, by position
+    of the member in the multisig public key."""
+
+    def __init__(
+        self,
+        multisig_pubkey: LegacyAminoMultisigPublicKey,
+        sign_doc: SignDoc,
+        executor: Optional[Executor] = None,
+        backend: Optional[Type[Secp256k1Backend]] = None,
+    ):
+        self.multisig_pubkey = multisig_pubkey
+        self.sign_doc = sign_doc
+        self.executor = executor
+        self.backend = backend or default_backend()
+        self.sign_bytes = sign_doc.to_amino_json()
+        self.signatures = {}
+        self.failures = {}
+        # looks up the positions of member keys
+        self._members = MultiSignature(multisig_pubkey)
+
+    @property
+    def threshold(self) -> int:
+        """Number of signatures required."""
+        return self.multisig_pubkey.threshold
+
+    @property
+    def ready(self) -> bool:
+        """Whether enough valid signatures were collected."""
+        return len(self.signatures) >= self.threshold
+
+    async def add(self, public_key: SimplePublicKey, signature: bytes) -> bool:
+        """Verifies the signature of a member and keeps it if valid.
+
+        Args:
+            public_key (SimplePublicKey): public key of the member
+            signature (bytes): signature of :attr:`sign_bytes`
+
+        Raises:
+            ValueError: if the key is not a member of the multisig account
+
+        Returns:
+            bool: whether the signature is valid
+        """
+        index = self._members.index_of(public_key)
+        valid = await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            _verify,
+            self.backend,
+            bytes(public_key.key),
+            self.sign_bytes,
+            signature,
+        )
+        if valid:
+            self.signatures[index] = signature
+            self.failures.pop(index, None)
+        else:
+            self.failures[index] = ValueError(
+                f"invalid signature from multisig member {index}"
+            )
+        return valid
+
+    async def add_signature_v2s(self, signatures: List[SignatureV2]) -> List[bool]:
+        """Verifies signatures created with :meth:`Key.create_signature_amino`
+        concurrently, and keeps the valid ones.
+
+        Args:
+            signatures (List[SignatureV2]): signatures of members
+
+        Raises:
+            ValueError: if a signature is not a single ``SIGN_MODE_LEGACY_AMINO_JSON``
+                signature of a member
+
+        Returns:
+            List[bool]: whether each signature is valid
+        """
+        for sig in signatures:
+            if not isinstance(sig.public_key, SimplePublicKey):
+                raise ValueError("non-SimplePublicKey cannot be used to sign multisig")
+            single = sig.data.single
+            if single is None or single.mode != SignMode.SIGN_MODE_LEGACY_AMINO_JSON:
+                raise ValueError("multisig members must sign in legacy amino JSON mode")
+            self._members.index_of(sig.public_key)
+        return list(
+            await asyncio.gather(
+                *[
+                    self.add(sig.public_key, sig.data.single.signature)
+                    for sig in signatures
+                ]
+            )
+        )
+
+    async def _request(self, public_key: SimplePublicKey, signer: Signer):
+        index = self._members.index_of(public_key)
+        try:
+            signature = signer(self.sign_bytes)
+            if inspect.isawaitable(signature):
+                signature = await signature
+        except Exception as e:
+            self.failures[index] = e
+            return
+        await self.add(public_key, signature)
+
+    async def collect(
+        self,
+        signers: Iterable[Tuple[SimplePublicKey, Signer]],
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Requests signatures from members concurrently until :attr:`threshold` valid
+        signatures are collected, then cancels the outstanding requests. Members which
+        already signed are not asked again, so ``collect`` can be called again with
+        other members after failures.
+
+        Args:
+            signers (Iterable[Tuple[SimplePublicKey, Signer]]): public key and signer
+                of each member
+            timeout (float, optional): seconds to wait for the signers
+
+        Raises:
+            ValueError: if a key is not a member of the multisig account
+
+        Returns:
+            bool: whether enough valid signatures were collected
+        """
+        requests = [
+            (public_key, signer)
+            for public_key, signer in signers
+            if self._members.index_of(public_key) not in self.signatures
+        ]
+        if self.ready or not requests:
+            return self.ready
+
+        pending = {
+            asyncio.ensure_future(self._request(public_key, signer))
+            for public_key, signer in requests
+        }
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        try:
+            while pending and not self.ready:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    break
+                _, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return self.ready
+
+    def multi_signature(self) -> MultiSignature:
+        """Assembles :attr:`threshold` of the collected signatures, as more would only
+        add to the size and gas of the transaction.
+
+        Raises:
+            ValueError: if fewer than :attr:`threshold` valid signatures were collected
+
+        Returns:
+            MultiSignature: signatures of the members, in member order
+        """
+        if not self.ready:
+            raise ValueError(
+                f"collected {len(self.signatures)} of {self.threshold} signatures"
+            )
+        multisig = MultiSignature(self.multisig_pubkey)
+        for index in sorted(self.signatures)[: self.threshold]:
+            multisig.append_signature(
+                Descriptor(
+                    single=SingleDescriptor(
+                        mode=SignMode.SIGN_MODE_LEGACY_AMINO_JSON,
+                        signature=self.signatures[index],
+                    )
+                ),
+                index,
+            )
+        return multisig
+
+    def signature(self) -> SignatureV2:
+        """Assembles the signature of the multisig account, to append to the
+        transaction with :meth:`Tx.append_signatures`.
+
+        Raises:
+            ValueError: if fewer than :attr:`threshold` valid signatures were collected
+
+        Returns:
+            SignatureV2: signature of the multisig account
+        """
+        return SignatureV2(
+            public_key=self.multisig_pubkey,
+            data=self.multi_signature().to_signature_descriptor(),
+            sequence=self.sign_doc.sequence,
+        )
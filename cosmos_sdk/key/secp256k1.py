@@ -0,0 +1,161 @@
+"""ECDSA signing on curve secp256k1, with interchangeable implementations.
+
+:class:`CoincurveBackend` uses libsecp256k1 through the optional ``coincurve`` package
+and is used by default when it is installed. :class:`EcdsaBackend` uses the pure Python
+``ecdsa`` package. Both produce the same deterministic (RFC 6979), low-S signatures.
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Optional, Type
+
+from ecdsa import SECP256k1, SigningKey, VerifyingKey
+from ecdsa.keys import BadSignatureError, MalformedPointError
+from ecdsa.util import sigencode_string_canonize
+
+try:
+    import coincurve
+    from coincurve.ecdsa import cdata_to_der, deserialize_compact
+except ImportError:
+    coincurve = None
+
+__all__ = [
+    "Secp256k1Backend",
+    "EcdsaBackend",
+    "CoincurveBackend",
+    "default_backend",
+    "set_default_backend",
+    "verify",
+]
+
+_HALF_ORDER = SECP256k1.order // 2
+
+
+def _is_low_s(signature: bytes) -> bool:
+    # nodes only accept signatures with low s, both backends would accept either
+    return len(signature) == 64 and int.from_bytes(signature[32:], "big") <= _HALF_ORDER
+
+
+class Secp256k1Backend(ABC):
+    """Signing key parsed once from a private key, for signing many payloads.
+
+    Args:
+        private_key (bytes): 32-byte private key
+    """
+
+    private_key: bytes
+    """Private key the backend was created from."""
+
+    public_key: bytes
+    """Compressed public key."""
+
+    def __init__(self, private_key: bytes):
+        self.private_key = private_key
+
+    @abstractmethod
+    def sign(self, payload: bytes) -> bytes:
+        """Signs the SHA-256 digest of ``payload``.
+
+        Returns:
+            bytes: 64-byte ``r || s`` signature, with low ``s``
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def verify(public_key: bytes, payload: bytes, signature: bytes) -> bool:
+        """Checks a signature of the SHA-256 digest of ``payload``, as nodes do.
+
+        Args:
+            public_key (bytes): compressed public key of the signer
+            payload (bytes): signed payload
+            signature (bytes): 64-byte ``r || s`` signature
+
+        Returns:
+            bool: whether the signature is valid and has a low ``s``
+        """
+        pass
+
+
+class EcdsaBackend(Secp256k1Backend):
+    """Pure Python implementation. The curve's generator point uses precomputed
+    multiples, so keeping the parsed key makes signing a single point multiplication."""
+
+    def __init__(self, private_key: bytes):
+        super().__init__(private_key)
+        self._key = SigningKey.from_string(private_key, curve=SECP256k1)
+        self.public_key = self._key.get_verifying_key().to_string("compressed")
+
+    def sign(self, payload: bytes) -> bytes:
+        return self._key.sign_deterministic(
+            payload,
+            hashfunc=hashlib.sha256,
+            sigencode=sigencode_string_canonize,
+        )
+
+    @staticmethod
+    def verify(public_key: bytes, payload: bytes, signature: bytes) -> bool:
+        if not _is_low_s(signature):
+            return False
+        try:
+            return VerifyingKey.from_string(public_key, curve=SECP256k1).verify(
+                signature, payload, hashfunc=hashlib.sha256
+            )
+        except (BadSignatureError, MalformedPointError):
+            return False
+
+
+class CoincurveBackend(Secp256k1Backend):
+    """libsecp256k1 implementation, requires the ``coincurve`` package."""
+
+    def __init__(self, private_key: bytes):
+        if coincurve is None:
+            raise ImportError("CoincurveBackend requires the coincurve package")
+        super().__init__(private_key)
+        self._key = coincurve.PrivateKey(private_key)
+        self.public_key = self._key.public_key.format(compressed=True)
+
+    def sign(self, payload: bytes) -> bytes:
+        # the recovery id appended to the compact signature is not part of the signature
+        return self._key.sign_recoverable(hashlib.sha256(payload).digest(), hasher=None)[
+            :64
+        ]
+
+    @staticmethod
+    def verify(public_key: bytes, payload: bytes, signature: bytes) -> bool:
+        if coincurve is None:
+            raise ImportError("CoincurveBackend requires the coincurve package")
+        if not _is_low_s(signature):
+            return False
+        try:
+            return coincurve.PublicKey(public_key).verify(
+                cdata_to_der(deserialize_compact(signature)),
+                hashlib.sha256(payload).digest(),
+                hasher=None,
+            )
+        except ValueError:
+            return False
+
+
+_default: Optional[Type[Secp256k1Backend]] = None
+
+
+def default_backend() -> Type[Secp256k1Backend]:
+    """Returns the backend used by keys created without one: :class:`CoincurveBackend`
+    if ``coincurve`` is installed, :class:`EcdsaBackend` otherwise."""
+    if _default is not None:
+        return _default
+    return EcdsaBackend if coincurve is None else CoincurveBackend
+
+
+def set_default_backend(backend: Optional[Type[Secp256k1Backend]]):
+    """Sets the backend used by keys created without one. ``None`` restores automatic
+    selection."""
+    global _default
+    _default = backend
+
+
+def verify(public_key: bytes, payload: bytes, signature: bytes) -> bool:
+    """Checks a signature with the default backend. See
+    :meth:`Secp256k1Backend.verify`."""
+    return default_backend().verify(public_key, payload, signature)
@@ -1,5 +1,4 @@
 import abc
-import copy
 from typing import Optional
 
 import attr
@@ -169,21 +168,24 @@ class Key:
                 "signature could not be created: Key instance missing public_key"
             )
 
-        # make backup
-        si_backup = copy.deepcopy(sign_doc.auth_info.signer_infos)
-        sign_doc.auth_info.signer_infos = [
-            SignerInfo(
-                public_key=self.public_key,
-                sequence=sign_doc.sequence,
-                mode_info=ModeInfo(
-                    single=ModeInfoSingle(mode=SignMode.SIGN_MODE_DIRECT)
-                ),
-            )
-        ]
-        signature = self.sign(sign_doc.to_bytes())
-
-        # restore
-        sign_doc.auth_info.signer_infos = si_backup
+        # sign with this key's signer info only, leaving sign_doc untouched. The body
+        # is shared, so its bytes are serialized once for every signer.
+        signer_doc = attr.evolve(
+            sign_doc,
+            auth_info=AuthInfo(
+                signer_infos=[
+                    SignerInfo(
+                        public_key=self.public_key,
+                        sequence=sign_doc.sequence,
+                        mode_info=ModeInfo(
+                            single=ModeInfoSingle(mode=SignMode.SIGN_MODE_DIRECT)
+                        ),
+                    )
+                ],
+                fee=sign_doc.auth_info.fee,
+            ),
+        )
+        signature = self.sign(signer_doc.to_bytes())
 
         return SignatureV2(
             public_key=self.public_key,
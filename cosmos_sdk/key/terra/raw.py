@@ -1,36 +1,42 @@
 from __future__ import annotations
 
-import hashlib
+from concurrent.futures import Executor
+from typing import List, Optional, Sequence, Type
 
-from ecdsa import SECP256k1, SigningKey
-from ecdsa.util import sigencode_string_canonize
-
-from .key import Key
+from ..batch import sign_txs, sign_txs_async
+from ..secp256k1 import Secp256k1Backend, default_backend
+from .key import Key, SignOptions
 
 __all__ = ["RawKey"]
 
 from ...core import PublicKey, SimplePublicKey
+from ...core.tx import Tx
 
 
 def compute_public_key(private_key: bytes) -> PublicKey:
-    return SimplePublicKey(
-        key=SigningKey.from_string(private_key, curve=SECP256k1)
-        .get_verifying_key()
-        .to_string("compressed")
-    )
+    return SimplePublicKey(key=default_backend()(private_key).public_key)
 
 
 class RawKey(Key):
     """RawKey directly uses a raw (plaintext) private key in memory, and provides
     the implementation for signing with ECDSA on curve Secp256k1.
 
+    The private key is parsed once by a
+    :class:`Secp256k1Backend<cosmos_sdk.key.secp256k1.Secp256k1Backend>`, then reused
+    for every signature.
+
     Args:
         private_key (bytes): private key in bytes
+        backend (Type[Secp256k1Backend], optional): signing implementation. Uses
+            libsecp256k1 if ``coincurve`` is installed, ``ecdsa`` otherwise.
     """
 
     private_key: bytes
     """Private key, in bytes."""
 
+    backend: Type[Secp256k1Backend]
+    """Signing implementation the private key is parsed with."""
+
     @classmethod
     def from_hex(cls, private_key_hex: str) -> RawKey:
         """Create a new RawKey from a hex-encoded private key string.
@@ -40,9 +46,12 @@ class RawKey(Key):
         """
         return cls(bytes.fromhex(private_key_hex))
 
-    def __init__(self, private_key: bytes):
-        public_key = compute_public_key(private_key)
-        super().__init__(public_key)
+    def __init__(
+        self, private_key: bytes, backend: Optional[Type[Secp256k1Backend]] = None
+    ):
+        self.backend = backend or default_backend()
+        self._signer = self.backend(private_key)
+        super().__init__(SimplePublicKey(key=self._signer.public_key))
         self.private_key = private_key
 
     def sign(self, payload: bytes) -> bytes:
@@ -52,9 +61,53 @@ class RawKey(Key):
         Args:
             payload (bytes): data to sign
         """
-        sk = SigningKey.from_string(self.private_key, curve=SECP256k1)
-        return sk.sign_deterministic(
-            payload,
-            hashfunc=hashlib.sha256,
-            sigencode=sigencode_string_canonize,
-        )
+        signer = self._signer
+        if signer is None or signer.private_key != self.private_key:
+            signer = self._signer = self.backend(self.private_key)
+        return signer.sign(payload)
+
+    def sign_txs(
+        self,
+        txs: Sequence[Tx],
+        options_list: Sequence[SignOptions],
+        executor: Optional[Executor] = None,
+    ) -> List[Tx]:
+        """Signs many transactions across a pool of processes, see
+        :func:`sign_txs<cosmos_sdk.key.batch.sign_txs>`.
+
+        Args:
+            txs (Sequence[Tx]): unsigned transactions
+            options_list (Sequence[SignOptions]): sign options of each transaction
+            executor (Executor, optional): pool to sign in. A process pool is created
+                for the call if not given.
+
+        Returns:
+            List[Tx]: ready-to-broadcast transactions, in order
+        """
+        return sign_txs(self, txs, options_list, executor)
+
+    async def sign_txs_async(
+        self,
+        txs: Sequence[Tx],
+        options_list: Sequence[SignOptions],
+        executor: Optional[Executor] = None,
+    ) -> List[Tx]:
+        """Coroutine version of :meth:`sign_txs`, which does not block the event loop
+        while signing.
+
+        Args:
+            txs (Sequence[Tx]): unsigned transactions
+            options_list (Sequence[SignOptions]): sign options of each transaction
+            executor (Executor, optional): pool to sign in. A process pool is created
+                for the call if not given.
+
+        Returns:
+            List[Tx]: ready-to-broadcast transactions, in order
+        """
+        return await sign_txs_async(self, txs, options_list, executor)
+
+    def __getstate__(self) -> dict:
+        # parsed keys of native backends can't be pickled, they are parsed again
+        state = self.__dict__.copy()
+        state["_signer"] = None
+        return state
@@ -1,7 +1,32 @@
 import base64
 import hashlib
+from typing import Iterable, List, Union
 
 
 def hash_amino(txdata: str) -> str:
     """Get the transaction hash from Amino-encoded Transaction in base64."""
     return hashlib.sha256(base64.b64decode(txdata)).digest().hex()
+
+
+def hash_tx_bytes(tx_bytes: bytes) -> str:
+    """Get the transaction hash from protobuf-encoded transaction bytes, as the
+    uppercase hex string reported by nodes."""
+    return hashlib.sha256(tx_bytes).hexdigest().upper()
+
+
+def hash_txs(txs: Iterable[Union[bytes, str]]) -> List[str]:
+    """Get the hashes of many transactions in one call, e.g. the ``txs`` of a block.
+
+    Args:
+        txs (Iterable[Union[bytes, str]]): protobuf-encoded transactions, as bytes or
+            base64 strings
+
+    Returns:
+        List[str]: uppercase hex transaction hashes, in order
+    """
+    sha256 = hashlib.sha256
+    b64decode = base64.b64decode
+    return [
+        sha256(tx if isinstance(tx, bytes) else b64decode(tx)).hexdigest().upper()
+        for tx in txs
+    ]
@@ -1,53 +1,149 @@
-import copy
 import json
 from abc import ABC
 from datetime import datetime
-from typing import Any
+from operator import methodcaller
+from typing import Any, Callable, Dict, Optional
 
 from cosmos_sdk.util.converter import to_isoformat
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def to_data(x: Any) -> Any:
-    if "to_data" in dir(x):
-        return x.to_data()
-    if isinstance(x, int):
-        return str(x)
-    if isinstance(x, datetime):
-        return to_isoformat(x)
-    if isinstance(x, list):
-        return [to_data(g) for g in x]
-    if isinstance(x, dict):
-        return dict_to_data(x)
-    if isinstance(x, datetime):
-        return to_isoformat(x)
+__all__ = [
+    "JSONSerializable",
+    "canonical_json",
+    "dict_to_amino",
+    "dict_to_data",
+    "to_amino",
+    "to_data",
+]
+
+Handler = Callable[[Any], Any]
+
+# handlers by exact type, resolved once per class instead of calling dir() per value
+_data_handlers: Dict[type, Handler] = {}
+_amino_handlers: Dict[type, Handler] = {}
+
+
+def _identity(x: Any) -> Any:
     return x
 
 
+def _none(x: Any) -> None:
+    return None
+
+
+def _list_to_data(x: list) -> list:
+    return [to_data(g) for g in x]
+
+
+def _data_handler(cls: type) -> Handler:
+    if hasattr(cls, "to_data"):
+        return methodcaller("to_data")
+    if issubclass(cls, int):
+        return str
+    if issubclass(cls, datetime):
+        return to_isoformat
+    if issubclass(cls, list):
+        return _list_to_data
+    if issubclass(cls, dict):
+        return dict_to_data
+    return _identity
+
+
+def _amino_handler(cls: type) -> Handler:
+    if hasattr(cls, "to_amino"):
+        return methodcaller("to_amino")
+    if issubclass(cls, list):
+        return _list_to_data
+    if issubclass(cls, datetime):
+        return to_isoformat
+    if issubclass(cls, dict):
+        return dict_to_amino
+    if issubclass(cls, int):
+        return str
+    return _none
+
+
+def to_data(x: Any) -> Any:
+    handler = _data_handlers.get(type(x))
+    if handler is None:
+        handler = _data_handlers[type(x)] = _data_handler(type(x))
+    return handler(x)
+
+
 def to_amino(x: Any) -> Any:
-    if "to_amino" in dir(x):
-        return x.to_amino()
-    if isinstance(x, list):
-        return [to_data(g) for g in x]
-    if isinstance(x, datetime):
-        return to_isoformat(x)
-    if isinstance(x, dict):
-        return dict_to_amino(x)
-    if isinstance(x, int):
-        return str(x)
-    if isinstance(x, datetime):
-        return to_isoformat(x)
+    handler = _amino_handlers.get(type(x))
+    if handler is None:
+        handler = _amino_handlers[type(x)] = _amino_handler(type(x))
+    return handler(x)
 
 
 def dict_to_amino(d: dict):
-    return {key: to_amino(d[key]) for key in d}
+    return {key: to_amino(value) for key, value in d.items()}
 
 
 def dict_to_data(d: dict) -> dict:
     """Recursively calls to_data on dict"""
-    return {key: to_data(d[key]) for key in d}
+    return {key: to_data(value) for key, value in d.items()}
+
+
+# Values orjson may write differently from json are floats, formatted differently, and
+# null, which is also how it writes NaN and infinities. With digits and minus signs
+# removed and separators turned into colons, they become ":e" or ":null". Strings
+# containing these after a colon, comma or bracket only send the object to json,
+# which is slower but exact.
+_ORJSON_SEPARATORS = bytes.maketrans(b",[.", b"::e")
+_ORJSON_NUMBER = b"0123456789-"
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _orjson_canonical(obj: Any) -> Optional[bytes]:
+    try:
+        encoded = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return None  # types orjson does not serialize like json, or huge integers
+    # json escapes non-ASCII characters and DEL
+    if not encoded.isascii() or b"\x7f" in encoded:
+        return None
+    tokens = encoded.translate(_ORJSON_SEPARATORS, _ORJSON_NUMBER)
+    if b":e" in tokens or b":null" in tokens or tokens[:1] in (b"e", b"n"):
+        return None
+    return encoded
+
+
+def canonical_json(obj: Any) -> bytes:
+    """Serializes to canonical JSON, as signed in ``SIGN_MODE_LEGACY_AMINO_JSON``: keys
+    sorted, no whitespace and non-ASCII characters escaped.
+
+    Uses orjson when installed, and falls back to :mod:`json` for anything orjson
+    would write differently, so that the bytes are the same either way.
+
+    Args:
+        obj (Any): JSON data
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        encoded = _orjson_canonical(obj)
+        if encoded is not None:
+            return encoded
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
 class JSONSerializable(ABC):
+    __slots__ = ()
+
     def to_data(self) -> Any:
         """Converts the object to its JSON-serializable Python data representation."""
         pass  # return dict_to_data(copy.deepcopy(self.__dict__))
@@ -59,4 +155,4 @@ class JSONSerializable(ABC):
         Returns:
            str: JSON string representation
         """
-        return json.dumps(self.to_data(), sort_keys=True, separators=(",", ":"))
+        return canonical_json(self.to_data()).decode("utf-8")
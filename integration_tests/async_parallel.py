@@ -1,31 +1,24 @@
 import asyncio
+from functools import partial
 
 import uvloop
 
 from cosmos_sdk.client.lcd import AsyncLCDClient
 
 
-async def with_sem(aw, sem):
-    async with sem:
-        print(sem)
-        return await aw
-
-
 async def main():
     terra = AsyncLCDClient(url="https://lcd.terra.dev", chain_id="columbus-5")
     validators, _ = await terra.staking.validators()
     validator_addresses = [v.operator_address for v in validators]
 
-    sem = asyncio.Semaphore(2)  # 2 continuous connections
-    result = await asyncio.gather(
-        *[
-            with_sem(terra.oracle.misses(address), sem)
-            for address in validator_addresses
-        ]
+    # 2 continuous connections
+    result = await terra.batch(
+        [partial(terra.oracle.misses, address) for address in validator_addresses],
+        max_concurrency=2,
     )
 
     await terra.session.close()
-    print(result)
+    print([r.result if r.ok else r.error for r in result])
 
 
 uvloop.install()
@@ -35,3 +35,10 @@ def test_tx_infos_by_height():
 def test_tx_infos_by_height_with_height():
     result = terra.tx.tx_infos_by_height(7549440)
     assert result is not None
+
+
+def test_txs_by_height():
+    infos = terra.tx.tx_infos_by_height(7549440, max_concurrency=4)
+    txs = terra.tx.txs_by_height(7549440)
+    assert len(txs) == len(infos)
+    assert [tx.body.memo for tx in txs] == [info.tx.body.memo for info in infos]
@@ -0,0 +1,153 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from aiohttp import ClientConnectorError
+
+from cosmos_sdk.client.lcd import LCDClient
+from cosmos_sdk.client.lcd.base import BaseAsyncLCDClient
+from cosmos_sdk.exceptions import LCDResponseError
+
+terra = LCDClient(url="http://127.0.0.1:1317", chain_id="localterra")
+
+
+def test_at_height_view():
+    snapshot = terra.at_height(5000)
+
+    assert isinstance(snapshot, LCDClient)
+    assert snapshot.pinned_height == 5000
+    assert terra.pinned_height is None
+    assert snapshot.bank._c is snapshot
+    assert snapshot.utils._c is snapshot
+    assert terra.bank._c is terra
+    assert snapshot.session is terra.session
+    assert snapshot.endpoints is terra.endpoints
+
+    with pytest.raises(ValueError):
+        terra.at_height(0)
+
+
+class Response:
+    def __init__(self, status, body):
+        self.status = status
+        self.reason = "reason"
+        self.headers = {}
+        self.body = body
+
+    async def json(self, content_type=None):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class Session:
+    """Answers each URL with its scripted status, with a connection error for None, a
+    read timeout for "timeout", or with a status and body for a tuple."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.requested = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        host = url.split("/")[2]
+        self.requested.append(host)
+        status = self.statuses[host]
+        if status is None:
+            key = SimpleNamespace(host=host, port=80, ssl=False)
+            raise ClientConnectorError(key, OSError("connection refused"))
+        if status == "timeout":
+            raise asyncio.TimeoutError()
+        if isinstance(status, tuple):
+            return Response(*status)
+        return Response(status, {"message": str(status)})
+
+
+def first_two(population, k):
+    return population[:k]
+
+
+def send(method, statuses):
+    client = BaseAsyncLCDClient(
+        [f"http://{host}" for host in statuses],
+        loop=asyncio.new_event_loop(),
+        _create_session=False,
+    )
+    # fixes the order in which the endpoints are tried to the given one: by score,
+    # with the better of the first two healthy endpoints first
+    for i, endpoint in enumerate(client.endpoints.endpoints):
+        endpoint.latency = i + 1
+    client.session = Session(statuses)
+    coroutine = client._send(method, "/cosmos/test", {})
+    try:
+        with mock.patch("cosmos_sdk.client.lcd.endpoints.random.sample", first_two):
+            return client, client.loop.run_until_complete(coroutine)
+    except Exception as e:
+        return client, e
+    finally:
+        client.loop.close()
+
+
+def test_send_fails_over_for_get():
+    client, result = send("GET", {"a": None, "b": 503, "c": 200})
+    assert result == {"message": "200"}
+    assert client.session.requested == ["a", "b", "c"]
+    a, b, c = client.endpoints.endpoints
+    assert a.failures == b.failures == 1
+    assert c.failures == 0
+
+
+def test_send_does_not_fail_over_post_on_server_error():
+    client, result = send("POST", {"a": 503, "b": 200})
+    assert isinstance(result, LCDResponseError)
+    assert result.response.status == 503
+    assert client.session.requested == ["a"]
+
+    # the connection failed, the transaction was not broadcast
+    client, result = send("POST", {"a": None, "b": 200})
+    assert result == {"message": "200"}
+
+
+def test_send_does_not_fail_over_post_after_read_timeout():
+    # the node may have accepted the transaction before timing out
+    client, result = send("POST", {"a": "timeout", "b": 200})
+    assert isinstance(result, asyncio.TimeoutError)
+    assert client.session.requested == ["a"]
+    assert client.endpoints.endpoints[0].failures == 1
+
+    client, result = send("GET", {"a": "timeout", "b": 200})
+    assert result == {"message": "200"}
+
+
+def test_send_returns_empty_success_bodies():
+    client, result = send("GET", {"a": (200, None), "b": 200})
+    assert result is None
+    assert client.session.requested == ["a"]
+
+    client, result = send("GET", {"a": (404, None), "b": 200})
+    assert isinstance(result, LCDResponseError)
+    assert result.message == "reason"
+
+
+def test_send_moves_on_after_rate_limiting():
+    client, result = send("GET", {"a": 429, "b": 200})
+    assert result == {"message": "200"}
+    assert client.session.requested == ["a", "b"]
+    # rate limited endpoints are not counted as failing
+    assert client.endpoints.endpoints[0].failures == 0
+
+
+def test_send_raises_client_errors():
+    client, result = send("GET", {"a": 404, "b": 200})
+    assert isinstance(result, LCDResponseError)
+    assert result.response.status == 404
+    assert client.session.requested == ["a"]
+    assert client.endpoints.endpoints[0].failures == 0
+
+    client, result = send("GET", {"a": None, "b": 503})
+    assert isinstance(result, LCDResponseError)
+    assert result.response.status == 503
@@ -0,0 +1,41 @@
+import asyncio
+from functools import partial
+
+from cosmos_sdk.client.lcd.api._base import BaseAsyncAPI, sync_bind
+from cosmos_sdk.client.lcd.batch import run_batch
+
+
+class AsyncDoubleAPI(BaseAsyncAPI):
+    active = 0
+    peak = 0
+
+    async def double(self, x):
+        AsyncDoubleAPI.active += 1
+        AsyncDoubleAPI.peak = max(AsyncDoubleAPI.peak, AsyncDoubleAPI.active)
+        await asyncio.sleep(0.01)
+        AsyncDoubleAPI.active -= 1
+        if x == 3:
+            raise ValueError(x)
+        return x * 2
+
+
+class DoubleAPI(AsyncDoubleAPI):
+    @sync_bind(AsyncDoubleAPI.double)
+    async def double(self, x):
+        pass
+
+
+class _Client:
+    loop = asyncio.new_event_loop()
+
+
+def test_batch_bounds_concurrency_and_keeps_order():
+    api = DoubleAPI(_Client())
+    results = _Client.loop.run_until_complete(
+        run_batch([partial(api.double, i) for i in range(10)], max_concurrency=3)
+    )
+
+    assert AsyncDoubleAPI.peak == 3
+    assert [r.result for r in results] == [0, 2, 4, None, 8, 10, 12, 14, 16, 18]
+    assert [r.ok for r in results].count(False) == 1
+    assert isinstance(results[3].error, ValueError)
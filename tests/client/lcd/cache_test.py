@@ -0,0 +1,67 @@
+from cosmos_sdk.client.lcd.cache import CachePolicy, ResponseCache
+
+PARAMS = "/cosmos/mint/v1beta1/params"
+POOL = "/cosmos/staking/v1beta1/pool"
+
+
+def test_caches_only_endpoints_with_policy():
+    cache = ResponseCache()
+    cache.put("/cosmos/bank/v1beta1/balances/terra1", None, {"balances": []})
+    assert cache.get("/cosmos/bank/v1beta1/balances/terra1") is None
+    assert len(cache) == 0
+
+    cache.put(PARAMS, None, {"params": {}})
+    assert cache.get(PARAMS) == {"params": {}}
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_keys_on_params():
+    cache = ResponseCache()
+    cache.put(PARAMS, {"a": 1, "b": 2}, "x")
+    assert cache.get(PARAMS, {"b": 2, "a": 1}) == "x"
+    assert cache.get(PARAMS, {"a": 2}) is None
+    assert cache.misses == 1
+
+
+def test_ttl_expiry():
+    cache = ResponseCache({PARAMS: CachePolicy(ttl=0)})
+    cache.put(PARAMS, None, "x")
+    assert cache.get(PARAMS) is None
+    assert len(cache) == 0
+
+
+def test_valid_until_next_block():
+    cache = ResponseCache()
+    cache.observe_height("100")
+    cache.put(POOL, None, "x", "100")
+    assert cache.get(POOL) == "x"
+
+    cache.observe_height(99)
+    assert cache.get(POOL) == "x"
+
+    cache.observe_height(101)
+    assert cache.get(POOL) is None
+
+
+def test_lru_eviction():
+    cache = ResponseCache({"*": CachePolicy()}, max_size=2)
+    cache.put("/a", None, 1)
+    cache.put("/b", None, 2)
+    cache.get("/a")
+    cache.put("/c", None, 3)
+
+    assert cache.get("/b") is None
+    assert cache.get("/a") == 1
+    assert cache.get("/c") == 3
+    assert cache.evictions == 1
+
+
+def test_keys_on_pinned_height():
+    cache = ResponseCache()
+    cache.observe_height(100)
+    cache.put(POOL, None, "at 50", pinned_height=50)
+    cache.put(POOL, None, "latest", 100)
+    cache.observe_height(101)
+
+    assert cache.get(POOL) is None
+    assert cache.get(POOL, pinned_height=50) == "at 50"
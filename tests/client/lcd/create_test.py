@@ -0,0 +1,94 @@
+import asyncio
+import base64
+import hashlib
+
+from cosmos_sdk.client.lcd import AsyncLCDClient
+from cosmos_sdk.client.lcd.api.tx import CreateTxOptions, SignerOptions
+from cosmos_sdk.core import Coins
+from cosmos_sdk.core.bank import MsgSend
+from cosmos_sdk.key.terra.raw import RawKey
+
+KEYS = [RawKey(hashlib.sha256(str(i).encode()).digest()) for i in range(5)]
+
+
+def fake_client():
+    terra = AsyncLCDClient(
+        url="http://127.0.0.1:1317",
+        chain_id="localterra",
+        gas_prices="0.15uluna",
+        gas_adjustment=1.5,
+    )
+    calls = {"accounts": [], "in_flight": 0, "max_in_flight": 0, "simulations": 0}
+
+    async def get(endpoint, params=None):
+        address = endpoint.rsplit("/", 1)[-1]
+        calls["accounts"].append(address)
+        calls["in_flight"] += 1
+        calls["max_in_flight"] = max(calls["max_in_flight"], calls["in_flight"])
+        await asyncio.sleep(0.01)
+        calls["in_flight"] -= 1
+        key = next(key for key in KEYS if key.acc_address == address)
+        return {
+            "account": {
+                "@type": "/cosmos.auth.v1beta1.BaseAccount",
+                "address": address,
+                "pub_key": {
+                    "@type": "/cosmos.crypto.secp256k1.PubKey",
+                    "key": base64.b64encode(key.public_key.key).decode(),
+                },
+                "account_number": "1",
+                "sequence": str(KEYS.index(key) + 10),
+            }
+        }
+
+    async def post(endpoint, data=None):
+        calls["simulations"] += 1
+        await asyncio.sleep(0.01)
+        return {
+            "gas_info": {"gas_wanted": "0", "gas_used": "100000"},
+            "result": {"data": "", "log": "", "events": []},
+        }
+
+    terra._get = get
+    terra._post = post
+    return terra, calls
+
+
+def send(amount):
+    return CreateTxOptions(
+        msgs=[MsgSend(KEYS[0].acc_address, KEYS[1].acc_address, Coins(uluna=amount))]
+    )
+
+
+def test_create_looks_up_signers_concurrently():
+    terra, calls = fake_client()
+    signers = [SignerOptions(key.acc_address) for key in KEYS]
+    signers.append(SignerOptions(KEYS[0].acc_address))
+    signers.append(SignerOptions(KEYS[4].acc_address, 3, KEYS[4].public_key))
+
+    loop = asyncio.new_event_loop()
+    tx = loop.run_until_complete(terra.tx.create(signers, send(1)))
+    signer_data = loop.run_until_complete(terra.tx._signer_data(signers))
+    loop.run_until_complete(terra.session.close())
+
+    assert sorted(calls["accounts"]) == sorted([key.acc_address for key in KEYS] * 2)
+    assert calls["max_in_flight"] == len(KEYS)
+    assert [data.sequence for data in signer_data] == [10, 11, 12, 13, 14, 10, 3]
+    assert signer_data[1].public_key == KEYS[1].public_key
+    assert tx.auth_info.fee.gas_limit == 150000
+    assert tx.auth_info.fee.amount == Coins(uluna=22500)
+
+
+def test_estimate_fees():
+    terra, calls = fake_client()
+    signers = [SignerOptions(KEYS[0].acc_address)]
+
+    loop = asyncio.new_event_loop()
+    fees = loop.run_until_complete(
+        terra.tx.estimate_fees(signers, [send(i + 1) for i in range(6)])
+    )
+    loop.run_until_complete(terra.session.close())
+
+    assert calls["accounts"] == [KEYS[0].acc_address]
+    assert calls["simulations"] == 6
+    assert [fee.gas_limit for fee in fees] == [150000] * 6
@@ -0,0 +1,61 @@
+import time
+
+from cosmos_sdk.client.lcd.endpoints import EndpointPool
+
+
+def test_scores_latency_and_errors():
+    pool = EndpointPool(["a", "b"], smoothing=0.5, error_penalty=1)
+    a, b = pool.endpoints
+
+    pool.record_success(a, 0.25)
+    assert a.latency == 0.25
+    pool.record_success(a, 0.75)
+    assert a.latency == 0.5
+    pool.record_failure(b)
+    assert b.error_rate == 0.5
+    assert b.failures == 1
+    assert pool.score(b) == 0.5
+    pool.record_success(b, 0.125)
+    assert b.failures == 0
+    assert b.error_rate == 0.25
+    assert pool.score(b) == 0.375
+
+
+def test_ejects_after_consecutive_failures_until_cooldown():
+    pool = EndpointPool(["a", "b"], max_failures=2, cooldown=0.05)
+    a, b = pool.endpoints
+
+    pool.record_failure(a)
+    assert a.is_healthy(time.monotonic())
+    pool.record_failure(a)
+    assert not a.is_healthy(time.monotonic())
+    # ejected endpoints are still tried, last
+    assert pool.candidates() == [b, a]
+
+    time.sleep(0.06)
+    assert a.is_healthy(time.monotonic())
+    assert a in pool.candidates()
+    pool.record_success(a, 0.1)
+    assert a.failures == 0
+    assert a.ejected_until == 0.0
+
+
+def test_candidates_order():
+    pool = EndpointPool(["a", "b", "c", "d"], max_failures=1, cooldown=60)
+    a, b, c, d = pool.endpoints
+    pool.record_success(a, 0.1)
+    pool.record_success(b, 0.2)
+    pool.record_success(c, 0.3)
+    pool.record_failure(d)
+
+    firsts = set()
+    for _ in range(200):
+        candidates = pool.candidates()
+        firsts.add(candidates[0].url)
+        # the better of two random healthy endpoints first, then the others by score
+        assert candidates[0] is not c
+        assert candidates[1:3] == sorted(candidates[1:3], key=pool.score)
+        assert candidates[-1] is d
+    assert firsts == {"a", "b"}
+
+    assert EndpointPool(["a"]).candidates()[0].url == "a"
@@ -0,0 +1,58 @@
+import asyncio
+
+from cosmos_sdk.client.lcd.follower import BlockFollower
+
+
+class Chain:
+    def __init__(self, tip):
+        self.tip = tip
+        self.requested = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def fetch(self, height):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        if height is None:
+            # a new block is produced every time the tip is polled
+            self.tip += 1
+            height = self.tip
+        else:
+            self.requested.append(height)
+        await asyncio.sleep(0.01 if height % 2 else 0.02)
+        self.in_flight -= 1
+        return {"block": {"header": {"height": str(height)}, "data": {"txs": []}}}
+
+
+def test_catches_up_in_order_then_follows_tip():
+    loop = asyncio.new_event_loop()
+    chain = Chain(tip=20)
+    follower = BlockFollower(
+        chain.fetch, loop, start_height=5, stop_height=25, prefetch=4,
+        min_poll_interval=0,
+    )
+
+    heights = [height for height, block, txs in follower]
+
+    assert heights == list(range(5, 26))
+    assert follower.height == 25
+    assert chain.peak <= 4 + 1
+    # blocks produced while following are taken from the polled latest block
+    assert sorted(chain.requested) == list(range(5, 22))
+
+
+def test_starts_from_latest_block():
+    loop = asyncio.new_event_loop()
+    chain = Chain(tip=100)
+
+    async def take(n):
+        blocks = BlockFollower(chain.fetch, loop, min_poll_interval=0).__aiter__()
+        out = []
+        async for height, block, txs in blocks:
+            out.append((height, txs))
+            if len(out) == n:
+                break
+        await blocks.aclose()
+        return out
+
+    assert loop.run_until_complete(take(3)) == [(101, []), (102, []), (103, [])]
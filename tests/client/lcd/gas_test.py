@@ -0,0 +1,58 @@
+import asyncio
+
+from cosmos_sdk.client.lcd.gas import CachingGasEstimator, fingerprint
+from cosmos_sdk.core import Coins
+from cosmos_sdk.core.bank import MsgSend
+from cosmos_sdk.core.fee import Fee
+from cosmos_sdk.core.tx import AuthInfo, Tx, TxBody
+from cosmos_sdk.core.wasm import MsgExecuteContract
+
+ADDRESS = "terra1x46rqay4d3cssq8gxxvqz8xt6nwlz4td20k38v"
+CONTRACT = "terra1dzhzukyezv0etz22ud940z7adyv7xgcjkahuun"
+
+
+def send(coins, memo=""):
+    msg = MsgSend(ADDRESS, ADDRESS, Coins(coins))
+    return Tx(TxBody([msg], memo), AuthInfo([], Fee(0, Coins())), [])
+
+
+def test_fingerprint():
+    def execute(msg, coins=None):
+        return fingerprint([MsgExecuteContract(ADDRESS, CONTRACT, msg, coins)])
+
+    assert fingerprint(send("1uluna").body.messages) == fingerprint(
+        send("1000uluna").body.messages
+    )
+    assert fingerprint(send("1uluna").body.messages) != fingerprint(
+        send("1uluna,1uusd").body.messages
+    )
+    assert execute({"transfer": {"amount": "1"}}) == execute({"transfer": {"amount": "2"}})
+    assert execute({"transfer": {}}) != execute({"send": {}})
+    assert execute({"transfer": {}}) != execute({"transfer": {}}, "1uluna")
+
+
+def test_caches_gas_by_shape():
+    estimator = CachingGasEstimator(min_samples=2, sample_every=5)
+    simulated = []
+
+    async def simulate(tx):
+        gas_used = 70000 + 10 * len(bytes(tx.to_proto()))
+        simulated.append(gas_used)
+        return gas_used
+
+    async def estimate(tx):
+        return await estimator.estimate(tx, lambda: simulate(tx))
+
+    loop = asyncio.new_event_loop()
+    estimates = [
+        loop.run_until_complete(estimate(send("1uluna", "x" * (i % 7))))
+        for i in range(20)
+    ]
+
+    assert len(simulated) == 2 + 18 // 5
+    assert estimator.hits == 20 - len(simulated)
+    assert estimator.hit_rate == estimator.hits / 20
+    assert estimator.checks == 3
+    assert estimator.mean_error < 0.001
+    for i, gas in enumerate(estimates):
+        assert gas >= 70000 + 10 * len(bytes(send("1uluna", "x" * (i % 7)).to_proto()))
@@ -0,0 +1,49 @@
+import asyncio
+
+from cosmos_sdk.client.lcd.pagination import Paginator
+
+PAGES = {
+    None: ([1, 2], {"next_key": "a"}),
+    "a": ([3, 4], {"next_key": "b"}),
+    "b": ([5], {"next_key": None}),
+}
+
+
+def make_fetch(requested):
+    async def fetch(params):
+        requested.append((params.key, params.limit))
+        return PAGES[params.key]
+
+    return fetch
+
+
+def test_iterates_all_pages_async():
+    requested = []
+    paginator = Paginator(make_fetch(requested), asyncio.new_event_loop(), page_size=2)
+
+    async def collect():
+        return [x async for x in paginator]
+
+    assert asyncio.new_event_loop().run_until_complete(collect()) == [1, 2, 3, 4, 5]
+    assert requested == [(None, 2), ("a", 2), ("b", 2)]
+    assert paginator.exhausted
+    assert paginator.cursor is None
+
+
+def test_iterates_all_pages_sync():
+    paginator = Paginator(make_fetch([]), asyncio.new_event_loop())
+    assert list(paginator) == [1, 2, 3, 4, 5]
+
+
+def test_resumes_from_cursor():
+    loop = asyncio.new_event_loop()
+    paginator = Paginator(make_fetch([]), loop)
+    seen = []
+    for x in paginator:
+        seen.append(x)
+        if x == 3:
+            break
+    assert paginator.cursor == "a"
+
+    resumed = Paginator(make_fetch([]), loop, key=paginator.cursor)
+    assert list(resumed) == [3, 4, 5]
@@ -0,0 +1,132 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from cosmos_sdk.client.lcd.payout import PayoutBuilder, aggregate_payouts
+from cosmos_sdk.client.lcd.sequence import SequenceManager
+from cosmos_sdk.core import Coins
+from cosmos_sdk.core.bank import MsgMultiSend, MsgSend
+from cosmos_sdk.core.tx import SignMode
+from cosmos_sdk.key.terra.key import SignOptions
+from cosmos_sdk.key.terra.raw import RawKey
+
+KEY = RawKey(hashlib.sha256(b"payout").digest())
+RECIPIENTS = [
+    RawKey(hashlib.sha256(str(i).encode()).digest()).acc_address for i in range(60)
+]
+
+
+def payouts():
+    return [(address, Coins(uluna=1000 + i)) for i, address in enumerate(RECIPIENTS)]
+
+
+def sign(tx, sequence=4294967296):
+    return KEY.sign_tx(
+        tx,
+        SignOptions(
+            account_number=1,
+            sequence=sequence,
+            sign_mode=SignMode.SIGN_MODE_DIRECT,
+            chain_id="columbus-5",
+        ),
+    )
+
+
+def test_aggregate_payouts():
+    a, b = RECIPIENTS[:2]
+    aggregated = aggregate_payouts(
+        [(a, "10uluna"), (b, "5uusd"), (a, "3uluna,2uusd"), (b, "-5uusd")]
+    )
+    assert list(aggregated) == [a]
+    assert aggregated[a] == Coins("13uluna,2uusd")
+
+
+@pytest.mark.parametrize("multi_send", [True, False])
+def test_packs_under_limits(multi_send):
+    builder = PayoutBuilder(
+        KEY.acc_address,
+        max_tx_bytes=3000,
+        max_gas=1_000_000,
+        multi_send=multi_send,
+        memo="payout",
+        public_key=KEY.public_key,
+        gas_prices="0.15uluna",
+    )
+    txs = builder.build(payouts() + payouts()[:5])
+    assert len(txs) > 1
+
+    paid = {}
+    for tx in txs:
+        size = len(sign(tx).to_bytes())
+        assert size <= builder.max_tx_bytes
+        assert tx.auth_info.fee.gas_limit <= builder.max_gas
+        assert tx.body.memo == "payout"
+        for msg in tx.body.messages:
+            if isinstance(msg, MsgMultiSend):
+                assert msg.inputs[0].coins == sum(
+                    (o.coins for o in msg.outputs), Coins()
+                )
+                outputs = [(o.address, o.coins) for o in msg.outputs]
+            else:
+                assert isinstance(msg, MsgSend)
+                outputs = [(msg.to_address, msg.amount)]
+            for address, coins in outputs:
+                assert address not in paid
+                paid[address] = coins
+    assert paid == dict(aggregate_payouts(payouts() + payouts()[:5]))
+
+
+def test_size_estimate_is_exact():
+    builder = PayoutBuilder(
+        KEY.acc_address, public_key=KEY.public_key, gas_prices="0.15uluna"
+    )
+    (msgs, gas), = builder.plan(payouts()[:7])
+    tx = builder.build(payouts()[:7])[0]
+    size = (gas - builder.base_gas - 7 * builder.gas_per_transfer) // 10
+    # the estimate assumes the largest fee and sequence
+    assert 0 <= size - len(sign(tx).to_bytes()) <= 8
+
+
+def test_single_payout_too_large():
+    builder = PayoutBuilder(KEY.acc_address, max_tx_bytes=100)
+    with pytest.raises(ValueError):
+        builder.plan(payouts()[:1])
+
+
+class Pipeline:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def submit(self, tx):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(tx)
+        return future
+
+
+class Wallet:
+    def __init__(self):
+        self.key = KEY
+        self.sequences = SequenceManager(self.fetch)
+        self.lcd = self
+        self.tx = self
+        self.chain_id = "columbus-5"
+        self.gas_prices = "0.15uluna"
+
+    async def fetch(self):
+        return 1, 10
+
+    def pipeline(self, max_in_flight, timeout):
+        return Pipeline()
+
+
+def test_send_signs_in_sequence_order():
+    wallet = Wallet()
+    builder = PayoutBuilder(KEY.acc_address, max_tx_bytes=1000)
+    results = asyncio.run(builder.send(wallet, payouts(), sign_batch=2))
+    assert len(results) == len(builder.build(payouts())) > 2
+    sequences = [tx.auth_info.signer_infos[0].sequence for tx in results]
+    assert sequences == list(range(10, 10 + len(results)))
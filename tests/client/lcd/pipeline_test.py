@@ -0,0 +1,173 @@
+import asyncio
+import base64
+import hashlib
+
+import pytest
+
+from cosmos_sdk.client.lcd.pipeline import BroadcastPipeline
+from cosmos_sdk.core import Coins
+from cosmos_sdk.core.bank import MsgSend
+from cosmos_sdk.core.broadcast import SyncTxBroadcastResult
+from cosmos_sdk.core.fee import Fee
+from cosmos_sdk.core.tx import AuthInfo, Tx, TxBody
+from cosmos_sdk.exceptions import TxRejectedError
+
+
+def make_tx(i):
+    return Tx(
+        body=TxBody(
+            messages=[
+                MsgSend(
+                    "terra1jnzv225hwl3uxc5wtnlgr8mwy6nlt0vztv3qqm",
+                    "terra1wg2mlrxdmnnkkykgqg4znky86nyrtc45q336yv",
+                    Coins(uluna=i + 1),
+                )
+            ],
+            memo=str(i),
+        ),
+        auth_info=AuthInfo(signer_infos=[], fee=Fee(200000, Coins(uluna=3000))),
+        signatures=[b"signature"],
+    )
+
+
+class Chain:
+    """Includes the mempool in a new block every time the latest block is polled."""
+
+    def __init__(self, reject=(), drop=()):
+        self.blocks = {10: []}
+        self.mempool = []
+        self.in_flight = 0
+        self.peak = 0
+        self.reject = set(reject)
+        self.drop = set(drop)
+        self.lookups = []
+
+    @property
+    def tip(self):
+        return max(self.blocks)
+
+    async def broadcast(self, tx_bytes):
+        memo = Tx.from_bytes(base64.b64decode(tx_bytes)).body.memo
+        txhash = hashlib.sha256(base64.b64decode(tx_bytes)).hexdigest().upper()
+        await asyncio.sleep(0)
+        if memo in self.reject:
+            return SyncTxBroadcastResult(txhash, "out of gas", code=11, codespace="sdk")
+        if memo not in self.drop:
+            self.mempool.append(tx_bytes)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        return SyncTxBroadcastResult(txhash, "[]", code=0)
+
+    async def fetch_block(self, height):
+        if height is None:
+            self.blocks[self.tip + 1], self.mempool = self.mempool[:2], self.mempool[2:]
+            height = self.tip
+        return {
+            "block": {
+                "header": {"height": str(height)},
+                "data": {"txs": self.blocks[height]},
+            }
+        }
+
+    async def tx_info(self, tx_hash):
+        self.lookups.append(tx_hash)
+        for height, txs in self.blocks.items():
+            for tx in txs:
+                if hashlib.sha256(base64.b64decode(tx)).hexdigest().upper() == tx_hash:
+                    self.in_flight -= 1
+                    return (height, tx_hash)
+        raise ValueError("tx not found")
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_resolves_in_order_with_bounded_in_flight():
+    chain = Chain()
+
+    async def main():
+        async with BroadcastPipeline(
+            chain.broadcast, chain.fetch_block, chain.tx_info,
+            max_in_flight=3, poll_interval=0,
+        ) as pipeline:
+            futures = [pipeline.submit(make_tx(i)) for i in range(10)]
+            return pipeline, await asyncio.gather(*futures)
+
+    pipeline, infos = run(main())
+
+    heights = [height for height, _ in infos]
+    assert heights == sorted(heights)
+    assert len({tx_hash for _, tx_hash in infos}) == 10
+    assert chain.peak <= 3
+    # only the transactions found in blocks are looked up
+    assert len(chain.lookups) == 10
+    assert pipeline.stats.submitted == pipeline.stats.broadcast == 10
+    assert pipeline.stats.included == 10
+    assert pipeline.stats.throughput > 0
+    assert pipeline.stats.max_inclusion_time >= pipeline.stats.mean_inclusion_time > 0
+    assert pipeline.in_flight == 0
+
+
+def test_rejected_and_timed_out():
+    chain = Chain(reject={"1"}, drop={"2"})
+
+    async def main():
+        async with BroadcastPipeline(
+            chain.broadcast, chain.fetch_block, chain.tx_info,
+            poll_interval=0.01, timeout=0.1,
+        ) as pipeline:
+            futures = [pipeline.submit(make_tx(i)) for i in range(3)]
+            results = await asyncio.gather(*futures, return_exceptions=True)
+        return pipeline, results
+
+    pipeline, (included, rejected, dropped) = run(main())
+
+    assert included[0] > 10
+    assert isinstance(rejected, TxRejectedError)
+    assert rejected.result.code == 11
+    assert isinstance(dropped, asyncio.TimeoutError)
+    assert pipeline.stats.rejected == 1
+    assert pipeline.stats.failed == 1
+    assert pipeline.stats.included == 1
+
+
+def test_closed_pipeline():
+    chain = Chain()
+    pipeline = BroadcastPipeline(chain.broadcast, chain.fetch_block, chain.tx_info)
+    run(pipeline.close())
+    with pytest.raises(RuntimeError):
+        pipeline.submit(make_tx(0))
+
+
+def test_unencodable_and_duplicate_txs_do_not_stall():
+    chain = Chain()
+
+    async def main():
+        async with BroadcastPipeline(
+            chain.broadcast, chain.fetch_block, chain.tx_info,
+            max_in_flight=2, poll_interval=0,
+        ) as pipeline:
+            duplicate = make_tx(0)
+            futures = [
+                pipeline.submit(Tx(None, None, [])),
+                pipeline.submit(duplicate),
+                pipeline.submit(duplicate),
+                pipeline.submit(make_tx(1)),
+            ]
+            futures += [pipeline.submit(make_tx(i)) for i in range(2, 6)]
+            results = await asyncio.wait_for(
+                asyncio.gather(*futures, return_exceptions=True), timeout=5
+            )
+        return pipeline, results
+
+    pipeline, (unencodable, first, duplicate, last, *later) = run(main())
+
+    assert isinstance(unencodable, AttributeError)
+    assert first[0] > 10
+    assert isinstance(duplicate, ValueError)
+    assert last[0] > 10
+    assert all(height > 10 for height, _ in later)
+    assert pipeline.stats.failed == 2
+    assert pipeline.stats.included == 6
+    assert pipeline.in_flight == 0
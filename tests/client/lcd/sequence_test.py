@@ -0,0 +1,74 @@
+import asyncio
+
+from cosmos_sdk.client.lcd.sequence import SequenceManager
+from cosmos_sdk.core.broadcast import BlockTxBroadcastResult, SyncTxBroadcastResult
+
+
+def test_hands_out_consecutive_sequences():
+    fetches = []
+
+    async def fetch():
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        return 7, 10
+
+    sequences = SequenceManager(fetch)
+
+    async def main():
+        acquired = await asyncio.gather(*[sequences.acquire() for _ in range(5)])
+        sequences.release(14)
+        return acquired, await sequences.acquire()
+
+    acquired, after_release = asyncio.new_event_loop().run_until_complete(main())
+
+    assert acquired == [(7, 10), (7, 11), (7, 12), (7, 13), (7, 14)]
+    assert after_release == (7, 14)
+    assert len(fetches) == 1
+
+
+def test_resyncs_on_sequence_mismatch():
+    sequences = SequenceManager(None)
+    sequences.account_number, sequences._next = 7, 12
+
+    mismatch = SyncTxBroadcastResult(
+        txhash="",
+        raw_log="account sequence mismatch, expected 10, got 12: incorrect account sequence",
+        code=32,
+        codespace="sdk",
+    )
+    assert sequences.observe(mismatch)
+    assert sequences._next == 10
+    assert sequences.resyncs == 1
+
+    ok = SyncTxBroadcastResult(txhash="", raw_log="[]", code=0, codespace="")
+    assert not sequences.observe(ok)
+    assert sequences._next == 10
+
+    out_of_gas = SyncTxBroadcastResult(txhash="", raw_log="out of gas", code=11, codespace="sdk")
+    assert not sequences.observe(out_of_gas)
+    assert sequences._next is None
+
+
+def test_keeps_sequence_after_execution_failure():
+    sequences = SequenceManager(None)
+    sequences.account_number, sequences._next = 7, 12
+
+    def block_result(height, code):
+        return BlockTxBroadcastResult(
+            height=height,
+            txhash="",
+            raw_log="out of gas",
+            gas_wanted=100,
+            gas_used=120,
+            logs=None,
+            code=code,
+            codespace="sdk",
+        )
+
+    # failed in a block: the sequence was used
+    assert not sequences.observe(block_result(100, 11))
+    assert sequences._next == 12
+
+    # rejected by CheckTx in block mode: not included, no height
+    assert not sequences.observe(block_result(0, 11))
+    assert sequences._next is None
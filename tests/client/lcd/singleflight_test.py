@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+from cosmos_sdk.client.lcd.singleflight import SingleFlight
+
+
+def test_coalesces_identical_requests():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        if key == "bad":
+            raise ValueError(key)
+        return {"key": key}
+
+    async def main():
+        results = await asyncio.gather(
+            *[flight.do("a", lambda: fetch("a")) for _ in range(5)],
+            flight.do("b", lambda: fetch("b")),
+        )
+        with pytest.raises(ValueError):
+            await asyncio.gather(*[flight.do("bad", lambda: fetch("bad")) for _ in range(2)])
+        await flight.do("a", lambda: fetch("a"))
+        return results
+
+    results = asyncio.new_event_loop().run_until_complete(main())
+
+    assert results[:5] == [{"key": "a"}] * 5
+    assert calls == ["a", "b", "bad", "a"]
+    assert (flight.requests, flight.coalesced) == (4, 5)
+    assert len(flight) == 0
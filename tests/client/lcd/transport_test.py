@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from aiohttp import ClientConnectionError
+
+from cosmos_sdk.client.lcd.transport import RateLimiter, RetryBudget, TransportPolicy
+from cosmos_sdk.exceptions import LCDResponseError
+
+
+class Response:
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+
+
+def error(status, headers=None):
+    return LCDResponseError("", Response(status, headers))
+
+
+def test_retries_idempotent_requests_only():
+    policy = TransportPolicy(backoff_base=1, backoff_max=1)
+
+    assert 0 <= policy.retry_delay("GET", error(503), 0) <= 1
+    assert policy.retry_delay("GET", ClientConnectionError(), 0) is not None
+    assert policy.retry_delay("GET", error(400), 0) is None
+    assert policy.retry_delay("POST", error(503), 0) is None
+    assert policy.retry_delay("POST", ClientConnectionError(), 0) is None
+    assert policy.retry_delay("POST", error(429), 0) is not None
+    assert policy.retry_delay("GET", error(503), policy.max_retries) is None
+
+
+def test_honors_retry_after():
+    policy = TransportPolicy(backoff_base=0.01, max_retry_after=5)
+
+    assert policy.retry_delay("GET", error(429, {"Retry-After": "3"}), 0) == 3
+    assert policy.retry_delay("GET", error(503, {"Retry-After": "30"}), 0) is None
+
+
+def test_retry_budget():
+    budget = RetryBudget(ratio=0.5, reserve=1)
+
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    assert budget.exhausted == 1
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=100, burst=5)
+
+    async def acquire_all():
+        await asyncio.gather(*[limiter.acquire() for _ in range(25)])
+
+    start = time.monotonic()
+    asyncio.new_event_loop().run_until_complete(acquire_all())
+
+    assert time.monotonic() - start >= 0.19
+    assert limiter.waits == 20
@@ -40,3 +40,33 @@ def test_from_str():
     assert Coins.from_str(int_coins_string) == int_coins
     assert Coins.from_str(dec_coins_string) == dec_coins
     assert Coins.from_str(neg_dec_coins_string) == neg_dec_coins
+
+
+def test_arithmetic_merges_sorted():
+    a = Coins.from_str("5ukrw,12uluna,3uusd")
+    b = Coins.from_str("1uaud,8uluna,2uusd,7uzar")
+
+    assert (a + b).denoms() == ["uaud", "ukrw", "uluna", "uusd", "uzar"]
+    assert a + b == Coins.from_str("1uaud,5ukrw,20uluna,5uusd,7uzar")
+    assert a - b == Coins.from_str("-1uaud,5ukrw,4uluna,1uusd,-7uzar")
+    assert a + Coin("uluna", "0.5") == Coins.from_str("5ukrw,12.5uluna,3uusd")
+    assert all(c.is_dec_coin() for c in a + Coin("uluna", "0.5"))
+    mixed = Coins.from_str("1.5uaud") + a
+    assert all(c.is_dec_coin() for c in mixed)
+    assert mixed == Coins.from_str("1.5uaud,5ukrw,12uluna,3uusd")
+    assert a * 2 == Coins(ukrw=10, uluna=24, uusd=6)
+    assert Coins(uusd=3, ukrw=5).denoms() == ["ukrw", "uusd"]
+
+
+def test_immutable_and_hashable():
+    a = Coins.from_str("5ukrw,12uluna")
+    copied = Coins(a)
+    a + Coins.from_str("1ukrw")
+    a * 3
+
+    assert copied == a == Coins.from_str("5ukrw,12uluna")
+    assert copied["ukrw"] is a["ukrw"]
+    assert hash(copied) == hash(a)
+    assert hash(a) == hash(a.to_dec_coins())
+    assert {a: 1}[Coins(uluna=12, ukrw=5)] == 1
+    assert len({a, copied, a.to_dec_coins(), Coins.from_str("5ukrw")}) == 2
@@ -0,0 +1,153 @@
+import random
+
+import pytest
+
+from cosmos_sdk.core import Coin, Coins, Dec, DecArray
+
+
+def random_decs(rng, count, whole_digits):
+    decs = []
+    for _ in range(count):
+        whole = rng.randrange(10 ** whole_digits)
+        frac = rng.choice(
+            [0, 5 * 10 ** 17, rng.randrange(10 ** 18), rng.randrange(10 ** 9)]
+        )
+        sign = rng.choice(["", "-"])
+        decs.append(Dec(f"{sign}{whole}.{frac:018d}"))
+    return decs
+
+
+@pytest.fixture(params=[4, 9, 30], ids=["small", "medium", "large"])
+def columns(request):
+    digits = request.param
+    if digits < 30:
+        pytest.importorskip("numpy")
+    rng = random.Random(digits)
+    x = random_decs(rng, 300, digits)
+    y = random_decs(rng, 300, digits)
+    # exact halves exercise the banker's rounding of products
+    x += [Dec("0.000000001"), Dec("-0.000000001"), Dec("0.5"), Dec("1.5")]
+    atto = Dec("0.000000000000000001")
+    y += [Dec("0.5"), Dec("0.5"), atto, -atto]
+    return x, y, digits < 30
+
+
+def test_round_trips():
+    examples = ["0.5", "-23.128250000000000023", "138875042105.980753034749566779"]
+    array = DecArray(examples)
+    assert array.to_strings() == [str(Dec(example)) for example in examples]
+    assert array.to_decs() == [Dec(example) for example in examples]
+    assert DecArray.from_decs(array.to_decs()).to_strings() == array.to_strings()
+    assert DecArray.from_strings(array.to_strings()).to_decs() == array.to_decs()
+    assert list(array) == array.to_decs()
+    assert array[1] == Dec(examples[1])
+    assert array[1:].to_decs() == array.to_decs()[1:]
+    assert len(array) == 3
+
+
+def test_backends(columns):
+    x, _, vectorized = columns
+    assert DecArray(x).vectorized == vectorized
+    assert DecArray(x).to_strings() == [str(dec) for dec in x]
+    huge = DecArray([Dec(2 ** 70)])
+    assert not huge.vectorized
+    assert huge.to_decs() == [Dec(2 ** 70)]
+
+
+def test_arithmetic_matches_dec(columns):
+    x, y, _ = columns
+    a, b = DecArray(x), DecArray(y)
+    assert (a + b).to_decs() == [i + j for i, j in zip(x, y)]
+    assert (a - b).to_decs() == [i - j for i, j in zip(x, y)]
+    assert (a * b).to_decs() == [i * j for i, j in zip(x, y)]
+    assert (a / b).to_decs() == [i / j for i, j in zip(x, y)]
+    assert (-a).to_decs() == [-i for i in x]
+    assert a.sum() == sum(x, Dec(0))
+    assert DecArray().sum() == Dec(0)
+
+
+def test_scalars_broadcast(columns):
+    x, _, _ = columns
+    a = DecArray(x)
+    rate = Dec("0.006250000000000000")
+    assert (a * rate).to_decs() == [i * rate for i in x]
+    assert (a * 3).to_decs() == [i * 3 for i in x]
+    assert (a + 1).to_decs() == [i + 1 for i in x]
+    assert (1 - a).to_decs() == [1 - i for i in x]
+    assert (a / "0.5").to_decs() == [i / Dec("0.5") for i in x]
+    assert (2 / a).to_decs() == [Dec(2) / i for i in x]
+
+
+def test_dec_on_the_left_broadcasts(columns):
+    x, _, _ = columns
+    a = DecArray(x)
+    assert isinstance(Dec("0.015") * a, DecArray)
+    assert (Dec("0.015") * a).to_decs() == [Dec("0.015") * i for i in x]
+    assert (Dec(2) + a).to_decs() == [Dec(2) + i for i in x]
+    assert (Dec(2) - a).to_decs() == [Dec(2) - i for i in x]
+    assert (Dec(2) / a).to_decs() == [Dec(2) / i for i in x]
+    with pytest.raises(TypeError):
+        Dec(2) * object()
+
+
+def test_comparisons_match_dec(columns):
+    x, y, _ = columns
+    a, b = DecArray(x), DecArray(y)
+    assert a.lt(b) == [i < j for i, j in zip(x, y)]
+    assert (a <= b) == [i <= j for i, j in zip(x, y)]
+    assert (a > b) == [i > j for i, j in zip(x, y)]
+    assert (a >= b) == [i >= j for i, j in zip(x, y)]
+    assert (a == a) == [True] * len(x)
+    assert (a != b) == [i != j for i, j in zip(x, y)]
+    assert (a > 0) == [i > 0 for i in x]
+
+
+def test_results_out_of_int64_fall_back():
+    pytest.importorskip("numpy")
+    a = DecArray([Dec(10 ** 17), Dec("-1.5")])
+    assert a.vectorized
+    assert (a * a).to_decs() == [Dec(10 ** 34), Dec("2.25")]
+    big = DecArray([Dec(2 ** 61)] * 8)
+    assert (big + big).to_decs() == [Dec(2 ** 62)] * 8
+    assert (big + big + big).to_decs() == [Dec(3 * 2 ** 61)] * 8
+    assert (big + big + big).sum() == Dec(24 * 2 ** 61)
+
+
+def test_coins():
+    accounts = [
+        Coins.from_str("1000uluna,25uusd"),
+        Coins.from_str("7uusd"),
+        Coins([Coin("uluna", Dec("0.5"))]),
+    ]
+    luna = DecArray.from_coins(accounts, "uluna")
+    assert luna.to_strings() == [
+        "1000.000000000000000000",
+        "0.000000000000000000",
+        "0.500000000000000000",
+    ]
+    assert luna.to_coins("uluna")[0] == Coins([Coin("uluna", Dec(1000))])
+    assert luna.to_coins("uluna")[2].to_int_coins() == Coins.from_str("0uluna")
+
+
+def test_empty_slices(columns):
+    x, _, _ = columns
+    empty = DecArray(x)[0:0]
+    assert len(empty) == 0
+    assert (empty + 1).to_decs() == []
+    assert (empty * 2).to_decs() == []
+    assert (empty * empty).to_decs() == []
+    assert (-empty).to_decs() == []
+    assert (empty < 1) == []
+    assert empty.sum() == Dec(0)
+    assert empty.to_strings() == []
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        DecArray(["1", "2"]) + DecArray(["1"])
+    with pytest.raises(ZeroDivisionError):
+        DecArray(["1", "2"]) / DecArray(["1", "0"])
+    with pytest.raises(ValueError):
+        DecArray(["1.2.3"])
+    with pytest.raises(TypeError):
+        hash(DecArray(["1"]))
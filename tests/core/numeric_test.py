@@ -137,3 +137,70 @@ def test_modulo():
     assert (Dec(3) % Dec(2)) == 1
     assert (Dec(2) % Dec(1)) == 0
     assert (Dec("32") % Dec("1")) == 0
+
+
+def reference_parse(arg):
+    # the regex parser Dec used for every string
+    import re
+
+    parts = re.match(r"^(\-)?(\d+)(\.(\d+))?\Z", arg)
+    if parts is None:
+        raise ValueError(arg)
+    result = int(parts.group(2)) * 10 ** 18
+    if parts.group(3):
+        result += int(parts.group(4)[0:18].ljust(18, "0"))
+    return -result if parts.group(1) else result
+
+
+def test_parses_like_the_regex_parser():
+    examples = [
+        "0",
+        "-0",
+        "-0.000000000000000000",
+        "1",
+        "007.5",
+        "0.000000000000000001",
+        "-3.0000000000000000009",
+        "138875042105.980753034749566779",
+        "1" * 40 + "." + "9" * 30,
+        "١٢.٣",  # arabic-indic digits also match \d
+    ]
+    for example in examples:
+        assert Dec(example)._i == reference_parse(example)
+
+    invalid = ["", "-", ".", "1.", ".5", "+1", " 1", "1\n", "1_000", "1e5", "²", "--1"]
+    for example in invalid:
+        with pytest.raises(ValueError):
+            reference_parse(example)
+        with pytest.raises(ValueError):
+            Dec(example)
+
+
+def test_rounding_is_bankers():
+    import random
+    from decimal import ROUND_HALF_EVEN, localcontext
+
+    from cosmos_sdk.core.numeric import chop_precision_and_round
+
+    rng = random.Random(0)
+    one = 10 ** 18
+    values = [0, one // 2, 3 * one // 2, 5 * one // 2, -one // 2, -3 * one // 2]
+    values += [rng.randrange(-(10 ** 40), 10 ** 40) for _ in range(2000)]
+    values += [rng.randrange(-1000, 1000) * one + one // 2 for _ in range(200)]
+    with localcontext() as ctx:
+        ctx.prec = 100
+        for value in values:
+            expected = (Decimal(value) / one).quantize(
+                Decimal(1), rounding=ROUND_HALF_EVEN
+            )
+            assert chop_precision_and_round(value) == int(expected)
+
+
+def test_int_operands():
+    d = Dec("2.5")
+    assert d * 3 == Dec("7.5") and 3 * d == Dec("7.5")
+    assert d + 1 == Dec("3.5") and 1 + d == Dec("3.5")
+    assert d - 1 == Dec("1.5") and 1 - d == Dec("-1.5")
+    assert d < 3 and d > 2 and not d < 2 and d <= Dec("2.5") and d >= 2
+    assert Dec("99999999999.999999999999999999") < 100000000000
+    assert type(d + d) is Dec and not hasattr(d, "__dict__")
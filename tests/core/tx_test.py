@@ -0,0 +1,211 @@
+import base64
+import hashlib
+import pickle
+
+from cosmos_sdk.core import Coins, SignDoc
+from cosmos_sdk.core.bank import MsgSend
+from cosmos_sdk.core.fee import Fee
+from cosmos_sdk.core.tx import AuthInfo, SignMode, Tx, TxBody, TxInfo
+from cosmos_sdk.key.terra.key import SignOptions
+from cosmos_sdk.key.terra.raw import RawKey
+from cosmos_sdk.util.hash import hash_amino, hash_txs
+
+KEY = RawKey(bytes(range(1, 33)))
+
+
+def make_tx(n=3):
+    return Tx(
+        body=TxBody(
+            messages=[
+                MsgSend(
+                    KEY.acc_address,
+                    "terra1wg2mlrxdmnnkkykgqg4znky86nyrtc45q336yv",
+                    Coins(uluna=i + 1),
+                )
+                for i in range(n)
+            ],
+            memo="memo",
+        ),
+        auth_info=AuthInfo(signer_infos=[], fee=Fee(200000, Coins(uluna=3000))),
+        signatures=[],
+    )
+
+
+def test_to_bytes_matches_proto():
+    tx = make_tx()
+    assert tx.to_bytes() == bytes(tx.to_proto())
+    signed = KEY.sign_tx(
+        tx,
+        SignOptions(
+            account_number=1,
+            sequence=2,
+            sign_mode=SignMode.SIGN_MODE_DIRECT,
+            chain_id="columbus-5",
+        ),
+    )
+    assert signed.to_bytes() == bytes(signed.to_proto())
+    assert Tx.from_bytes(signed.to_bytes()).signatures == signed.signatures
+
+    empty = Tx(TxBody([], ""), AuthInfo([], Fee(0, Coins())), [b""])
+    assert empty.to_bytes() == bytes(empty.to_proto())
+
+
+def test_body_bytes_are_reused_until_changed():
+    body = make_tx().body
+    first = body.to_bytes()
+    assert body.to_bytes() is first
+
+    body.messages[0].amount = Coins(uluna=1000)
+    changed = body.to_bytes()
+    assert changed != first
+    assert changed == bytes(body.to_proto())
+
+    body.messages.append(body.messages[0])
+    assert body.to_bytes() == bytes(body.to_proto())
+    body.memo = "other"
+    assert body.to_bytes() == bytes(body.to_proto())
+
+
+def test_create_signature_leaves_sign_doc_untouched():
+    tx = make_tx()
+    tx.append_empty_signatures([])
+    sign_doc = SignDoc(
+        chain_id="columbus-5",
+        account_number=1,
+        sequence=2,
+        auth_info=tx.auth_info,
+        tx_body=tx.body,
+    )
+    before = sign_doc.to_bytes()
+    signature = KEY.create_signature(sign_doc)
+    assert sign_doc.to_bytes() == before
+    assert sign_doc.auth_info.signer_infos == []
+    assert signature.sequence == 2
+
+
+def test_hash_is_cached_until_changed():
+    tx = KEY.sign_tx(
+        make_tx(),
+        SignOptions(
+            account_number=1,
+            sequence=2,
+            sign_mode=SignMode.SIGN_MODE_DIRECT,
+            chain_id="columbus-5",
+        ),
+    )
+    tx_bytes = tx.to_bytes()
+    expected = hashlib.sha256(tx_bytes).hexdigest().upper()
+    assert tx.hash() == expected
+    assert tx.to_bytes() is tx_bytes
+    assert tx.hash() is tx.hash()
+    assert hash_amino(base64.b64encode(tx_bytes).decode()).upper() == expected
+
+    tx.signatures = [bytes(64)]
+    assert tx.hash() == hashlib.sha256(bytes(tx.to_proto())).hexdigest().upper()
+    tx.body.memo = "other"
+    assert tx.hash() == hashlib.sha256(bytes(tx.to_proto())).hexdigest().upper()
+
+
+def test_hash_txs():
+    txs = [make_tx(n).to_bytes() for n in range(1, 4)]
+    encoded = [base64.b64encode(tx).decode() for tx in txs]
+    expected = [hashlib.sha256(tx).hexdigest().upper() for tx in txs]
+    assert hash_txs(txs) == expected
+    assert hash_txs(encoded) == expected
+    assert hash_txs([]) == []
+
+
+def make_tx_info(tx):
+    return {
+        "height": "100",
+        "txhash": tx.hash(),
+        "raw_log": "[]",
+        "logs": [
+            {
+                "msg_index": 0,
+                "log": "",
+                "events": [
+                    {
+                        "type": "message",
+                        "attributes": [{"key": "action", "value": "send"}],
+                    }
+                ],
+            }
+        ],
+        "gas_wanted": "200000",
+        "gas_used": "150000",
+        "tx": tx.to_data(),
+        "timestamp": "2022-01-01T00:00:00Z",
+    }
+
+
+def test_lazy_from_bytes_decodes_on_access():
+    tx_bytes = make_tx().to_bytes()
+    lazy = Tx.from_bytes(tx_bytes, lazy=True)
+    assert lazy.to_bytes() is tx_bytes
+    assert lazy.hash() == hashlib.sha256(tx_bytes).hexdigest().upper()
+    assert "body" not in lazy.__dict__
+
+    messages = lazy.body.messages
+    assert lazy.body.message_type_urls() == ["/cosmos.bank.v1beta1.MsgSend"] * 3
+    assert messages[2].amount == Coins(uluna=3)
+    assert messages[2] is messages[2]
+    assert lazy.body is lazy.body
+    assert lazy == Tx.from_bytes(tx_bytes)
+    assert lazy.to_bytes() == tx_bytes
+    assert pickle.loads(pickle.dumps(Tx.from_bytes(tx_bytes, lazy=True))) == lazy
+
+
+def test_lazy_tx_keeps_bytes_while_unchanged():
+    signed = KEY.sign_tx(
+        make_tx(),
+        SignOptions(
+            account_number=1,
+            sequence=2,
+            sign_mode=SignMode.SIGN_MODE_DIRECT,
+            chain_id="columbus-5",
+        ),
+    )
+    tx_bytes = signed.to_bytes()
+    lazy = Tx.from_bytes(tx_bytes, lazy=True)
+    assert lazy.auth_info.fee == Tx.from_bytes(tx_bytes).auth_info.fee
+    assert lazy.auth_info.signer_infos[0].sequence == 2
+    assert lazy.body.memo == "memo"
+    assert lazy.to_bytes() is tx_bytes
+
+    lazy.auth_info.fee.gas_limit = 300000
+    assert lazy.to_bytes() == bytes(lazy.to_proto())
+    assert lazy.to_bytes() != tx_bytes
+
+
+def test_lazy_tx_serializes_changes():
+    tx_bytes = make_tx().to_bytes()
+    lazy = Tx.from_bytes(tx_bytes, lazy=True)
+    lazy.signatures.append(bytes(64))
+    assert lazy.to_bytes() == bytes(lazy.to_proto())
+
+    lazy = Tx.from_bytes(tx_bytes, lazy=True)
+    lazy.body.messages[1].amount = Coins(uluna=1000)
+    del lazy.body.messages[0]
+    assert len(lazy.body.messages) == 2
+    assert lazy.to_bytes() == bytes(lazy.to_proto())
+    assert lazy.to_bytes() != tx_bytes
+
+
+def test_lazy_from_data_matches_eager():
+    tx = make_tx()
+    data = tx.to_data()
+    lazy = Tx.from_data(data, lazy=True)
+    assert lazy.body.message_type_urls() == tx.body.message_type_urls()
+    assert lazy == Tx.from_data(data)
+    assert lazy.to_data() == data
+
+    info = make_tx_info(tx)
+    lazy_info = TxInfo.from_data(info, lazy=True)
+    assert lazy_info.height == 100
+    assert lazy_info.gas_used == 150000
+    assert "tx" not in lazy_info.__dict__ and "logs" not in lazy_info.__dict__
+    assert lazy_info.tx.body.message_type_urls()[0] == MsgSend.type_url
+    assert lazy_info.logs[0].events_by_type["message"]["action"] == ["send"]
+    assert lazy_info == TxInfo.from_data(info)
+    assert lazy_info.to_data() == TxInfo.from_data(info).to_data()
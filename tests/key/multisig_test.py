@@ -0,0 +1,107 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from cosmos_sdk.core import Coins, MultiSignature, SignDoc
+from cosmos_sdk.core.bank import MsgSend
+from cosmos_sdk.core.fee import Fee
+from cosmos_sdk.core.public_key import LegacyAminoMultisigPublicKey
+from cosmos_sdk.core.tx import AuthInfo, Tx, TxBody
+from cosmos_sdk.key.multisig import MultisigCoordinator
+from cosmos_sdk.key.secp256k1 import EcdsaBackend, verify
+from cosmos_sdk.key.terra.raw import RawKey
+
+KEYS = [RawKey(hashlib.sha256(b"member%d" % i).digest()) for i in range(9)]
+MULTISIG = LegacyAminoMultisigPublicKey(5, [key.public_key for key in KEYS])
+OUTSIDER = RawKey(hashlib.sha256(b"outsider").digest())
+
+
+def make_sign_doc():
+    tx = Tx(
+        TxBody([MsgSend(KEYS[0].acc_address, KEYS[1].acc_address, Coins(uluna=1))]),
+        AuthInfo([], Fee(200000, Coins(uluna=3000))),
+        [],
+    )
+    return tx, SignDoc(
+        chain_id="columbus-5",
+        account_number=7,
+        sequence=3,
+        auth_info=tx.auth_info,
+        tx_body=tx.body,
+    )
+
+
+def run(coroutine):
+    return asyncio.new_event_loop().run_until_complete(coroutine)
+
+
+def test_verify():
+    signature = KEYS[0].sign(b"payload")
+    public_key = KEYS[0].public_key.key
+    assert verify(public_key, b"payload", signature)
+    assert EcdsaBackend.verify(public_key, b"payload", signature)
+    assert not verify(public_key, b"other", signature)
+    assert not verify(KEYS[1].public_key.key, b"payload", signature)
+    assert not verify(public_key, b"payload", signature[:32])
+
+
+def test_multi_signature_index():
+    multisig = MultiSignature(MULTISIG)
+    assert multisig.index_of(KEYS[6].public_key) == 6
+    with pytest.raises(ValueError):
+        multisig.index_of(OUTSIDER.public_key)
+
+
+def test_collects_threshold_of_valid_signatures():
+    tx, sign_doc = make_sign_doc()
+    coordinator = MultisigCoordinator(MULTISIG, sign_doc)
+    requested = []
+
+    def signer(key, delay, corrupt=False):
+        async def sign(sign_bytes):
+            requested.append(key)
+            await asyncio.sleep(delay)
+            signature = key.sign(sign_bytes)
+            return bytes(64) if corrupt else signature
+
+        return key.public_key, sign
+
+    async def failing(sign_bytes):
+        raise IOError("member unreachable")
+
+    signers = [signer(key, 0.01 * i, corrupt=i == 1) for i, key in enumerate(KEYS)]
+    signers[2] = (KEYS[2].public_key, failing)
+    assert run(coordinator.collect(signers))
+
+    assert sorted(coordinator.signatures) == [0, 3, 4, 5, 6]
+    assert sorted(coordinator.failures) == [1, 2]
+    assert isinstance(coordinator.failures[2], IOError)
+
+    multisig = coordinator.multi_signature()
+    assert multisig.bitarray.get_index(3) and not multisig.bitarray.get_index(1)
+    assert [d.single.signature for d in multisig.signatures] == [
+        KEYS[i].sign(sign_doc.to_amino_json()) for i in [0, 3, 4, 5, 6]
+    ]
+
+    tx.append_signatures([coordinator.signature()])
+    assert tx.auth_info.signer_infos[0].public_key == MULTISIG
+    assert tx.to_bytes() == bytes(tx.to_proto())
+
+
+def test_add_signature_v2s():
+    _, sign_doc = make_sign_doc()
+    coordinator = MultisigCoordinator(MULTISIG, sign_doc)
+    signatures = [key.create_signature_amino(sign_doc) for key in KEYS[:4]]
+    signatures[3].data.single.signature = signatures[2].data.single.signature
+    assert run(coordinator.add_signature_v2s(signatures)) == [True, True, True, False]
+    assert not coordinator.ready
+    with pytest.raises(ValueError):
+        coordinator.multi_signature()
+
+    assert run(coordinator.collect([(key.public_key, key.sign) for key in KEYS]))
+    assert len(coordinator.signatures) >= 5
+    assert len(coordinator.multi_signature().signatures) == 5
+
+    with pytest.raises(ValueError):
+        run(coordinator.add_signature_v2s([OUTSIDER.create_signature_amino(sign_doc)]))
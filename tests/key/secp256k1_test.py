@@ -0,0 +1,78 @@
+import hashlib
+import pickle
+
+import pytest
+from ecdsa import SECP256k1, SigningKey
+from ecdsa.util import sigencode_string_canonize
+
+from cosmos_sdk.key.secp256k1 import (
+    CoincurveBackend,
+    EcdsaBackend,
+    Secp256k1Backend,
+    default_backend,
+    set_default_backend,
+)
+from cosmos_sdk.key.terra.raw import RawKey
+
+PRIVATE_KEYS = [hashlib.sha256(bytes([i])).digest() for i in range(16)]
+PAYLOADS = [b"", b"cosmos", bytes(range(256)) * 4]
+
+
+def reference_sign(private_key: bytes, payload: bytes) -> bytes:
+    sk = SigningKey.from_string(private_key, curve=SECP256k1)
+    return sk.sign_deterministic(
+        payload, hashfunc=hashlib.sha256, sigencode=sigencode_string_canonize
+    )
+
+
+def test_ecdsa_backend_matches_reference():
+    for private_key in PRIVATE_KEYS:
+        backend = EcdsaBackend(private_key)
+        for payload in PAYLOADS:
+            assert backend.sign(payload) == reference_sign(private_key, payload)
+
+
+def test_coincurve_backend_is_byte_identical():
+    pytest.importorskip("coincurve")
+    for private_key in PRIVATE_KEYS:
+        fast, slow = CoincurveBackend(private_key), EcdsaBackend(private_key)
+        assert fast.public_key == slow.public_key
+        for payload in PAYLOADS:
+            assert fast.sign(payload) == slow.sign(payload)
+
+
+def test_incomplete_backend_cannot_be_created():
+    class SignOnlyBackend(Secp256k1Backend):
+        def sign(self, payload: bytes) -> bytes:
+            return bytes(64)
+
+    with pytest.raises(TypeError):
+        SignOnlyBackend(PRIVATE_KEYS[0])
+
+
+def test_raw_key_backend():
+    key = RawKey(PRIVATE_KEYS[0], backend=EcdsaBackend)
+    assert key.backend is EcdsaBackend
+    assert isinstance(key._signer, EcdsaBackend)
+    assert key.sign(b"payload") == reference_sign(PRIVATE_KEYS[0], b"payload")
+
+    set_default_backend(EcdsaBackend)
+    try:
+        assert default_backend() is EcdsaBackend
+        assert isinstance(RawKey(PRIVATE_KEYS[0])._signer, EcdsaBackend)
+    finally:
+        set_default_backend(None)
+
+
+def test_raw_key_private_key_change():
+    key = RawKey(PRIVATE_KEYS[0])
+    key.sign(b"payload")
+    key.private_key = PRIVATE_KEYS[1]
+    assert key.sign(b"payload") == reference_sign(PRIVATE_KEYS[1], b"payload")
+
+
+def test_raw_key_pickle():
+    key = RawKey(PRIVATE_KEYS[0])
+    copy = pickle.loads(pickle.dumps(key))
+    assert copy.acc_address == key.acc_address
+    assert copy.sign(b"payload") == key.sign(b"payload")
@@ -0,0 +1,74 @@
+import asyncio
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from cosmos_sdk.core import Coins
+from cosmos_sdk.core.bank import MsgSend
+from cosmos_sdk.core.fee import Fee
+from cosmos_sdk.core.tx import AuthInfo, SignMode, Tx, TxBody
+from cosmos_sdk.key.batch import sign_txs, sign_txs_async
+from cosmos_sdk.key.terra.key import SignOptions
+from cosmos_sdk.key.terra.raw import RawKey
+
+KEY = RawKey(hashlib.sha256(b"batch").digest())
+
+
+def unsigned_txs(n):
+    return [
+        Tx(
+            body=TxBody(
+                messages=[
+                    MsgSend(
+                        KEY.acc_address,
+                        "terra1wg2mlrxdmnnkkykgqg4znky86nyrtc45q336yv",
+                        Coins(uluna=1000 + i),
+                    )
+                ],
+                memo=f"payout {i}",
+            ),
+            auth_info=AuthInfo(signer_infos=[], fee=Fee(200000, Coins(uluna=3000))),
+            signatures=[],
+        )
+        for i in range(n)
+    ]
+
+
+def sign_options(n, sign_mode=SignMode.SIGN_MODE_DIRECT):
+    return [
+        SignOptions(
+            account_number=7, sequence=i, sign_mode=sign_mode, chain_id="columbus-5"
+        )
+        for i in range(n)
+    ]
+
+
+def test_sign_txs_matches_sign_tx():
+    txs, options_list = unsigned_txs(12), sign_options(12)
+    expected = [KEY.sign_tx(tx, options) for tx, options in zip(txs, options_list)]
+    with ProcessPoolExecutor(2) as pool:
+        signed = KEY.sign_txs(txs, options_list, pool)
+    assert [tx.to_proto() for tx in signed] == [tx.to_proto() for tx in expected]
+
+
+def test_sign_txs_amino():
+    txs = unsigned_txs(3)
+    options_list = sign_options(3, SignMode.SIGN_MODE_LEGACY_AMINO_JSON)
+    expected = [KEY.sign_tx(tx, options) for tx, options in zip(txs, options_list)]
+    with ThreadPoolExecutor(2) as pool:
+        signed = sign_txs(KEY, txs, options_list, pool, chunk_size=2)
+    assert [tx.to_proto() for tx in signed] == [tx.to_proto() for tx in expected]
+
+
+def test_sign_txs_async():
+    txs, options_list = unsigned_txs(5), sign_options(5)
+    expected = [KEY.sign_tx(tx, options) for tx, options in zip(txs, options_list)]
+    signed = asyncio.run(sign_txs_async(KEY, txs, options_list, max_workers=2))
+    assert [tx.to_proto() for tx in signed] == [tx.to_proto() for tx in expected]
+
+
+def test_sign_txs_lengths():
+    with pytest.raises(ValueError):
+        sign_txs(KEY, unsigned_txs(2), sign_options(1))
+    assert sign_txs(KEY, [], []) == []
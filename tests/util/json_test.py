@@ -0,0 +1,57 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from cosmos_sdk.core import Coins, Dec
+from cosmos_sdk.util import json as util_json
+from cosmos_sdk.util.json import canonical_json, dict_to_data, to_amino, to_data
+
+PAYLOADS = [
+    {"b": [1, 2, {"d": "x", "c": None}], "a": True, "e": False},
+    {"amount": "1000", "memo": "café ☃ \x7f \x1f \n \\ \"quoted\""},
+    {"floats": [0.5, 1e16, 3.2e-05, -0.0, 100.0], "nan": float("nan")},
+    {"big": 2 ** 70, "negative": -(2 ** 64), "keys": {3: "int", 1: "keys"}},
+    {"strings": ["1e5", "null", "0.5", "true"]},
+    ["top", "level", 1],
+    "string",
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_canonical_json_matches_json(payload, backend, monkeypatch):
+    if backend == "json":
+        monkeypatch.setattr(util_json, "orjson", None)
+    elif util_json.orjson is None:
+        pytest.skip("orjson is not installed")
+    expected = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    assert canonical_json(payload) == expected.encode("utf-8")
+
+
+def test_to_data_dispatches_by_type():
+    class Later:
+        def to_data(self):
+            return "later"
+
+    now = datetime(2022, 3, 1, 12, 30)
+    data = dict_to_data(
+        {
+            "n": 5,
+            "dec": Dec("1.5"),
+            "coins": Coins("5uluna"),
+            "when": now,
+            "nested": [{"n": 1}, Later(), None, "s"],
+        }
+    )
+    assert data == {
+        "n": "5",
+        "dec": "1.500000000000000000",
+        "coins": [{"denom": "uluna", "amount": "5"}],
+        "when": to_data(now),
+        "nested": [{"n": "1"}, "later", None, "s"],
+    }
+    assert to_amino({"coins": Coins("5uluna"), "n": 5}) == {
+        "coins": [{"denom": "uluna", "amount": "5"}],
+        "n": "5",
+    }